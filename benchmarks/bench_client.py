@@ -0,0 +1,332 @@
+"""Measure the throughput and latency of the client against a stand-in server.
+
+Seeds a stand-in store with ``--releases`` releases of ``--flavours``
+flavours each, serves it from a local stand-in server (on its own thread
+and event loop, so that the server does not compete with the client for
+its loop) and runs every scenario at every ``--concurrency`` level:
+
+- ``execute``: the blocking ``GetRelease``, from one thread per worker
+- ``aexecute``: the same query without blocking
+- ``list_releases`` and ``list_flavours``: the list queries, whose
+  responses grow with the number of releases
+- ``match_flavour``: ``MatchFlavour`` for a docker environment
+- ``pods``: the ``WatchPods`` subscription, with one subscriber per worker;
+  the latency is the time from sending an ``UpdatePod`` mutation until a
+  subscriber receives its event
+
+With ``--transport standin`` the operations are executed in-process by a
+``StandInLink`` instead, which leaves out the network and serialization.
+The results are printed and written as JSON to ``--output``, so that runs
+can be compared.
+
+Usage:
+    python benchmarks/bench_client.py --releases 10 100 1000 --concurrency 1 10 50
+"""
+
+import argparse
+import asyncio
+import contextvars
+import json
+import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from graphql import OperationType
+from rath.links.auth import ComposedAuthLink
+from rath.links.split import SplitLink
+
+from kabinet.api.schema import (
+    ContainerType,
+    EnvironmentInput,
+    GetReleaseQuery,
+    PodStatus,
+    alist_flavours,
+    alist_releases,
+    amatch_flavour,
+    aupdate_pod,
+    awatch_pods,
+)
+from kabinet.funcs import aexecute, execute
+from kabinet.links.aiohttp import KabinetAIOHttpLink
+from kabinet.links.graphql_ws import KabinetGraphQLWSLink
+from kabinet.rath import KabinetLinkComposition, KabinetRath
+from kabinet.testing import StandInLink, StandInStore
+from kabinet.testing.server import StandInServer
+
+ASYNC_SCENARIOS = ["aexecute", "list_releases", "list_flavours", "match_flavour"]
+SCENARIOS = ["execute", *ASYNC_SCENARIOS, "pods"]
+
+
+@dataclass
+class Context:
+    """The synthetic entities the scenarios operate on."""
+
+    store: StandInStore
+    release: str
+    pod: str
+    server: Optional[StandInServer] = None
+
+
+def seed(releases: int, flavours: int) -> Context:
+    """A store with the releases, and a deployment and pod to update."""
+    store = StandInStore()
+    for i in range(releases):
+        store.add_release(f"live.arkitekt.bench-{i}", flavours=flavours)
+    release = store.all("Release")[0]
+    deployment = store.createDeployment(
+        None,  # type: ignore
+        {"flavour": release["flavours"][0]["id"], "localId": "bench"},
+    )
+    pod = store.createPod(None, {"deployment": deployment["id"], "localId": "bench"})  # type: ignore
+    return Context(store=store, release=release["id"], pod=pod["id"])
+
+
+async def token_loader() -> str:
+    """A token for the stand-in, which does not check it."""
+    return "bench"
+
+
+def build_rath(context: Context) -> KabinetRath:
+    """A rath for the server of the context, or in-process if it has none."""
+    if context.server is not None:
+        query: Any = KabinetAIOHttpLink(endpoint_url=context.server.url)
+        subscription: Any = KabinetGraphQLWSLink(ws_endpoint_url=context.server.ws_url)
+    else:
+        query = subscription = StandInLink(store=context.store)
+    return KabinetRath(
+        link=KabinetLinkComposition(
+            auth=ComposedAuthLink(token_loader=token_loader, token_refresher=token_loader),
+            split=SplitLink(
+                left=query,
+                right=subscription,
+                split=lambda o: o.node.operation != OperationType.SUBSCRIPTION,
+            ),
+        )
+    )
+
+
+def scenario(name: str, rath: KabinetRath, context: Context) -> Callable[[], Awaitable[Any]]:
+    """A single call of an async scenario."""
+    if name == "aexecute":
+        return lambda: aexecute(GetReleaseQuery, {"id": context.release}, rath=rath)
+    if name == "list_releases":
+        return lambda: alist_releases(rath=rath)
+    if name == "list_flavours":
+        return lambda: alist_flavours(rath=rath)
+    if name == "match_flavour":
+        environment = EnvironmentInput(container_type=ContainerType.DOCKER)
+        return lambda: amatch_flavour(environment=environment, rath=rath)
+    raise ValueError(f"Unknown scenario {name}")
+
+
+def summarize(latencies: List[float], wall: float, calls: int) -> Dict[str, float]:
+    """The throughput and latency percentiles (nearest rank) of a run, in ms."""
+    ordered = sorted(latencies)
+
+    def percentile(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "calls": calls,
+        "throughput": calls / wall,
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": percentile(0.5),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+async def measure_async(
+    call: Callable[[], Awaitable[Any]], requests: int, concurrency: int
+) -> Dict[str, float]:
+    """Make ``requests`` calls from ``concurrency`` concurrent workers."""
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start, requests)
+
+
+def measure_sync(call: Callable[[], Any], requests: int, concurrency: int) -> Dict[str, float]:
+    """Make ``requests`` blocking calls from ``concurrency`` threads."""
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+
+    def worker() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        # The threads need the koil context of the rath to make blocking calls
+        futures = [
+            executor.submit(contextvars.copy_context().run, worker) for _ in range(concurrency)
+        ]
+        for future in futures:
+            future.result()
+    return summarize(latencies, time.perf_counter() - start, requests)
+
+
+async def measure_pods(
+    rath: KabinetRath, context: Context, requests: int, concurrency: int
+) -> Dict[str, float]:
+    """Update the pod ``requests`` times and time the events of ``concurrency`` subscribers."""
+    received: List[List[float]] = [[] for _ in range(concurrency)]
+    progress = asyncio.Condition()
+
+    async def subscriber(times: List[float]) -> None:
+        async for _ in awatch_pods(rath=rath):
+            times.append(time.perf_counter())
+            async with progress:
+                progress.notify_all()
+
+    tasks = [asyncio.create_task(subscriber(times)) for times in received]
+    while len(context.store.listeners) < concurrency:
+        await asyncio.sleep(0.01)
+
+    sent: List[float] = []
+    start = time.perf_counter()
+    try:
+        for i in range(requests):
+            sent.append(time.perf_counter())
+            status = PodStatus.RUNNING if i % 2 == 0 else PodStatus.PENDING
+            await aupdate_pod(status=status, pod=context.pod, rath=rath)
+            async with progress:
+                await asyncio.wait_for(
+                    progress.wait_for(lambda i=i: all(len(times) > i for times in received)), 10
+                )
+        wall = time.perf_counter() - start
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies = [times[i] - sent[i] for times in received for i in range(requests)]
+    return summarize(latencies, wall, requests * concurrency)
+
+
+def response_bytes(context: Context, sent: int, calls: int) -> Optional[float]:
+    """The mean size of the responses the server sent since ``sent``."""
+    if context.server is None:
+        return None
+    return (context.server.bytes_sent - sent) / calls
+
+
+async def run_async(
+    context: Context, scenarios: List[str], args: argparse.Namespace
+) -> List[Dict[str, Any]]:
+    """Run the async scenarios at every concurrency level."""
+    rows = []
+    async with build_rath(context) as rath:
+        for name in scenarios:
+            for concurrency in args.concurrency:
+                if name == "pods":
+                    result = await measure_pods(rath, context, args.requests, concurrency)
+                else:
+                    call = scenario(name, rath, context)
+                    for _ in range(args.warmup):
+                        await call()
+                    sent = context.server.bytes_sent if context.server else 0
+                    result = await measure_async(call, args.requests, concurrency)
+                    result["response_bytes"] = response_bytes(context, sent, args.requests)
+                rows.append({"scenario": name, "concurrency": concurrency, **result})
+    return rows
+
+
+def run_sync(context: Context, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Run the blocking ``execute`` scenario at every concurrency level."""
+    rows = []
+    with build_rath(context) as rath:
+
+        def call() -> Any:  # noqa: ANN401
+            return execute(GetReleaseQuery, {"id": context.release}, rath=rath)
+
+        for _ in range(args.warmup):
+            call()
+        for concurrency in args.concurrency:
+            sent = context.server.bytes_sent if context.server else 0
+            result = measure_sync(call, args.requests, concurrency)
+            result["response_bytes"] = response_bytes(context, sent, args.requests)
+            rows.append({"scenario": "execute", "concurrency": concurrency, **result})
+    return rows
+
+
+def run(releases: int, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Run the selected scenarios against a store of ``releases`` releases."""
+    context = seed(releases, args.flavours)
+    scenarios = [name for name in SCENARIOS if name in args.scenarios and name != "execute"]
+
+    def run_all() -> List[Dict[str, Any]]:
+        rows = run_sync(context, args) if "execute" in args.scenarios else []
+        return rows + asyncio.run(run_async(context, scenarios, args))
+
+    if args.transport == "http":
+        with StandInServer(store=context.store) as server:
+            context.server = server
+            rows = run_all()
+        context.server = None
+    else:
+        rows = run_all()
+    return [{"releases": releases, "flavours": args.flavours, **row} for row in rows]
+
+
+def main() -> None:
+    """Run the benchmark, print a table and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--releases", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--flavours", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--requests", type=int, default=200, help="per scenario and level")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--transport", choices=["http", "standin"], default="http")
+    parser.add_argument("--output", default="bench-client.json")
+    args = parser.parse_args()
+
+    started_at = datetime.now()
+    print(
+        f"{'scenario':<15}{'releases':>9}{'workers':>9}{'ops/s':>10}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'bytes':>10}"
+    )
+    results = []
+    for releases in args.releases:
+        for row in run(releases, args):
+            results.append(row)
+            size = row.get("response_bytes")
+            print(
+                f"{row['scenario']:<15}{row['releases']:>9}{row['concurrency']:>9}"
+                f"{row['throughput']:>10.1f}{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}"
+                f"{row['p99_ms']:>9.2f}{'' if size is None else f'{size:.0f}':>10}"
+            )
+
+    with open(args.output, "w") as f:
+        json.dump(
+            {
+                "benchmark": "client",
+                "started_at": started_at.isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "arguments": vars(args),
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Measure the bytes and latency saved by compressing requests and responses.
+
+Runs ``ListReleases`` (a large response) and ``CreateAppImage`` (a large
+request, with an inspection of ``--implementations`` definitions) against
+a local stand-in server, uncompressed and with every available codec. On
+loopback the network is practically free, so the latency column mostly
+shows the cost of compressing; the transfer column estimates the time on
+the wire at ``--bandwidth`` Mbit/s.
+
+Usage:
+    python benchmarks/bench_compression.py --releases 200 --implementations 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from kabinet.api.schema import (
+    ActionKind,
+    AppImageInput,
+    ArgPortInput,
+    CreateAppImageMutation,
+    DefinitionInput,
+    DockerImageInput,
+    ImplementationInput,
+    InspectionInput,
+    ListReleasesQuery,
+    ManifestInput,
+    PortKind,
+    RequirementInput,
+    ReturnPortInput,
+    SelectorInput,
+)
+from kabinet.compression import available_encodings
+from kabinet.funcs import aexecute
+from kabinet.links.aiohttp import KabinetAIOHttpLink
+from kabinet.rath import KabinetRath
+from kabinet.testing.server import StandInServer
+
+
+def build_app_image(implementations: int, version: int) -> AppImageInput:
+    """An app image whose inspection holds ``implementations`` definitions."""
+    return AppImageInput(
+        manifest=ManifestInput(identifier="live.arkitekt.bench", version=f"0.{version}.0"),
+        selectors=(SelectorInput(kind="cpu", frequency=2000),),
+        app_image_id=f"bench-{version}",
+        image=DockerImageInput(image_string="arkitekt/bench:latest", build_at=datetime.now()),
+        inspection=InspectionInput(
+            locks=(),
+            states=(),
+            requirements=(RequirementInput(key="rekuest", service="live.arkitekt.rekuest"),),
+            implementations=tuple(
+                ImplementationInput(
+                    interface=f"action_{i}",
+                    definition=DefinitionInput(
+                        key=f"action_{i}",
+                        name=f"Action {i}",
+                        version="1.0.0",
+                        kind=ActionKind.FUNCTION,
+                        description=f"Processes the input image with the {i}th filter",
+                        args=tuple(
+                            ArgPortInput(key=f"arg_{j}", kind=PortKind.INT, description="A port")
+                            for j in range(4)
+                        ),
+                        returns=(ReturnPortInput(key="result", kind=PortKind.STRING),),
+                    ),
+                )
+                for i in range(implementations)
+            ),
+        ),
+    )
+
+
+async def measure(
+    server: StandInServer,
+    compression: Optional[str],
+    operation: str,
+    args: argparse.Namespace,
+) -> Dict[str, Any]:
+    """Time one operation with one codec (None for uncompressed)."""
+    server.compression_threshold = None if compression is None else args.threshold
+    link = KabinetAIOHttpLink(
+        endpoint_url=server.url,
+        compression=compression,  # type: ignore
+        compression_threshold=args.threshold,
+        accept_compression=compression is not None,
+    )
+    latencies = []
+    sizes = []
+    async with KabinetRath(link=link) as rath:
+        for i in range(args.repeat):
+            received, sent = server.bytes_received, server.bytes_sent
+            start = time.perf_counter()
+            if operation == "ListReleases":
+                await aexecute(ListReleasesQuery, {}, rath=rath)
+            else:
+                app_image = build_app_image(args.implementations, i)
+                await aexecute(CreateAppImageMutation, {"input": app_image}, rath=rath)
+            latencies.append(time.perf_counter() - start)
+            if operation == "ListReleases":
+                sizes.append(server.bytes_sent - sent)
+            else:
+                sizes.append(server.bytes_received - received)
+
+    size = statistics.median(sizes)
+    return {
+        "operation": operation,
+        "codec": compression or "none",
+        "bytes": size,
+        "latency_ms": statistics.median(latencies) * 1000,
+        "transfer_ms": size * 8 / (args.bandwidth * 1e6) * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark against a fresh stand-in server."""
+    async with StandInServer() as server:
+        for i in range(args.releases):
+            server.store.add_release(f"live.arkitekt.bench-{i}", flavours=args.flavours)
+
+        codecs: List[Optional[str]] = [None] + [
+            codec for codec in available_encodings() if codec in ("gzip", "zstd")
+        ]
+        # The app images add releases, so all lists are measured first
+        rows = [
+            await measure(server, codec, operation, args)
+            for operation in ("ListReleases", "CreateAppImage")
+            for codec in codecs
+        ]
+
+    print(
+        f"{'operation':<16}{'codec':<7}{'bytes':>10}{'saved':>8}"
+        f"{'latency ms':>12}{'transfer ms':>13}"
+    )
+    baseline = {row["operation"]: row["bytes"] for row in rows if row["codec"] == "none"}
+    for row in rows:
+        saved = 1 - row["bytes"] / baseline[row["operation"]]
+        print(
+            f"{row['operation']:<16}{row['codec']:<7}{row['bytes']:>10.0f}{saved:>8.0%}"
+            f"{row['latency_ms']:>12.2f}{row['transfer_ms']:>13.2f}"
+        )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--releases", type=int, default=200)
+    parser.add_argument("--flavours", type=int, default=4)
+    parser.add_argument("--implementations", type=int, default=100)
+    parser.add_argument("--threshold", type=int, default=1024)
+    parser.add_argument("--bandwidth", type=float, default=50, help="in Mbit/s")
+    parser.add_argument("--repeat", type=int, default=10)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
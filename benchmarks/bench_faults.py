@@ -0,0 +1,177 @@
+"""Measure how the client copes with a degraded network, offline.
+
+Runs ``--requests`` calls of the ``--operations`` from ``--concurrency``
+concurrent workers through a rath with a retry link, against an
+in-process ``StandInLink`` behind a ``FaultInjectionLink``. The operations
+are delayed by a ``--distribution`` of ``--latency`` (with ``--spread``)
+seconds and fail transiently at each of the ``--error-rates``, a fraction
+``--partial-rate`` of their results being cut short.
+
+The table shows, per error rate and operation, the fraction of calls that
+succeeded despite the faults, the latency percentiles of the successful
+calls and the retries they took. The results are written as JSON to
+``--output``, so that runs can be compared in CI.
+
+Usage:
+    python benchmarks/bench_faults.py --error-rates 0 0.05 0.2 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from graphql import OperationType
+from rath.links.auth import ComposedAuthLink
+from rath.links.split import SplitLink
+
+from kabinet.api.schema import (
+    ContainerType,
+    EnvironmentInput,
+    aget_release,
+    alist_flavours,
+    alist_releases,
+    amatch_flavour,
+)
+from kabinet.links import Fault, FaultInjectionLink, KabinetRetryLink, Latency
+from kabinet.rath import KabinetLinkComposition, KabinetRath
+from kabinet.testing import StandInLink, StandInStore
+
+OPERATIONS = ["GetRelease", "ListReleases", "ListFlavours", "MatchFlavour"]
+
+
+async def token_loader() -> str:
+    """A token for the stand-in, which does not check it."""
+    return "bench"
+
+
+def build_rath(
+    store: StandInStore, faults: FaultInjectionLink, retry: KabinetRetryLink
+) -> KabinetRath:
+    """An offline rath that retries the faults injected in front of the stand-in."""
+    return KabinetRath(
+        link=KabinetLinkComposition(
+            retry=retry,
+            auth=ComposedAuthLink(token_loader=token_loader, token_refresher=token_loader),
+            faults=faults,
+            split=SplitLink(
+                left=StandInLink(store=store),
+                right=StandInLink(store=store),
+                split=lambda o: o.node.operation != OperationType.SUBSCRIPTION,
+            ),
+        )
+    )
+
+
+def call_of(operation: str, rath: KabinetRath, release: str) -> Callable[[], Awaitable[Any]]:
+    """A single call of the operation."""
+    if operation == "GetRelease":
+        return lambda: aget_release(release, rath=rath)
+    if operation == "ListReleases":
+        return lambda: alist_releases(rath=rath)
+    if operation == "ListFlavours":
+        return lambda: alist_flavours(rath=rath)
+    environment = EnvironmentInput(container_type=ContainerType.DOCKER)
+    return lambda: amatch_flavour(environment=environment, rath=rath)
+
+
+async def measure(
+    operation: str, error_rate: float, store: StandInStore, args: argparse.Namespace
+) -> Dict[str, Any]:
+    """Make the calls of an operation at an error rate and summarize them."""
+    fault = Fault(
+        latency=Latency(distribution=args.distribution, mean=args.latency, spread=args.spread),
+        error_rate=error_rate,
+        partial_rate=args.partial_rate,
+    )
+    faults = FaultInjectionLink(faults={operation: fault}, seed=args.seed)
+    retry = KabinetRetryLink(max_retries=args.max_retries, base_delay=args.base_delay)
+    latencies: List[float] = []
+    remaining = iter(range(args.requests))
+
+    async with build_rath(store, faults, retry) as rath:
+        call = call_of(operation, rath, store.all("Release")[0]["id"])
+
+        async def worker() -> None:
+            for _ in remaining:
+                start = time.perf_counter()
+                try:
+                    await call()
+                except Exception:
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        wall = time.perf_counter() - start
+
+    latencies.sort()
+
+    def percentile(q: float) -> float:
+        if not latencies:
+            return float("nan")
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+    return {
+        "operation": operation,
+        "error_rate": error_rate,
+        "calls": args.requests,
+        "success_rate": len(latencies) / args.requests,
+        "throughput": len(latencies) / wall,
+        "p50_ms": percentile(0.5),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "retries": retry.retries,
+        "injected": faults.injected,
+    }
+
+
+def main() -> None:
+    """Run the benchmark, print a table and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=OPERATIONS)
+    parser.add_argument("--error-rates", type=float, nargs="+", default=[0, 0.05, 0.2])
+    parser.add_argument("--latency", type=float, default=0.01, help="the mean, in seconds")
+    parser.add_argument("--spread", type=float, default=0.005, help="in seconds")
+    parser.add_argument(
+        "--distribution",
+        choices=["constant", "uniform", "normal", "lognormal", "exponential"],
+        default="lognormal",
+    )
+    parser.add_argument("--partial-rate", type=float, default=0)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--base-delay", type=float, default=0.01, help="of the retries, in seconds")
+    parser.add_argument("--releases", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=200, help="per operation and error rate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench-faults.json")
+    args = parser.parse_args()
+
+    store = StandInStore()
+    for i in range(args.releases):
+        store.add_release(f"live.arkitekt.bench-{i}", flavours=2)
+
+    print(
+        f"{'operation':<15}{'errors':>8}{'success':>9}{'ops/s':>9}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'retries':>9}"
+    )
+    results = []
+    for error_rate in args.error_rates:
+        for operation in args.operations:
+            row = asyncio.run(measure(operation, error_rate, store, args))
+            results.append(row)
+            print(
+                f"{operation:<15}{error_rate:>8.2f}{row['success_rate']:>9.1%}"
+                f"{row['throughput']:>9.1f}{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}"
+                f"{row['p99_ms']:>9.2f}{row['retries']:>9}"
+            )
+
+    with open(args.output, "w") as f:
+        json.dump({"benchmark": "faults", "arguments": vars(args), "results": results}, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
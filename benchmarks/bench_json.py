@@ -0,0 +1,73 @@
+"""Compare the JSON codecs of the transports on ``ListReleases`` payloads.
+
+Builds ``ListReleases`` responses with the stand-in store and times encoding
+(as a server would) and decoding (as the links do) with every available
+codec (see ``kabinet.serialization``).
+
+Usage:
+    python benchmarks/bench_json.py --releases 10 100 1000 --flavours 4
+"""
+
+import argparse
+import asyncio
+import timeit
+from typing import Any, Dict, List
+
+from kabinet.api.schema import ListReleasesQuery
+from kabinet.serialization import JSONCodec, OrjsonCodec, StdlibJSONCodec, orjson
+from kabinet.testing import StandInStore
+
+
+def build_response(releases: int, flavours: int) -> Dict[str, Any]:
+    """The ``ListReleases`` response of a synthetic store."""
+    store = StandInStore()
+    for i in range(releases):
+        store.add_release(f"live.arkitekt.bench-{i}", flavours=flavours)
+    result = asyncio.run(store.aexecute(ListReleasesQuery.Meta.document, {}))
+    assert not result.errors, result.errors
+    return {"data": result.data}
+
+
+def measure(codec: JSONCodec, response: Dict[str, Any], repeat: int) -> Dict[str, float]:
+    """The best time of encoding and decoding the response, in seconds."""
+    body = codec.dumps(response)
+    assert codec.loads(body) == response
+    dumps = min(timeit.repeat(lambda: codec.dumps(response), number=1, repeat=repeat))
+    loads = min(timeit.repeat(lambda: codec.loads(body), number=1, repeat=repeat))
+    return {"bytes": len(body), "dumps": dumps, "loads": loads}
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--releases", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--flavours", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    codecs: List[JSONCodec] = [StdlibJSONCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    else:
+        print("orjson is not installed, only measuring the standard library")
+
+    print(
+        f"{'releases':>10}{'codec':>8}{'bytes':>12}{'dumps ms':>11}{'loads ms':>11}"
+        f"{'loads MB/s':>12}{'speedup':>10}"
+    )
+    for releases in args.releases:
+        response = build_response(releases, args.flavours)
+        baseline = None
+        for codec in codecs:
+            times = measure(codec, response, args.repeat)
+            baseline = baseline or times
+            print(
+                f"{releases:>10}{codec.name:>8}{times['bytes']:>12}"
+                f"{times['dumps'] * 1000:>11.2f}{times['loads'] * 1000:>11.2f}"
+                f"{times['bytes'] / times['loads'] / 1e6:>12.1f}"
+                f"{baseline['loads'] / times['loads']:>9.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Measure the cost of parsing the generated fragments as responses grow.
+
+Builds synthetic payloads of ``--sizes`` items for the ``ListRelease``,
+``Release``, ``ListFlavour``, ``Pod`` and ``Resource`` fragments. The items
+are resolved by the stand-in store, so they have the shape the server
+sends: the flavours cycle through all selector union variants, the pods
+hold their deployment with its flavour and release, and the resources
+hold their backend and pods.
+
+Every payload is decoded from JSON and validated into a tuple of the
+fragment, as ``operation(**data)`` does. The table shows the best time per
+item and the memory the parsed items retain per item once the decoded JSON
+is gone, next to that of the decoded JSON itself.
+
+Usage:
+    python benchmarks/bench_models.py --sizes 10 1000 100000 --fragments Pod Release
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, TypeAdapter
+
+from kabinet.api.schema import ListFlavour, ListRelease, Pod, Release, Resource
+from kabinet.testing import StandInStore
+
+FRAGMENTS: Dict[str, Tuple[Type[BaseModel], str]] = {
+    "ListRelease": (ListRelease, "releases"),
+    "Release": (Release, "releases"),
+    "ListFlavour": (ListFlavour, "flavours"),
+    "Pod": (Pod, "pods"),
+    "Resource": (Resource, "resources"),
+}
+
+Parser = Callable[[List[Dict[str, Any]]], Any]
+
+
+def build_store(releases: int, flavours: int) -> StandInStore:
+    """A store with a pod on a resource for every flavour."""
+    store = StandInStore()
+    backend = store.declareBackend(None, {"name": "bench", "kind": "docker"})  # type: ignore
+    variant = 0
+    for i in range(releases):
+        release = store.add_release(f"live.arkitekt.bench-{i}", flavours=0)
+        for j in range(flavours):
+            flavour = store.add_flavour(release, f"flavour-{j}", variant=variant)
+            variant += 1
+            resource = store.declareResource(
+                None,  # type: ignore
+                {"backend": backend["id"], "localId": f"node-{variant}"},
+            )
+            deployment = store.createDeployment(
+                None,  # type: ignore
+                {"flavour": flavour["id"], "localId": f"deployment-{variant}"},
+            )
+            store.createPod(
+                None,  # type: ignore
+                {
+                    "deployment": deployment["id"],
+                    "localId": f"pod-{variant}",
+                    "resource": resource["id"],
+                },
+            )
+    return store
+
+
+def build_payload(store: StandInStore, fragment: str, size: int) -> bytes:
+    """The JSON of ``size`` items of the fragment, cycling through the store's entities."""
+    model, field = FRAGMENTS[fragment]
+    query = f"query Bench {{\n  {field} {{\n    ...{fragment}\n  }}\n}}"
+    document = f"{query}\n\n{model.Meta.document}"  # type: ignore
+    result = asyncio.run(store.aexecute(document))
+    assert not result.errors, result.errors
+    templates = result.data[field]  # type: ignore
+    items = [{**templates[i % len(templates)], "id": str(i)} for i in range(size)]
+    return json.dumps(items).encode("utf-8")
+
+
+def parsers(model: Type[BaseModel]) -> Dict[str, Parser]:
+    """The parsers of a list of the fragment."""
+    adapter = TypeAdapter(Tuple[model, ...])  # type: ignore
+    return {"validate": adapter.validate_python}
+
+
+def best_time(parse: Parser, payload: bytes, repeat: int) -> float:
+    """The best time of parsing the decoded payload, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        items = json.loads(payload)
+        start = time.perf_counter()
+        parse(items)
+        best = min(best, time.perf_counter() - start)
+        del items
+    return best
+
+
+def retained_memory(parse: Optional[Parser], payload: bytes) -> int:
+    """The bytes held by the parsed payload after the decoded JSON is released.
+
+    Without a parser, the bytes held by the decoded JSON itself.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        items = json.loads(payload)
+        parsed = items if parse is None else parse(items)
+        del items
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del parsed
+    return retained
+
+
+def measure(fragment: str, payload: bytes, size: int, repeat: int) -> Dict[str, Any]:
+    """Time and weigh the parsers of a payload."""
+    model, _ = FRAGMENTS[fragment]
+    row: Dict[str, Any] = {
+        "fragment": fragment,
+        "items": size,
+        "payload_bytes_per_item": len(payload) / size,
+        "json_bytes_per_item": retained_memory(None, payload) / size,
+    }
+    for name, parse in parsers(model).items():
+        row[f"{name}_us_per_item"] = best_time(parse, payload, repeat) / size * 1e6
+        row[f"{name}_bytes_per_item"] = retained_memory(parse, payload) / size
+    return row
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    parser.add_argument("--fragments", nargs="+", choices=list(FRAGMENTS), default=list(FRAGMENTS))
+    parser.add_argument("--releases", type=int, default=3)
+    parser.add_argument("--flavours", type=int, default=2, help="per release")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="also write the results as JSON to this file")
+    args = parser.parse_args()
+
+    store = build_store(args.releases, args.flavours)
+    print(
+        f"{'fragment':<13}{'items':>8}{'payload B':>11}{'json B':>9}"
+        f"{'validate us':>13}{'B':>8}"
+    )
+    results = []
+    for fragment in args.fragments:
+        for size in args.sizes:
+            payload = build_payload(store, fragment, size)
+            row = measure(fragment, payload, size, args.repeat)
+            results.append(row)
+            print(
+                f"{fragment:<13}{size:>8}{row['payload_bytes_per_item']:>11.0f}"
+                f"{row['json_bytes_per_item']:>9.0f}"
+                f"{row['validate_us_per_item']:>13.2f}{row['validate_bytes_per_item']:>8.0f}"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"benchmark": "models", "arguments": vars(args), "results": results}, f)
+
+
+if __name__ == "__main__":
+    main()
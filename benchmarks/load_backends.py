@@ -0,0 +1,232 @@
+"""Simulate a fleet of backends registering and reporting on their pods.
+
+Every simulated backend does what an agent does on startup: it declares
+itself, declares a resource for each of its ``--nodes`` nodes, creates a
+deployment of a flavour and a pod on every node. It then reports on its
+pods every ``--interval`` seconds (with some jitter), updating their status
+and dumping their logs, until ``--duration`` seconds have passed. The
+backends are started evenly over ``--ramp`` seconds and share one client.
+
+The load goes to ``--url`` (with ``--token``), or to a local stand-in
+server if no URL is given. The achieved operations per second and the
+latency percentiles per operation are printed at the end, and written as
+JSON to ``--output`` if given.
+
+Usage:
+    python benchmarks/load_backends.py --backends 1000 --nodes 2 --duration 60 --ramp 10
+    python benchmarks/load_backends.py --url https://kabinet.example.org/graphql --token ...
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar
+
+from graphql import OperationType
+from rath.links.auth import ComposedAuthLink
+from rath.links.split import SplitLink
+
+from kabinet.api.schema import (
+    OffsetPaginationInput,
+    PodStatus,
+    acreate_deployment,
+    acreate_pod,
+    adeclare_backend,
+    adeclare_resource,
+    adump_logs,
+    alist_flavours,
+    aupdate_pod,
+)
+from kabinet.links.aiohttp import KabinetAIOHttpLink
+from kabinet.links.graphql_ws import KabinetGraphQLWSLink
+from kabinet.metrics import InMemoryMetricsSink
+from kabinet.rath import KabinetLinkComposition, KabinetRath
+from kabinet.testing.server import StandInServer
+
+T = TypeVar("T")
+
+STATUSES = [PodStatus.PENDING, PodStatus.RUNNING, PodStatus.STOPPING, PodStatus.STOPPED]
+
+
+def build_rath(url: str, token: str, sink: InMemoryMetricsSink) -> KabinetRath:
+    """A rath for the endpoint that records every operation in the sink."""
+
+    async def token_loader() -> str:
+        return token
+
+    return KabinetRath(
+        link=KabinetLinkComposition(
+            auth=ComposedAuthLink(token_loader=token_loader, token_refresher=token_loader),
+            split=SplitLink(
+                left=KabinetAIOHttpLink(endpoint_url=url),
+                right=KabinetGraphQLWSLink(ws_endpoint_url=url.replace("http", "ws", 1)),
+                split=lambda o: o.node.operation != OperationType.SUBSCRIPTION,
+            ),
+        ),
+        metrics=sink,
+    )
+
+
+async def attempt(call: Awaitable[T]) -> Optional[T]:
+    """Make a call, ignoring its error (which the metrics sink has recorded)."""
+    try:
+        return await call
+    except Exception:
+        return None
+
+
+async def simulate_backend(
+    index: int, flavour: str, rath: KabinetRath, args: argparse.Namespace, deadline: float
+) -> bool:
+    """Register a backend with its pods and report on them until the deadline.
+
+    Returns whether the backend managed to register.
+    """
+    rng = random.Random(args.seed + index)
+    name = f"{args.prefix}-{index}"
+    try:
+        backend = await adeclare_backend(name=name, kind="docker", rath=rath)
+        deployment = await acreate_deployment(
+            local_id=f"{name}-deployment", flavour=flavour, rath=rath
+        )
+        pods = []
+        for node in range(args.nodes):
+            resource = await adeclare_resource(
+                backend=backend.id, local_id=f"node-{node}", name=f"{name} node {node}", rath=rath
+            )
+            pods.append(
+                await acreate_pod(
+                    deployment=deployment.id,
+                    local_id=f"{name}-pod-{node}",
+                    resource=resource.id,
+                    client_id=name,
+                    rath=rath,
+                )
+            )
+    except Exception:
+        return False
+
+    logs = "\n".join(f"{name}: processed item {i}" for i in range(args.log_lines))
+    report = 0
+    while True:
+        delay = args.interval * rng.uniform(1 - args.jitter, 1 + args.jitter)
+        if time.perf_counter() + delay >= deadline:
+            return True
+        await asyncio.sleep(delay)
+        report += 1
+        for pod in pods:
+            status = STATUSES[report % len(STATUSES)]
+            await attempt(aupdate_pod(status=status, pod=pod.id, rath=rath))
+            await attempt(adump_logs(pod=pod.id, logs=logs, rath=rath))
+
+
+async def run(url: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the fleet against the endpoint and summarize the recorded operations."""
+    sink = InMemoryMetricsSink(keep=args.max_samples)
+    async with build_rath(url, args.token, sink) as rath:
+        flavour = args.flavour
+        if flavour is None:
+            flavours = await alist_flavours(
+                pagination=OffsetPaginationInput(offset=0, limit=1), rath=rath
+            )
+            if not flavours:
+                raise SystemExit("The endpoint has no flavour to deploy, pass one with --flavour")
+            flavour = flavours[0].id
+
+        start = time.perf_counter()
+        deadline = start + args.ramp + args.duration
+
+        async def ramped(index: int) -> bool:
+            await asyncio.sleep(index * args.ramp / args.backends)
+            return await simulate_backend(index, flavour, rath, args, deadline)
+
+        registered = await asyncio.gather(*(ramped(i) for i in range(args.backends)))
+        wall = time.perf_counter() - start
+
+    return summarize(sink, wall, sum(registered))
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """The nearest rank percentile of sorted latencies, in ms."""
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+def summarize(sink: InMemoryMetricsSink, wall: float, registered: int) -> Dict[str, Any]:
+    """The throughput and latency percentiles (nearest rank, in ms) per operation."""
+    latencies: Dict[str, List[float]] = {}
+    for sample in sink.samples:
+        latencies.setdefault(sample.operation, []).append(sample.latency)
+
+    operations = {}
+    for operation, values in latencies.items():
+        values.sort()
+        metrics = sink.operations[operation]
+        operations[operation] = {
+            "calls": metrics.calls,
+            "errors": metrics.error_count,
+            "ops_per_second": metrics.calls / wall,
+            "p50_ms": percentile(values, 0.5),
+            "p95_ms": percentile(values, 0.95),
+            "p99_ms": percentile(values, 0.99),
+            "max_ms": values[-1] * 1000,
+        }
+    calls = sum(metrics.calls for metrics in sink.operations.values())
+    return {
+        "wall_seconds": wall,
+        "registered_backends": registered,
+        "calls": calls,
+        "ops_per_second": calls / wall,
+        "operations": operations,
+    }
+
+
+def main() -> None:
+    """Run the load, print a table and optionally write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="the GraphQL endpoint (a local stand-in if omitted)")
+    parser.add_argument("--token", default="loadgen")
+    parser.add_argument("--flavour", help="the ID of the flavour to deploy (the first if omitted)")
+    parser.add_argument("--backends", type=int, default=100)
+    parser.add_argument("--nodes", type=int, default=2, help="per backend")
+    parser.add_argument("--interval", type=float, default=5, help="between reports, in seconds")
+    parser.add_argument("--jitter", type=float, default=0.2, help="of the interval")
+    parser.add_argument("--log-lines", type=int, default=20, help="per log dump")
+    parser.add_argument("--duration", type=float, default=30, help="after the ramp, in seconds")
+    parser.add_argument("--ramp", type=float, default=5, help="to start all backends, in seconds")
+    parser.add_argument("--prefix", default="loadgen", help="of the backend names")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-samples", type=int, default=1_000_000)
+    parser.add_argument("--output", help="also write the results as JSON to this file")
+    args = parser.parse_args()
+
+    if args.url:
+        results = asyncio.run(run(args.url, args))
+    else:
+        with StandInServer() as server:
+            server.store.add_release("live.arkitekt.loadgen", flavours=1)
+            results = asyncio.run(run(server.url, args))
+
+    print(
+        f"{results['registered_backends']}/{args.backends} backends registered, "
+        f"{results['calls']} calls in {results['wall_seconds']:.1f}s "
+        f"({results['ops_per_second']:.1f} ops/s)"
+    )
+    print(
+        f"{'operation':<20}{'calls':>8}{'errors':>8}{'ops/s':>9}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    )
+    for operation, row in results["operations"].items():
+        print(
+            f"{operation:<20}{row['calls']:>8}{row['errors']:>8}{row['ops_per_second']:>9.1f}"
+            f"{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}{row['p99_ms']:>9.2f}{row['max_ms']:>9.2f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"benchmark": "load_backends", "arguments": vars(args), **results}, f)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """ This file was code generated by turms. If you want to change the contents of this file, you should make sure to add the MergeProcessor to your config will keep your changes when you re-run turms)."""
     
-from kabinet.funcs import aexecute, execute
-from typing import Annotated, Optional, Dict, Literal, Iterable, List, Union, Tuple, Any
+from kabinet.funcs import aexecute, execute, asubscribe, subscribe
+from typing import Annotated, Optional, Dict, Literal, AsyncIterator, Iterable, Iterator, List, Union, Tuple, Any
 from kabinet.rath import KabinetRath
 from kabinet.scalars import ValidatorFunction, SearchQuery, ActionHash, JSONSerializable
 from pydantic import BaseModel, ConfigDict, Field
@@ -62,6 +62,12 @@ class ContainerType(str, Enum):
     APPTAINER = 'APPTAINER'
     DOCKER = 'DOCKER'
 
+class DemandKind(str, Enum):
+    """No documentation"""
+    ARGS = 'ARGS'
+    RETURNS = 'RETURNS'
+    __str__ = str.__str__
+
 class EffectClass(str, Enum):
     """The effect class of an implementation — declared by the implementation, never the caller. NONE work is freely retryable/reclaimable; PHYSICAL work touches the real world (no UPSERT), so an ambiguous failure is terminal and must not be retried."""
     NONE = 'NONE'
@@ -386,6 +392,17 @@ class DeclareResourceInput(BaseModel):
     qualifiers: Optional[Tuple['QualifierInput', ...]] = Field(default=None, description='Free-form key/value qualifiers describing the resource.')
     model_config = ConfigDict(frozen=True, extra='forbid', populate_by_name=True, use_enum_values=True)
 
+class DefinitionFilter(BaseModel):
+    """Filter for action definitions."""
+    and_: Optional['DefinitionFilter'] = Field(alias='AND', default=None)
+    or_: Optional['DefinitionFilter'] = Field(alias='OR', default=None)
+    not_: Optional['DefinitionFilter'] = Field(alias='NOT', default=None)
+    distinct: Optional[bool] = Field(alias='DISTINCT', default=None)
+    ids: Optional[Tuple[ID, ...]] = Field(default=None, description='Keep only definitions whose ID is in this list.')
+    search: Optional[str] = Field(default=None, description='Case-insensitive search on the action name.')
+    demands: Optional[Tuple['PortDemandInput', ...]] = Field(default=None, description='Keep only definitions whose ports satisfy all of the given demands.')
+    model_config = ConfigDict(frozen=True, extra='forbid', populate_by_name=True, use_enum_values=True)
+
 class DefinitionInput(BaseModel):
     """A definition
 
@@ -433,6 +450,16 @@ class DeletePodInput(BaseModel):
     id: ID = Field(description='The ID of the pod to delete.')
     model_config = ConfigDict(frozen=True, extra='forbid', populate_by_name=True, use_enum_values=True)
 
+class DeploymentFilter(BaseModel):
+    """Filter for deployments."""
+    and_: Optional['DeploymentFilter'] = Field(alias='AND', default=None)
+    or_: Optional['DeploymentFilter'] = Field(alias='OR', default=None)
+    not_: Optional['DeploymentFilter'] = Field(alias='NOT', default=None)
+    distinct: Optional[bool] = Field(alias='DISTINCT', default=None)
+    ids: Optional[Tuple[ID, ...]] = Field(default=None, description='Keep only deployments whose ID is in this list.')
+    search: Optional[str] = Field(default=None, description='Case-insensitive search on the deployment name.')
+    model_config = ConfigDict(frozen=True, extra='forbid', populate_by_name=True, use_enum_values=True)
+
 class DescriptorInput(BaseModel):
     """A single runtime descriptor key/value pair carried by a candidate object."""
     key: str = Field(description="The descriptor key, e.g. 'axes'.")
@@ -578,6 +605,26 @@ class OptimisticInput(BaseModel):
     accessor: Optional[str] = Field(default=None, description='The accessor to get the value to optimistically set. This is used when the value to optimistically set is not the same as the value of the port')
     model_config = ConfigDict(frozen=True, extra='forbid', populate_by_name=True, use_enum_values=True)
 
+class PodFilter(BaseModel):
+    """Filter for pods."""
+    and_: Optional['PodFilter'] = Field(alias='AND', default=None)
+    or_: Optional['PodFilter'] = Field(alias='OR', default=None)
+    not_: Optional['PodFilter'] = Field(alias='NOT', default=None)
+    distinct: Optional[bool] = Field(alias='DISTINCT', default=None)
+    ids: Optional[Tuple[ID, ...]] = Field(default=None, description='Keep only pods whose ID is in this list.')
+    search: Optional[str] = Field(default=None, description='Match pods by the name of their backend.')
+    backend: Optional[ID] = Field(default=None, description='Keep only pods running on the given backend.')
+    model_config = ConfigDict(frozen=True, extra='forbid', populate_by_name=True, use_enum_values=True)
+
+class PortDemandInput(BaseModel):
+    """A demand on the ports (args or returns) of an action."""
+    kind: DemandKind = Field(description='The kind of the demand. You can ask for args or returns')
+    matches: Optional[Tuple['PortMatchInput', ...]] = Field(default=None, description='The matches of the demand. ')
+    force_length: Optional[int] = Field(alias='forceLength', default=None, description='Require that the action has a specific number of ports. This is used to identify the demand in the system.')
+    force_non_nullable_length: Optional[int] = Field(alias='forceNonNullableLength', default=None, description='Require that the action has a specific number of non-nullable ports. This is used to identify the demand in the system.')
+    force_structure_length: Optional[int] = Field(alias='forceStructureLength', default=None, description='Require that the action has a specific number of structure ports. This is used to identify the demand in the system.')
+    model_config = ConfigDict(frozen=True, extra='forbid', populate_by_name=True, use_enum_values=True)
+
 class PortGroupInput(BaseModel):
     """A Port Group is a group of ports that are related to each other. It is used to group ports together in the UI and provide a better user experience."""
     key: str = Field(description='The key of the port group. This is used to uniquely identify the port group')
@@ -617,6 +664,16 @@ class QualifierInput(BaseModel):
     value: str = Field(description='The value of the qualifier.')
     model_config = ConfigDict(frozen=True, extra='forbid', populate_by_name=True, use_enum_values=True)
 
+class ReleaseFilter(BaseModel):
+    """Filter for app releases."""
+    and_: Optional['ReleaseFilter'] = Field(alias='AND', default=None)
+    or_: Optional['ReleaseFilter'] = Field(alias='OR', default=None)
+    not_: Optional['ReleaseFilter'] = Field(alias='NOT', default=None)
+    distinct: Optional[bool] = Field(alias='DISTINCT', default=None)
+    ids: Optional[Tuple[ID, ...]] = Field(default=None, description='Keep only releases whose ID is in this list.')
+    search: Optional[str] = Field(default=None, description='Case-insensitive search on the release version.')
+    model_config = ConfigDict(frozen=True, extra='forbid', populate_by_name=True, use_enum_values=True)
+
 class RequirementInput(BaseModel):
     """No documentation"""
     key: str
@@ -1307,6 +1364,35 @@ Arguments:
         data['qualifiers'] = qualifiers
     return DeclareResourceInput(**data)
 
+def definition_filter(and_: Union[Optional[DefinitionFilter], UnsetType]=UNSET, or_: Union[Optional[DefinitionFilter], UnsetType]=UNSET, not_: Union[Optional[DefinitionFilter], UnsetType]=UNSET, distinct: Union[Optional[bool], UnsetType]=UNSET, ids: Union[Optional[Iterable[IDCoercible]], UnsetType]=UNSET, search: Union[Optional[str], UnsetType]=UNSET, demands: Union[Optional[Iterable[PortDemandInput]], UnsetType]=UNSET) -> DefinitionFilter:
+    """Creates a DefinitionFilter
+
+Arguments:
+    and_: Filter for action definitions.
+    or_: Filter for action definitions.
+    not_: Filter for action definitions.
+    distinct: The `Boolean` scalar type represents `true` or `false`.
+    ids: Keep only definitions whose ID is in this list.
+    search: Case-insensitive search on the action name.
+    demands: Keep only definitions whose ports satisfy all of the given demands.
+"""
+    _data: Dict[str, Any] = {}
+    if and_ is not UNSET:
+        _data['AND'] = and_
+    if or_ is not UNSET:
+        _data['OR'] = or_
+    if not_ is not UNSET:
+        _data['NOT'] = not_
+    if distinct is not UNSET:
+        _data['DISTINCT'] = distinct
+    if ids is not UNSET:
+        _data['ids'] = ids
+    if search is not UNSET:
+        _data['search'] = search
+    if demands is not UNSET:
+        _data['demands'] = demands
+    return DefinitionFilter.model_validate(_data)
+
 def definition_input(collections: Iterable[str], key: str, version: str, name: str, stateful: bool, pure: bool, idempotent: bool, port_groups: Iterable[PortGroupInput], args: Iterable[ArgPortInput], returns: Iterable[ReturnPortInput], kind: ActionKind, is_test_for: Iterable[str], interfaces: Iterable[str], is_dev: bool, description: Union[Optional[str], UnsetType]=UNSET, package: Union[Optional[str], UnsetType]=UNSET, tests: Union[Optional[ActionDependencyInput], UnsetType]=UNSET, logo: Union[Optional[str], UnsetType]=UNSET) -> DefinitionInput:
     """Creates a DefinitionInput
 
@@ -1366,6 +1452,32 @@ Arguments:
     data['id'] = id
     return DeletePodInput(**data)
 
+def deployment_filter(and_: Union[Optional[DeploymentFilter], UnsetType]=UNSET, or_: Union[Optional[DeploymentFilter], UnsetType]=UNSET, not_: Union[Optional[DeploymentFilter], UnsetType]=UNSET, distinct: Union[Optional[bool], UnsetType]=UNSET, ids: Union[Optional[Iterable[IDCoercible]], UnsetType]=UNSET, search: Union[Optional[str], UnsetType]=UNSET) -> DeploymentFilter:
+    """Creates a DeploymentFilter
+
+Arguments:
+    and_: Filter for deployments.
+    or_: Filter for deployments.
+    not_: Filter for deployments.
+    distinct: The `Boolean` scalar type represents `true` or `false`.
+    ids: Keep only deployments whose ID is in this list.
+    search: Case-insensitive search on the deployment name.
+"""
+    _data: Dict[str, Any] = {}
+    if and_ is not UNSET:
+        _data['AND'] = and_
+    if or_ is not UNSET:
+        _data['OR'] = or_
+    if not_ is not UNSET:
+        _data['NOT'] = not_
+    if distinct is not UNSET:
+        _data['DISTINCT'] = distinct
+    if ids is not UNSET:
+        _data['ids'] = ids
+    if search is not UNSET:
+        _data['search'] = search
+    return DeploymentFilter.model_validate(_data)
+
 def descriptor_input(key: str, value: Any) -> DescriptorInput:
     """Creates a DescriptorInput
 
@@ -1646,6 +1758,57 @@ Arguments:
         data['accessor'] = accessor
     return OptimisticInput(**data)
 
+def pod_filter(and_: Union[Optional[PodFilter], UnsetType]=UNSET, or_: Union[Optional[PodFilter], UnsetType]=UNSET, not_: Union[Optional[PodFilter], UnsetType]=UNSET, distinct: Union[Optional[bool], UnsetType]=UNSET, ids: Union[Optional[Iterable[IDCoercible]], UnsetType]=UNSET, search: Union[Optional[str], UnsetType]=UNSET, backend: Union[Optional[IDCoercible], UnsetType]=UNSET) -> PodFilter:
+    """Creates a PodFilter
+
+Arguments:
+    and_: Filter for pods.
+    or_: Filter for pods.
+    not_: Filter for pods.
+    distinct: The `Boolean` scalar type represents `true` or `false`.
+    ids: Keep only pods whose ID is in this list.
+    search: Match pods by the name of their backend.
+    backend: Keep only pods running on the given backend.
+"""
+    _data: Dict[str, Any] = {}
+    if and_ is not UNSET:
+        _data['AND'] = and_
+    if or_ is not UNSET:
+        _data['OR'] = or_
+    if not_ is not UNSET:
+        _data['NOT'] = not_
+    if distinct is not UNSET:
+        _data['DISTINCT'] = distinct
+    if ids is not UNSET:
+        _data['ids'] = ids
+    if search is not UNSET:
+        _data['search'] = search
+    if backend is not UNSET:
+        _data['backend'] = backend
+    return PodFilter.model_validate(_data)
+
+def port_demand_input(kind: DemandKind, matches: Union[Optional[Iterable[PortMatchInput]], UnsetType]=UNSET, force_length: Union[Optional[int], UnsetType]=UNSET, force_non_nullable_length: Union[Optional[int], UnsetType]=UNSET, force_structure_length: Union[Optional[int], UnsetType]=UNSET) -> PortDemandInput:
+    """Creates a PortDemandInput
+
+Arguments:
+    kind: The kind of the demand. You can ask for args or returns
+    matches: The matches of the demand. 
+    force_length: Require that the action has a specific number of ports. This is used to identify the demand in the system.
+    force_non_nullable_length: Require that the action has a specific number of non-nullable ports. This is used to identify the demand in the system.
+    force_structure_length: Require that the action has a specific number of structure ports. This is used to identify the demand in the system.
+"""
+    _data: Dict[str, Any] = {}
+    _data['kind'] = kind
+    if matches is not UNSET:
+        _data['matches'] = matches
+    if force_length is not UNSET:
+        _data['forceLength'] = force_length
+    if force_non_nullable_length is not UNSET:
+        _data['forceNonNullableLength'] = force_non_nullable_length
+    if force_structure_length is not UNSET:
+        _data['forceStructureLength'] = force_structure_length
+    return PortDemandInput.model_validate(_data)
+
 def port_group_input(key: str, title: Union[Optional[str], UnsetType]=UNSET, description: Union[Optional[str], UnsetType]=UNSET, effects: Union[Optional[Iterable[EffectInput]], UnsetType]=UNSET, ports: Union[Optional[Iterable[str]], UnsetType]=UNSET) -> PortGroupInput:
     """Creates a PortGroupInput
 
@@ -1734,6 +1897,32 @@ Arguments:
     data['value'] = value
     return QualifierInput(**data)
 
+def release_filter(and_: Union[Optional[ReleaseFilter], UnsetType]=UNSET, or_: Union[Optional[ReleaseFilter], UnsetType]=UNSET, not_: Union[Optional[ReleaseFilter], UnsetType]=UNSET, distinct: Union[Optional[bool], UnsetType]=UNSET, ids: Union[Optional[Iterable[IDCoercible]], UnsetType]=UNSET, search: Union[Optional[str], UnsetType]=UNSET) -> ReleaseFilter:
+    """Creates a ReleaseFilter
+
+Arguments:
+    and_: Filter for app releases.
+    or_: Filter for app releases.
+    not_: Filter for app releases.
+    distinct: The `Boolean` scalar type represents `true` or `false`.
+    ids: Keep only releases whose ID is in this list.
+    search: Case-insensitive search on the release version.
+"""
+    _data: Dict[str, Any] = {}
+    if and_ is not UNSET:
+        _data['AND'] = and_
+    if or_ is not UNSET:
+        _data['OR'] = or_
+    if not_ is not UNSET:
+        _data['NOT'] = not_
+    if distinct is not UNSET:
+        _data['DISTINCT'] = distinct
+    if ids is not UNSET:
+        _data['ids'] = ids
+    if search is not UNSET:
+        _data['search'] = search
+    return ReleaseFilter.model_validate(_data)
+
 def requirement_input(key: str, service: str, optional: bool, description: Union[Optional[str], UnsetType]=UNSET) -> RequirementInput:
     """Creates a RequirementInput
 
@@ -2716,11 +2905,13 @@ class ListDefinitionsQuery(BaseModel):
 
     class Arguments(BaseModel):
         """Arguments for ListDefinitions """
+        filters: Optional[DefinitionFilter] = Field(default=None)
+        pagination: Optional[OffsetPaginationInput] = Field(default=None)
         model_config = ConfigDict(populate_by_name=True)
 
     class Meta:
         """Meta class for ListDefinitions """
-        document = 'fragment ListDefinition on Definition {\n  id\n  name\n  hash\n  description\n  __typename\n}\n\nquery ListDefinitions {\n  definitions {\n    ...ListDefinition\n    __typename\n  }\n}'
+        document = 'fragment ListDefinition on Definition {\n  id\n  name\n  hash\n  description\n  __typename\n}\n\nquery ListDefinitions($filters: DefinitionFilter, $pagination: OffsetPaginationInput) {\n  definitions(filters: $filters, pagination: $pagination) {\n    ...ListDefinition\n    __typename\n  }\n}'
 
 class GetDefinitionByHashQuery(BaseModel):
     """No documentation found for this operation."""
@@ -2750,6 +2941,20 @@ class GetDefinitionQuery(BaseModel):
         """Meta class for GetDefinition """
         document = 'fragment Definition on Definition {\n  id\n  name\n  __typename\n}\n\nquery GetDefinition($id: ID!) {\n  definition(id: $id) {\n    ...Definition\n    __typename\n  }\n}'
 
+class GetDefinitionsQuery(BaseModel):
+    """No documentation found for this operation."""
+    definitions: Tuple[Definition, ...]
+    'List all action definitions visible to the current organization.'
+
+    class Arguments(BaseModel):
+        """Arguments for GetDefinitions """
+        ids: List[ID]
+        model_config = ConfigDict(populate_by_name=True)
+
+    class Meta:
+        """Meta class for GetDefinitions """
+        document = 'fragment Definition on Definition {\n  id\n  name\n  __typename\n}\n\nquery GetDefinitions($ids: [ID!]!) {\n  definitions(filters: {ids: $ids}) {\n    ...Definition\n    __typename\n  }\n}'
+
 class SearchDefinitionsQueryOptions(BaseModel):
     """An action definition: the abstract, hashed description of an RPC task that a flavour provides."""
     typename: Literal['Definition'] = Field(alias='__typename', default='Definition', exclude=True)
@@ -2789,6 +2994,20 @@ class GetDeploymentQuery(BaseModel):
         """Meta class for GetDeployment """
         document = 'fragment Deployment on Deployment {\n  id\n  localId\n  __typename\n}\n\nquery GetDeployment($id: ID!) {\n  deployment(id: $id) {\n    ...Deployment\n    __typename\n  }\n}'
 
+class GetDeploymentsQuery(BaseModel):
+    """No documentation found for this operation."""
+    deployments: Tuple[Deployment, ...]
+    'List all deployments visible to the current organization.'
+
+    class Arguments(BaseModel):
+        """Arguments for GetDeployments """
+        ids: List[ID]
+        model_config = ConfigDict(populate_by_name=True)
+
+    class Meta:
+        """Meta class for GetDeployments """
+        document = 'fragment Deployment on Deployment {\n  id\n  localId\n  __typename\n}\n\nquery GetDeployments($ids: [ID!]!) {\n  deployments(filters: {ids: $ids}) {\n    ...Deployment\n    __typename\n  }\n}'
+
 class ListDeploymentsQuery(BaseModel):
     """No documentation found for this operation."""
     deployments: Tuple[ListDeployment, ...]
@@ -2796,11 +3015,13 @@ class ListDeploymentsQuery(BaseModel):
 
     class Arguments(BaseModel):
         """Arguments for ListDeployments """
+        filters: Optional[DeploymentFilter] = Field(default=None)
+        pagination: Optional[OffsetPaginationInput] = Field(default=None)
         model_config = ConfigDict(populate_by_name=True)
 
     class Meta:
         """Meta class for ListDeployments """
-        document = 'fragment ListDeployment on Deployment {\n  id\n  localId\n  __typename\n}\n\nquery ListDeployments {\n  deployments {\n    ...ListDeployment\n    __typename\n  }\n}'
+        document = 'fragment ListDeployment on Deployment {\n  id\n  localId\n  __typename\n}\n\nquery ListDeployments($filters: DeploymentFilter, $pagination: OffsetPaginationInput) {\n  deployments(filters: $filters, pagination: $pagination) {\n    ...ListDeployment\n    __typename\n  }\n}'
 
 class SearchDeploymentsQueryOptions(BaseModel):
     """A flavour scheduled to run on a particular backend."""
@@ -2889,6 +3110,20 @@ class GetFlavourQuery(BaseModel):
         """Meta class for GetFlavour """
         document = 'fragment CudaSelector on CudaSelector {\n  cudaVersion\n  cudaCores\n  __typename\n}\n\nfragment RocmSelector on RocmSelector {\n  apiVersion\n  apiThing\n  __typename\n}\n\nfragment ListFlavour on Flavour {\n  id\n  name\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  manifest\n  requirements {\n    key\n    service\n    description\n    optional\n    __typename\n  }\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  repo {\n    url\n    __typename\n  }\n  selectors {\n    ...CudaSelector\n    ...RocmSelector\n    __typename\n  }\n  __typename\n}\n\nfragment Flavour on Flavour {\n  ...ListFlavour\n  release {\n    id\n    version\n    app {\n      identifier\n      __typename\n    }\n    scopes\n    colour\n    description\n    __typename\n  }\n  __typename\n}\n\nquery GetFlavour($id: ID!) {\n  flavour(id: $id) {\n    ...Flavour\n    __typename\n  }\n}'
 
+class GetFlavoursQuery(BaseModel):
+    """No documentation found for this operation."""
+    flavours: Tuple[Flavour, ...]
+    'List all flavours visible to the current organization.'
+
+    class Arguments(BaseModel):
+        """Arguments for GetFlavours """
+        ids: List[ID]
+        model_config = ConfigDict(populate_by_name=True)
+
+    class Meta:
+        """Meta class for GetFlavours """
+        document = 'fragment CudaSelector on CudaSelector {\n  cudaVersion\n  cudaCores\n  __typename\n}\n\nfragment RocmSelector on RocmSelector {\n  apiVersion\n  apiThing\n  __typename\n}\n\nfragment ListFlavour on Flavour {\n  id\n  name\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  manifest\n  requirements {\n    key\n    service\n    description\n    optional\n    __typename\n  }\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  repo {\n    url\n    __typename\n  }\n  selectors {\n    ...CudaSelector\n    ...RocmSelector\n    __typename\n  }\n  __typename\n}\n\nfragment Flavour on Flavour {\n  ...ListFlavour\n  release {\n    id\n    version\n    app {\n      identifier\n      __typename\n    }\n    scopes\n    colour\n    description\n    __typename\n  }\n  __typename\n}\n\nquery GetFlavours($ids: [ID!]!) {\n  flavours(filters: {ids: $ids}) {\n    ...Flavour\n    __typename\n  }\n}'
+
 class SearchFlavoursQueryOptions(BaseModel):
     """A buildable variant of a release: a specific Docker image together with the selectors and requirements needed to run it."""
     typename: Literal['Flavour'] = Field(alias='__typename', default='Flavour', exclude=True)
@@ -2921,11 +3156,13 @@ class ListPodQuery(BaseModel):
 
     class Arguments(BaseModel):
         """Arguments for ListPod """
+        filters: Optional[PodFilter] = Field(default=None)
+        pagination: Optional[OffsetPaginationInput] = Field(default=None)
         model_config = ConfigDict(populate_by_name=True)
 
     class Meta:
         """Meta class for ListPod """
-        document = 'fragment ListPod on Pod {\n  id\n  podId\n  __typename\n}\n\nquery ListPod {\n  pods {\n    ...ListPod\n    __typename\n  }\n}'
+        document = 'fragment ListPod on Pod {\n  id\n  podId\n  __typename\n}\n\nquery ListPod($filters: PodFilter, $pagination: OffsetPaginationInput) {\n  pods(filters: $filters, pagination: $pagination) {\n    ...ListPod\n    __typename\n  }\n}'
 
 class GetPodQuery(BaseModel):
     """No documentation found for this operation."""
@@ -2941,6 +3178,20 @@ class GetPodQuery(BaseModel):
         """Meta class for GetPod """
         document = 'fragment CudaSelector on CudaSelector {\n  cudaVersion\n  cudaCores\n  __typename\n}\n\nfragment RocmSelector on RocmSelector {\n  apiVersion\n  apiThing\n  __typename\n}\n\nfragment ListFlavour on Flavour {\n  id\n  name\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  manifest\n  requirements {\n    key\n    service\n    description\n    optional\n    __typename\n  }\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  repo {\n    url\n    __typename\n  }\n  selectors {\n    ...CudaSelector\n    ...RocmSelector\n    __typename\n  }\n  __typename\n}\n\nfragment Flavour on Flavour {\n  ...ListFlavour\n  release {\n    id\n    version\n    app {\n      identifier\n      __typename\n    }\n    scopes\n    colour\n    description\n    __typename\n  }\n  __typename\n}\n\nfragment Pod on Pod {\n  id\n  podId\n  deployment {\n    flavour {\n      ...Flavour\n      __typename\n    }\n    __typename\n  }\n  __typename\n}\n\nquery GetPod($id: ID!) {\n  pod(id: $id) {\n    ...Pod\n    __typename\n  }\n}'
 
+class GetPodsQuery(BaseModel):
+    """No documentation found for this operation."""
+    pods: Tuple[Pod, ...]
+    'List all pods visible to the current organization.'
+
+    class Arguments(BaseModel):
+        """Arguments for GetPods """
+        ids: List[ID]
+        model_config = ConfigDict(populate_by_name=True)
+
+    class Meta:
+        """Meta class for GetPods """
+        document = 'fragment CudaSelector on CudaSelector {\n  cudaVersion\n  cudaCores\n  __typename\n}\n\nfragment RocmSelector on RocmSelector {\n  apiVersion\n  apiThing\n  __typename\n}\n\nfragment ListFlavour on Flavour {\n  id\n  name\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  manifest\n  requirements {\n    key\n    service\n    description\n    optional\n    __typename\n  }\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  repo {\n    url\n    __typename\n  }\n  selectors {\n    ...CudaSelector\n    ...RocmSelector\n    __typename\n  }\n  __typename\n}\n\nfragment Flavour on Flavour {\n  ...ListFlavour\n  release {\n    id\n    version\n    app {\n      identifier\n      __typename\n    }\n    scopes\n    colour\n    description\n    __typename\n  }\n  __typename\n}\n\nfragment Pod on Pod {\n  id\n  podId\n  deployment {\n    flavour {\n      ...Flavour\n      __typename\n    }\n    __typename\n  }\n  __typename\n}\n\nquery GetPods($ids: [ID!]!) {\n  pods(filters: {ids: $ids}) {\n    ...Pod\n    __typename\n  }\n}'
+
 class MyPodAtQuery(BaseModel):
     """No documentation found for this operation."""
     my_pod_at: Pod = Field(alias='myPodAt')
@@ -2987,11 +3238,13 @@ class ListReleasesQuery(BaseModel):
 
     class Arguments(BaseModel):
         """Arguments for ListReleases """
+        filters: Optional[ReleaseFilter] = Field(default=None)
+        pagination: Optional[OffsetPaginationInput] = Field(default=None)
         model_config = ConfigDict(populate_by_name=True)
 
     class Meta:
         """Meta class for ListReleases """
-        document = 'fragment CudaSelector on CudaSelector {\n  cudaVersion\n  cudaCores\n  __typename\n}\n\nfragment RocmSelector on RocmSelector {\n  apiVersion\n  apiThing\n  __typename\n}\n\nfragment ListFlavour on Flavour {\n  id\n  name\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  manifest\n  requirements {\n    key\n    service\n    description\n    optional\n    __typename\n  }\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  repo {\n    url\n    __typename\n  }\n  selectors {\n    ...CudaSelector\n    ...RocmSelector\n    __typename\n  }\n  __typename\n}\n\nfragment ListRelease on Release {\n  id\n  version\n  app {\n    identifier\n    __typename\n  }\n  installed\n  scopes\n  flavours {\n    ...ListFlavour\n    __typename\n  }\n  colour\n  description\n  __typename\n}\n\nquery ListReleases {\n  releases {\n    ...ListRelease\n    __typename\n  }\n}'
+        document = 'fragment CudaSelector on CudaSelector {\n  cudaVersion\n  cudaCores\n  __typename\n}\n\nfragment RocmSelector on RocmSelector {\n  apiVersion\n  apiThing\n  __typename\n}\n\nfragment ListFlavour on Flavour {\n  id\n  name\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  manifest\n  requirements {\n    key\n    service\n    description\n    optional\n    __typename\n  }\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  repo {\n    url\n    __typename\n  }\n  selectors {\n    ...CudaSelector\n    ...RocmSelector\n    __typename\n  }\n  __typename\n}\n\nfragment ListRelease on Release {\n  id\n  version\n  app {\n    identifier\n    __typename\n  }\n  installed\n  scopes\n  flavours {\n    ...ListFlavour\n    __typename\n  }\n  colour\n  description\n  __typename\n}\n\nquery ListReleases($filters: ReleaseFilter, $pagination: OffsetPaginationInput) {\n  releases(filters: $filters, pagination: $pagination) {\n    ...ListRelease\n    __typename\n  }\n}'
 
 class GetReleaseQuery(BaseModel):
     """No documentation found for this operation."""
@@ -3007,6 +3260,20 @@ class GetReleaseQuery(BaseModel):
         """Meta class for GetRelease """
         document = 'fragment CudaSelector on CudaSelector {\n  cudaVersion\n  cudaCores\n  __typename\n}\n\nfragment RocmSelector on RocmSelector {\n  apiVersion\n  apiThing\n  __typename\n}\n\nfragment ListFlavour on Flavour {\n  id\n  name\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  manifest\n  requirements {\n    key\n    service\n    description\n    optional\n    __typename\n  }\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  repo {\n    url\n    __typename\n  }\n  selectors {\n    ...CudaSelector\n    ...RocmSelector\n    __typename\n  }\n  __typename\n}\n\nfragment Release on Release {\n  id\n  version\n  app {\n    identifier\n    __typename\n  }\n  scopes\n  colour\n  description\n  flavours {\n    ...ListFlavour\n    __typename\n  }\n  __typename\n}\n\nquery GetRelease($id: ID!) {\n  release(id: $id) {\n    ...Release\n    __typename\n  }\n}'
 
+class GetReleasesQuery(BaseModel):
+    """No documentation found for this operation."""
+    releases: Tuple[Release, ...]
+    'List all app releases visible to the current organization.'
+
+    class Arguments(BaseModel):
+        """Arguments for GetReleases """
+        ids: List[ID]
+        model_config = ConfigDict(populate_by_name=True)
+
+    class Meta:
+        """Meta class for GetReleases """
+        document = 'fragment CudaSelector on CudaSelector {\n  cudaVersion\n  cudaCores\n  __typename\n}\n\nfragment RocmSelector on RocmSelector {\n  apiVersion\n  apiThing\n  __typename\n}\n\nfragment ListFlavour on Flavour {\n  id\n  name\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  manifest\n  requirements {\n    key\n    service\n    description\n    optional\n    __typename\n  }\n  image {\n    imageString\n    buildAt\n    __typename\n  }\n  repo {\n    url\n    __typename\n  }\n  selectors {\n    ...CudaSelector\n    ...RocmSelector\n    __typename\n  }\n  __typename\n}\n\nfragment Release on Release {\n  id\n  version\n  app {\n    identifier\n    __typename\n  }\n  scopes\n  colour\n  description\n  flavours {\n    ...ListFlavour\n    __typename\n  }\n  __typename\n}\n\nquery GetReleases($ids: [ID!]!) {\n  releases(filters: {ids: $ids}) {\n    ...Release\n    __typename\n  }\n}'
+
 class SearchReleasesQueryOptions(BaseModel):
     """A specific version of an app, bundling the flavours that can be deployed for it."""
     typename: Literal['Release'] = Field(alias='__typename', default='Release', exclude=True)
@@ -3086,6 +3353,59 @@ class SearchResourcesQuery(BaseModel):
         """Meta class for SearchResources """
         document = 'query SearchResources($search: String, $values: [ID!], $limit: Int, $offset: Int) {\n  options: resources(\n    filters: {search: $search, ids: $values}\n    pagination: {limit: $limit, offset: $offset}\n  ) {\n    value: id\n    label: name\n    __typename\n  }\n}'
 
+class WatchPodsSubscriptionPods(BaseModel):
+    """A status update for a pod, pushed over a subscription."""
+    typename: Literal['PodUpdateMessage'] = Field(alias='__typename', default='PodUpdateMessage', exclude=True)
+    id: str
+    'The ID of the pod this update is about.'
+    status: str
+    'The new status of the pod.'
+    created: bool
+    "Whether this update corresponds to the pod's creation."
+    progress: Optional[int] = Field(default=None)
+    'Optional progress indicator for the update, as a percentage.'
+    model_config = ConfigDict(frozen=True)
+
+class WatchPodsSubscription(BaseModel):
+    """No documentation found for this operation."""
+    pods: WatchPodsSubscriptionPods
+    'Subscribe to status updates for all pods visible to the current organization.'
+
+    class Arguments(BaseModel):
+        """Arguments for WatchPods """
+        model_config = ConfigDict(populate_by_name=True)
+
+    class Meta:
+        """Meta class for WatchPods """
+        document = 'subscription WatchPods {\n  pods {\n    id\n    status\n    created\n    progress\n    __typename\n  }\n}'
+
+class WatchPodSubscriptionPod(BaseModel):
+    """A status update for a pod, pushed over a subscription."""
+    typename: Literal['PodUpdateMessage'] = Field(alias='__typename', default='PodUpdateMessage', exclude=True)
+    id: str
+    'The ID of the pod this update is about.'
+    status: str
+    'The new status of the pod.'
+    created: bool
+    "Whether this update corresponds to the pod's creation."
+    progress: Optional[int] = Field(default=None)
+    'Optional progress indicator for the update, as a percentage.'
+    model_config = ConfigDict(frozen=True)
+
+class WatchPodSubscription(BaseModel):
+    """No documentation found for this operation."""
+    pod: WatchPodSubscriptionPod
+    'Subscribe to status updates for a single pod.'
+
+    class Arguments(BaseModel):
+        """Arguments for WatchPod """
+        pod_id: ID = Field(alias='podId')
+        model_config = ConfigDict(populate_by_name=True)
+
+    class Meta:
+        """Meta class for WatchPod """
+        document = 'subscription WatchPod($podId: ID!) {\n  pod(podId: $podId) {\n    id\n    status\n    created\n    progress\n    __typename\n  }\n}'
+
 async def adeclare_backend(name: str, kind: str, rath: Optional[KabinetRath]=None) -> Backend:
     """DeclareBackend 
 
@@ -3656,32 +3976,44 @@ Returns:
         variables['offset'] = offset
     return execute(SearchBackendsQuery, variables, rath=rath).options
 
-async def alist_definitions(rath: Optional[KabinetRath]=None) -> Tuple[ListDefinition, ...]:
+async def alist_definitions(rath: Optional[KabinetRath]=None, *, filters: Union[Optional[DefinitionFilter], UnsetType]=UNSET, pagination: Union[Optional[OffsetPaginationInput], UnsetType]=UNSET) -> Tuple[ListDefinition, ...]:
     """ListDefinitions 
 
 List all action definitions visible to the current organization.
 
 Args:
+    filters (Optional[DefinitionFilter], optional): No description. 
+    pagination (Optional[OffsetPaginationInput], optional): No description. 
     rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
 
 Returns:
     List[ListDefinition]
 """
     variables: Dict[str, Any] = {}
+    if filters is not UNSET:
+        variables['filters'] = filters
+    if pagination is not UNSET:
+        variables['pagination'] = pagination
     return (await aexecute(ListDefinitionsQuery, variables, rath=rath)).definitions
 
-def list_definitions(rath: Optional[KabinetRath]=None) -> Tuple[ListDefinition, ...]:
+def list_definitions(rath: Optional[KabinetRath]=None, *, filters: Union[Optional[DefinitionFilter], UnsetType]=UNSET, pagination: Union[Optional[OffsetPaginationInput], UnsetType]=UNSET) -> Tuple[ListDefinition, ...]:
     """ListDefinitions 
 
 List all action definitions visible to the current organization.
 
 Args:
+    filters (Optional[DefinitionFilter], optional): No description. 
+    pagination (Optional[OffsetPaginationInput], optional): No description. 
     rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
 
 Returns:
     List[ListDefinition]
 """
     variables: Dict[str, Any] = {}
+    if filters is not UNSET:
+        variables['filters'] = filters
+    if pagination is not UNSET:
+        variables['pagination'] = pagination
     return execute(ListDefinitionsQuery, variables, rath=rath).definitions
 
 async def aget_definition_by_hash(hash: Union[Optional[ActionHash], UnsetType]=UNSET, rath: Optional[KabinetRath]=None) -> Definition:
@@ -3750,6 +4082,38 @@ Returns:
     variables['id'] = id
     return execute(GetDefinitionQuery, variables, rath=rath).definition
 
+async def aget_definitions(ids: List[ID], rath: Optional[KabinetRath]=None) -> Tuple[Definition, ...]:
+    """GetDefinitions 
+
+List all action definitions visible to the current organization.
+
+Args:
+    ids (List[ID]): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    List[Definition]
+"""
+    variables: Dict[str, Any] = {}
+    variables['ids'] = ids
+    return (await aexecute(GetDefinitionsQuery, variables, rath=rath)).definitions
+
+def get_definitions(ids: List[ID], rath: Optional[KabinetRath]=None) -> Tuple[Definition, ...]:
+    """GetDefinitions 
+
+List all action definitions visible to the current organization.
+
+Args:
+    ids (List[ID]): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    List[Definition]
+"""
+    variables: Dict[str, Any] = {}
+    variables['ids'] = ids
+    return execute(GetDefinitionsQuery, variables, rath=rath).definitions
+
 async def asearch_definitions(search: Union[Optional[str], UnsetType]=UNSET, values: Union[Optional[List[ID]], UnsetType]=UNSET, limit: Union[Optional[int], UnsetType]=UNSET, offset: Union[Optional[int], UnsetType]=UNSET, rath: Optional[KabinetRath]=None) -> Tuple[SearchDefinitionsQueryOptions, ...]:
     """SearchDefinitions 
 
@@ -3834,32 +4198,76 @@ Returns:
     variables['id'] = id
     return execute(GetDeploymentQuery, variables, rath=rath).deployment
 
-async def alist_deployments(rath: Optional[KabinetRath]=None) -> Tuple[ListDeployment, ...]:
+async def aget_deployments(ids: List[ID], rath: Optional[KabinetRath]=None) -> Tuple[Deployment, ...]:
+    """GetDeployments 
+
+List all deployments visible to the current organization.
+
+Args:
+    ids (List[ID]): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    List[Deployment]
+"""
+    variables: Dict[str, Any] = {}
+    variables['ids'] = ids
+    return (await aexecute(GetDeploymentsQuery, variables, rath=rath)).deployments
+
+def get_deployments(ids: List[ID], rath: Optional[KabinetRath]=None) -> Tuple[Deployment, ...]:
+    """GetDeployments 
+
+List all deployments visible to the current organization.
+
+Args:
+    ids (List[ID]): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    List[Deployment]
+"""
+    variables: Dict[str, Any] = {}
+    variables['ids'] = ids
+    return execute(GetDeploymentsQuery, variables, rath=rath).deployments
+
+async def alist_deployments(rath: Optional[KabinetRath]=None, *, filters: Union[Optional[DeploymentFilter], UnsetType]=UNSET, pagination: Union[Optional[OffsetPaginationInput], UnsetType]=UNSET) -> Tuple[ListDeployment, ...]:
     """ListDeployments 
 
 List all deployments visible to the current organization.
 
 Args:
+    filters (Optional[DeploymentFilter], optional): No description. 
+    pagination (Optional[OffsetPaginationInput], optional): No description. 
     rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
 
 Returns:
     List[ListDeployment]
 """
     variables: Dict[str, Any] = {}
+    if filters is not UNSET:
+        variables['filters'] = filters
+    if pagination is not UNSET:
+        variables['pagination'] = pagination
     return (await aexecute(ListDeploymentsQuery, variables, rath=rath)).deployments
 
-def list_deployments(rath: Optional[KabinetRath]=None) -> Tuple[ListDeployment, ...]:
+def list_deployments(rath: Optional[KabinetRath]=None, *, filters: Union[Optional[DeploymentFilter], UnsetType]=UNSET, pagination: Union[Optional[OffsetPaginationInput], UnsetType]=UNSET) -> Tuple[ListDeployment, ...]:
     """ListDeployments 
 
 List all deployments visible to the current organization.
 
 Args:
+    filters (Optional[DeploymentFilter], optional): No description. 
+    pagination (Optional[OffsetPaginationInput], optional): No description. 
     rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
 
 Returns:
     List[ListDeployment]
 """
     variables: Dict[str, Any] = {}
+    if filters is not UNSET:
+        variables['filters'] = filters
+    if pagination is not UNSET:
+        variables['pagination'] = pagination
     return execute(ListDeploymentsQuery, variables, rath=rath).deployments
 
 async def asearch_deployments(search: Union[Optional[str], UnsetType]=UNSET, values: Union[Optional[List[ID]], UnsetType]=UNSET, limit: Union[Optional[int], UnsetType]=UNSET, offset: Union[Optional[int], UnsetType]=UNSET, rath: Optional[KabinetRath]=None) -> Tuple[SearchDeploymentsQueryOptions, ...]:
@@ -4032,6 +4440,38 @@ Returns:
     variables['id'] = id
     return execute(GetFlavourQuery, variables, rath=rath).flavour
 
+async def aget_flavours(ids: List[ID], rath: Optional[KabinetRath]=None) -> Tuple[Flavour, ...]:
+    """GetFlavours 
+
+List all flavours visible to the current organization.
+
+Args:
+    ids (List[ID]): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    List[Flavour]
+"""
+    variables: Dict[str, Any] = {}
+    variables['ids'] = ids
+    return (await aexecute(GetFlavoursQuery, variables, rath=rath)).flavours
+
+def get_flavours(ids: List[ID], rath: Optional[KabinetRath]=None) -> Tuple[Flavour, ...]:
+    """GetFlavours 
+
+List all flavours visible to the current organization.
+
+Args:
+    ids (List[ID]): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    List[Flavour]
+"""
+    variables: Dict[str, Any] = {}
+    variables['ids'] = ids
+    return execute(GetFlavoursQuery, variables, rath=rath).flavours
+
 async def asearch_flavours(search: Union[Optional[str], UnsetType]=UNSET, values: Union[Optional[List[ID]], UnsetType]=UNSET, limit: Union[Optional[int], UnsetType]=UNSET, offset: Union[Optional[int], UnsetType]=UNSET, rath: Optional[KabinetRath]=None) -> Tuple[SearchFlavoursQueryOptions, ...]:
     """SearchFlavours 
 
@@ -4084,32 +4524,44 @@ Returns:
         variables['offset'] = offset
     return execute(SearchFlavoursQuery, variables, rath=rath).options
 
-async def alist_pod(rath: Optional[KabinetRath]=None) -> Tuple[ListPod, ...]:
+async def alist_pod(rath: Optional[KabinetRath]=None, *, filters: Union[Optional[PodFilter], UnsetType]=UNSET, pagination: Union[Optional[OffsetPaginationInput], UnsetType]=UNSET) -> Tuple[ListPod, ...]:
     """ListPod 
 
 List all pods visible to the current organization.
 
 Args:
+    filters (Optional[PodFilter], optional): No description. 
+    pagination (Optional[OffsetPaginationInput], optional): No description. 
     rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
 
 Returns:
     List[ListPod]
 """
     variables: Dict[str, Any] = {}
+    if filters is not UNSET:
+        variables['filters'] = filters
+    if pagination is not UNSET:
+        variables['pagination'] = pagination
     return (await aexecute(ListPodQuery, variables, rath=rath)).pods
 
-def list_pod(rath: Optional[KabinetRath]=None) -> Tuple[ListPod, ...]:
+def list_pod(rath: Optional[KabinetRath]=None, *, filters: Union[Optional[PodFilter], UnsetType]=UNSET, pagination: Union[Optional[OffsetPaginationInput], UnsetType]=UNSET) -> Tuple[ListPod, ...]:
     """ListPod 
 
 List all pods visible to the current organization.
 
 Args:
+    filters (Optional[PodFilter], optional): No description. 
+    pagination (Optional[OffsetPaginationInput], optional): No description. 
     rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
 
 Returns:
     List[ListPod]
 """
     variables: Dict[str, Any] = {}
+    if filters is not UNSET:
+        variables['filters'] = filters
+    if pagination is not UNSET:
+        variables['pagination'] = pagination
     return execute(ListPodQuery, variables, rath=rath).pods
 
 async def aget_pod(id: ID, rath: Optional[KabinetRath]=None) -> Pod:
@@ -4144,6 +4596,38 @@ Returns:
     variables['id'] = id
     return execute(GetPodQuery, variables, rath=rath).pod
 
+async def aget_pods(ids: List[ID], rath: Optional[KabinetRath]=None) -> Tuple[Pod, ...]:
+    """GetPods 
+
+List all pods visible to the current organization.
+
+Args:
+    ids (List[ID]): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    List[Pod]
+"""
+    variables: Dict[str, Any] = {}
+    variables['ids'] = ids
+    return (await aexecute(GetPodsQuery, variables, rath=rath)).pods
+
+def get_pods(ids: List[ID], rath: Optional[KabinetRath]=None) -> Tuple[Pod, ...]:
+    """GetPods 
+
+List all pods visible to the current organization.
+
+Args:
+    ids (List[ID]): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    List[Pod]
+"""
+    variables: Dict[str, Any] = {}
+    variables['ids'] = ids
+    return execute(GetPodsQuery, variables, rath=rath).pods
+
 async def amy_pod_at(local_id: ID, rath: Optional[KabinetRath]=None) -> Pod:
     """MyPodAt 
 
@@ -4228,32 +4712,44 @@ Returns:
         variables['offset'] = offset
     return execute(SearchPodsQuery, variables, rath=rath).options
 
-async def alist_releases(rath: Optional[KabinetRath]=None) -> Tuple[ListRelease, ...]:
+async def alist_releases(rath: Optional[KabinetRath]=None, *, filters: Union[Optional[ReleaseFilter], UnsetType]=UNSET, pagination: Union[Optional[OffsetPaginationInput], UnsetType]=UNSET) -> Tuple[ListRelease, ...]:
     """ListReleases 
 
 List all app releases visible to the current organization.
 
 Args:
+    filters (Optional[ReleaseFilter], optional): No description. 
+    pagination (Optional[OffsetPaginationInput], optional): No description. 
     rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
 
 Returns:
     List[ListRelease]
 """
     variables: Dict[str, Any] = {}
+    if filters is not UNSET:
+        variables['filters'] = filters
+    if pagination is not UNSET:
+        variables['pagination'] = pagination
     return (await aexecute(ListReleasesQuery, variables, rath=rath)).releases
 
-def list_releases(rath: Optional[KabinetRath]=None) -> Tuple[ListRelease, ...]:
+def list_releases(rath: Optional[KabinetRath]=None, *, filters: Union[Optional[ReleaseFilter], UnsetType]=UNSET, pagination: Union[Optional[OffsetPaginationInput], UnsetType]=UNSET) -> Tuple[ListRelease, ...]:
     """ListReleases 
 
 List all app releases visible to the current organization.
 
 Args:
+    filters (Optional[ReleaseFilter], optional): No description. 
+    pagination (Optional[OffsetPaginationInput], optional): No description. 
     rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
 
 Returns:
     List[ListRelease]
 """
     variables: Dict[str, Any] = {}
+    if filters is not UNSET:
+        variables['filters'] = filters
+    if pagination is not UNSET:
+        variables['pagination'] = pagination
     return execute(ListReleasesQuery, variables, rath=rath).releases
 
 async def aget_release(id: ID, rath: Optional[KabinetRath]=None) -> Release:
@@ -4288,6 +4784,38 @@ Returns:
     variables['id'] = id
     return execute(GetReleaseQuery, variables, rath=rath).release
 
+async def aget_releases(ids: List[ID], rath: Optional[KabinetRath]=None) -> Tuple[Release, ...]:
+    """GetReleases 
+
+List all app releases visible to the current organization.
+
+Args:
+    ids (List[ID]): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    List[Release]
+"""
+    variables: Dict[str, Any] = {}
+    variables['ids'] = ids
+    return (await aexecute(GetReleasesQuery, variables, rath=rath)).releases
+
+def get_releases(ids: List[ID], rath: Optional[KabinetRath]=None) -> Tuple[Release, ...]:
+    """GetReleases 
+
+List all app releases visible to the current organization.
+
+Args:
+    ids (List[ID]): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    List[Release]
+"""
+    variables: Dict[str, Any] = {}
+    variables['ids'] = ids
+    return execute(GetReleasesQuery, variables, rath=rath).releases
+
 async def asearch_releases(search: Union[Optional[str], UnsetType]=UNSET, values: Union[Optional[List[ID]], UnsetType]=UNSET, limit: Union[Optional[int], UnsetType]=UNSET, offset: Union[Optional[int], UnsetType]=UNSET, rath: Optional[KabinetRath]=None) -> Tuple[SearchReleasesQueryOptions, ...]:
     """SearchReleases 
 
@@ -4463,6 +4991,69 @@ Returns:
     if offset is not UNSET:
         variables['offset'] = offset
     return execute(SearchResourcesQuery, variables, rath=rath).options
+async def awatch_pods(rath: Optional[KabinetRath]=None) -> AsyncIterator[WatchPodsSubscriptionPods]:
+    """WatchPods 
+
+Subscribe to status updates for all pods visible to the current organization.
+
+Args:
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    WatchPodsSubscriptionPods
+"""
+    variables: Dict[str, Any] = {}
+    async for event in asubscribe(WatchPodsSubscription, variables, rath=rath):
+        yield event.pods
+
+def watch_pods(rath: Optional[KabinetRath]=None) -> Iterator[WatchPodsSubscriptionPods]:
+    """WatchPods 
+
+Subscribe to status updates for all pods visible to the current organization.
+
+Args:
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    WatchPodsSubscriptionPods
+"""
+    variables: Dict[str, Any] = {}
+    for event in subscribe(WatchPodsSubscription, variables, rath=rath):
+        yield event.pods
+
+async def awatch_pod(pod_id: IDCoercible, rath: Optional[KabinetRath]=None) -> AsyncIterator[WatchPodSubscriptionPod]:
+    """WatchPod 
+
+Subscribe to status updates for a single pod.
+
+Args:
+    pod_id (ID): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    WatchPodSubscriptionPod
+"""
+    variables: Dict[str, Any] = {}
+    variables['podId'] = pod_id
+    async for event in asubscribe(WatchPodSubscription, variables, rath=rath):
+        yield event.pod
+
+def watch_pod(pod_id: IDCoercible, rath: Optional[KabinetRath]=None) -> Iterator[WatchPodSubscriptionPod]:
+    """WatchPod 
+
+Subscribe to status updates for a single pod.
+
+Args:
+    pod_id (ID): No description
+    rath (kabinet.rath.KabinetRath, optional): The client we want to use (defaults to the currently active client)
+
+Returns:
+    WatchPodSubscriptionPod
+"""
+    variables: Dict[str, Any] = {}
+    variables['podId'] = pod_id
+    for event in subscribe(WatchPodSubscription, variables, rath=rath):
+        yield event.pod
 ActionArgumentInput.model_rebuild()
 ActionDemandInput.model_rebuild()
 AgentDependencyInput.model_rebuild()
@@ -4474,11 +5065,16 @@ BlokImplementationInput.model_rebuild()
 ComponentNodeInput.model_rebuild()
 ComponentPropInput.model_rebuild()
 DeclareResourceInput.model_rebuild()
+DefinitionFilter.model_rebuild()
 DefinitionInput.model_rebuild()
+DeploymentFilter.model_rebuild()
 FlavourFilter.model_rebuild()
 ImplementationInput.model_rebuild()
 InspectionInput.model_rebuild()
+PodFilter.model_rebuild()
+PortDemandInput.model_rebuild()
 PortMatchInput.model_rebuild()
+ReleaseFilter.model_rebuild()
 ResourceFilter.model_rebuild()
 ReturnPortInput.model_rebuild()
 TrackInput.model_rebuild()
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""Merging of several turms operations into one aliased GraphQL document.
+
+Every operation of a batch gets a unique prefix. Its variables and its
+top level fields are renamed with that prefix, so that the operations can
+live side by side in a single document. Fragments are shared between the
+operations, as turms emits identical fragment definitions for every
+operation that uses them.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    NameNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    VariableNode,
+    Visitor,
+    print_ast,
+    visit,
+)
+
+from .documents import parse_operation_document
+from .errors import BatchingError
+
+
+class PrefixVariablesVisitor(Visitor):
+    """Renames every variable of a node with a prefix."""
+
+    def __init__(self, prefix: str) -> None:
+        """Create a visitor for the given prefix."""
+        super().__init__()
+        self.prefix = prefix
+
+    def enter_variable(self, node: VariableNode, *_: object) -> VariableNode:
+        """Prefix the variable name."""
+        return VariableNode(name=NameNode(value=self.prefix + node.name.value))
+
+
+class CollectVariablesVisitor(Visitor):
+    """Collects the names of all variables used in a node."""
+
+    def __init__(self) -> None:
+        """Create an empty collector."""
+        super().__init__()
+        self.names: List[str] = []
+
+    def enter_variable(self, node: VariableNode, *_: object) -> None:
+        """Record the variable name."""
+        self.names.append(node.name.value)
+
+
+def check_fragments(fragments: Tuple[FragmentDefinitionNode, ...]) -> None:
+    """Ensure that the fragments can be shared between the operations of a batch."""
+    for fragment in fragments:
+        collector = CollectVariablesVisitor()
+        visit(fragment, collector)
+        if collector.names:
+            raise BatchingError(
+                f"Fragment {fragment.name.value} uses variables and cannot be batched."
+            )
+
+
+def batch_prefix(index: int) -> str:
+    """The prefix of the operation at ``index`` in a batch."""
+    return f"b{index}_"
+
+
+def merge_operations(
+    operations: Sequence[Tuple[str, Dict[str, Any]]],
+) -> Tuple[str, Dict[str, Any]]:
+    """Merge several documents and their variables into one operation.
+
+    Args:
+        operations: The documents and their (already serialized) variables.
+
+    Raises:
+        BatchingError: If the operations cannot be merged, e.g. because they
+            are of different types or because one of them is a subscription.
+
+    Returns:
+        The merged document and the merged variables.
+    """
+    if not operations:
+        raise BatchingError("Cannot batch an empty list of operations.")
+
+    operation_type = None
+    fragments: Dict[str, FragmentDefinitionNode] = {}
+    variable_definitions = []
+    selections: List[FieldNode] = []
+    variables: Dict[str, Any] = {}
+
+    for index, (document, operation_variables) in enumerate(operations):
+        prefix = batch_prefix(index)
+        operation, operation_fragments = parse_operation_document(document)
+        check_fragments(operation_fragments)
+
+        if operation.operation == OperationType.SUBSCRIPTION:
+            raise BatchingError("Subscriptions cannot be batched.")
+        if operation_type is None:
+            operation_type = operation.operation
+        elif operation.operation != operation_type:
+            raise BatchingError("Queries and mutations cannot be batched together.")
+
+        for fragment in operation_fragments:
+            existing = fragments.setdefault(fragment.name.value, fragment)
+            if existing is not fragment and print_ast(existing) != print_ast(fragment):
+                raise BatchingError(
+                    f"Conflicting definitions for fragment {fragment.name.value}."
+                )
+
+        renamed = visit(operation, PrefixVariablesVisitor(prefix))
+        variable_definitions.extend(renamed.variable_definitions or ())
+
+        for selection in renamed.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                raise BatchingError("Only fields can be batched at the root of an operation.")
+            target = selection.alias.value if selection.alias else selection.name.value
+            selections.append(
+                FieldNode(
+                    alias=NameNode(value=prefix + target),
+                    name=selection.name,
+                    arguments=selection.arguments,
+                    directives=selection.directives,
+                    selection_set=selection.selection_set,
+                )
+            )
+
+        variables.update({prefix + key: value for key, value in operation_variables.items()})
+
+    merged = OperationDefinitionNode(
+        operation=operation_type,
+        name=NameNode(value="Batched"),
+        variable_definitions=tuple(variable_definitions),
+        directives=(),
+        selection_set=SelectionSetNode(selections=tuple(selections)),
+    )
+
+    return print_ast(DocumentNode(definitions=(*fragments.values(), merged))), variables
+
+
+def split_data(data: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+    """Split the data of a merged operation back into the data of each operation."""
+    split: List[Dict[str, Any]] = [{} for _ in range(count)]
+    for key, value in data.items():
+        prefix, _, field = key.partition("_")
+        split[int(prefix[1:])][field] = value
+    return split
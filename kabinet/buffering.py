@@ -0,0 +1,202 @@
+"""Bounded buffers between a subscription and a slow consumer.
+
+Without a buffer, a subscription yields every event as it arrives, and a
+consumer that is slower than the server falls behind without bound. A
+:class:`SubscriptionBuffer` receives the events in the background and holds
+at most ``maxsize`` of them. What happens when it is full depends on its
+:class:`OverflowPolicy`:
+
+- ``BLOCK`` stops reading from the subscription until the consumer catches up
+- ``DROP_OLDEST`` discards the oldest buffered event
+- ``LATEST`` keeps only the latest event per key (e.g. per pod), replacing
+  older events in place, and discards the oldest key if there are more
+  distinct keys than ``maxsize``
+
+Example:
+    ```python
+    buffer = SubscriptionBuffer(maxsize=1000, policy="latest")
+    async for event in asubscribe(WatchPodsSubscription, {}, buffer=buffer):
+        ...
+    print(buffer.coalesced, buffer.dropped)
+    ```
+"""
+
+import asyncio
+from collections import OrderedDict
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Hashable,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from rath.turms.funcs import TOperation
+
+T = TypeVar("T")
+
+
+def root_id(event: Any) -> Hashable:  # noqa: ANN401
+    """The ``id`` of the single root field of an event, e.g. the pod of a ``WatchPods`` event."""
+    return getattr(event, next(iter(type(event).model_fields))).id
+
+
+class OverflowPolicy(str, Enum):
+    """What a full subscription buffer does with a new event."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    LATEST = "latest"
+
+
+class SubscriptionBuffer(Generic[T]):
+    """A bounded buffer of subscription events with an overflow policy."""
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        policy: Union[OverflowPolicy, str] = OverflowPolicy.BLOCK,
+        key: Callable[[T], Hashable] = root_id,
+    ) -> None:
+        """Create a buffer.
+
+        Args:
+            maxsize: The maximum number of buffered events
+            policy: What to do with new events when the buffer is full
+            key: The key events are coalesced on with ``LATEST``
+                (defaults to the ``id`` of the root field, e.g. of the pod)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize needs to be at least 1")
+        self.maxsize = maxsize
+        self.policy = OverflowPolicy(policy)
+        self.key = key
+
+        self.received = 0
+        """The number of events received from the subscription"""
+        self.delivered = 0
+        """The number of events handed to the consumer"""
+        self.dropped = 0
+        """The number of events discarded because the buffer was full"""
+        self.coalesced = 0
+        """The number of events replaced by a later event with the same key"""
+
+        self._events: "OrderedDict[Any, T]" = OrderedDict()
+        self._counter = 0
+        self._closed = False
+        self._exception: Optional[BaseException] = None
+        self._draining = False
+        self._condition = asyncio.Condition()
+
+    def __len__(self) -> int:
+        """The number of buffered events."""
+        return len(self._events)
+
+    async def aput(self, event: T) -> None:
+        """Add an event, applying the overflow policy if the buffer is full."""
+        async with self._condition:
+            self.received += 1
+
+            if self.policy == OverflowPolicy.LATEST:
+                key = self.key(event)
+                if key in self._events:
+                    self._events[key] = event
+                    self.coalesced += 1
+                    self._condition.notify_all()
+                    return
+            else:
+                key = self._counter
+                self._counter += 1
+
+            if len(self._events) >= self.maxsize:
+                if self.policy == OverflowPolicy.BLOCK:
+                    await self._condition.wait_for(
+                        lambda: len(self._events) < self.maxsize or self._closed
+                    )
+                else:
+                    self._events.popitem(last=False)
+                    self.dropped += 1
+
+            self._events[key] = event
+            self._condition.notify_all()
+
+    async def aget(self) -> T:
+        """Take the oldest event, waiting for one if the buffer is empty.
+
+        Raises:
+            StopAsyncIteration: If the buffer was closed and is empty
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: bool(self._events) or self._closed)
+            if not self._events:
+                if self._exception is not None:
+                    raise self._exception
+                raise StopAsyncIteration
+            _, event = self._events.popitem(last=False)
+            self.delivered += 1
+            self._condition.notify_all()
+            return event
+
+    async def aclose(self, exception: Optional[BaseException] = None) -> None:
+        """Mark the end of the subscription; buffered events are still delivered."""
+        async with self._condition:
+            self._closed = True
+            self._exception = exception
+            self._condition.notify_all()
+
+    async def apump(self, events: AsyncIterator[T]) -> None:
+        """Feed the events of a subscription into the buffer until it ends.
+
+        The subscription is closed when it ends or the pump is cancelled.
+        """
+        try:
+            async for event in events:
+                await self.aput(event)
+        except asyncio.CancelledError:
+            await self.aclose()
+            raise
+        except Exception as e:
+            await self.aclose(e)
+        else:
+            await self.aclose()
+        finally:
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def adrain(self, events: AsyncIterator[TOperation]) -> AsyncIterator[TOperation]:
+        """Yield the events of a subscription through the buffer.
+
+        The subscription is consumed in a background task, which is cancelled
+        when the consumer stops iterating. A buffer can be reused for another
+        subscription once the previous one has been drained; its counters
+        keep adding up.
+
+        Raises:
+            RuntimeError: If the buffer is still draining another subscription
+        """
+        if self._draining:
+            raise RuntimeError("The buffer is already draining another subscription")
+        self._draining = True
+        self._events.clear()
+        self._closed = False
+        self._exception = None
+
+        pump = asyncio.create_task(self.apump(events))  # type: ignore
+        try:
+            while True:
+                try:
+                    yield await self.aget()  # type: ignore
+                except StopAsyncIteration:
+                    return
+        finally:
+            pump.cancel()
+            try:
+                await pump
+            except asyncio.CancelledError:
+                pass
+            self._draining = False
@@ -0,0 +1,165 @@
+"""An opt-in response cache for read queries.
+
+Responses are cached keyed on the operation document and its canonicalized
+variables. Every operation has its own time to live, the cache is bounded by
+the (serialized) size of the cached responses, and entries are evicted in
+least recently used order. Mutations invalidate every cached response that
+contains an entity of a type the mutation returned.
+
+Example:
+    ```python
+    rath = KabinetRath(
+        link=...,
+        cache=ResponseCache(ttls={"GetRelease": 300, "ListFlavours": 30}),
+    )
+    ```
+"""
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Set, Tuple
+
+from graphql import OperationType
+from pydantic import BaseModel, PrivateAttr
+
+from kabinet.documents import get_operation_name, get_operation_type
+
+CacheKey = Tuple[str, str]
+
+
+def collect_typenames(data: Any, typenames: Optional[Set[str]] = None) -> Set[str]:  # noqa: ANN401
+    """Collect the ``__typename`` of every entity in a response."""
+    if typenames is None:
+        typenames = set()
+    if isinstance(data, dict):
+        typename = data.get("__typename")
+        if isinstance(typename, str):
+            typenames.add(typename)
+        for value in data.values():  # type: ignore
+            collect_typenames(value, typenames)
+    elif isinstance(data, list):
+        for value in data:  # type: ignore
+            collect_typenames(value, typenames)
+    return typenames
+
+
+def canonicalize(variables: Dict[str, Any]) -> str:
+    """A canonical string representation of serialized variables."""
+    return json.dumps(variables, sort_keys=True, separators=(",", ":"), default=str)
+
+
+@dataclass
+class CacheEntry:
+    """A cached response."""
+
+    data: Dict[str, Any]
+    """The data of the response"""
+    expires_at: float
+    """The monotonic time after which the entry is stale"""
+    size: int
+    """The size of the serialized response in bytes"""
+    typenames: FrozenSet[str]
+    """The typenames of all entities in the response"""
+
+
+class ResponseCache(BaseModel):
+    """A TTL and size bounded LRU cache for query responses.
+
+    Only queries that have a TTL (either in ``ttls`` or through
+    ``default_ttl``) are cached.
+    """
+
+    ttls: Dict[str, float] = {}
+    """The time to live in seconds per operation name, e.g. ``{"GetRelease": 300}``"""
+    default_ttl: Optional[float] = None
+    """The time to live of operations without an explicit TTL (None disables caching them)"""
+    max_bytes: int = 16 * 1024 * 1024
+    """The maximum total size of the cached responses in bytes"""
+
+    hits: int = 0
+    """The number of lookups that were served from the cache"""
+    misses: int = 0
+    """The number of lookups of cacheable queries that were not in the cache"""
+    evictions: int = 0
+    """The number of entries evicted to stay below ``max_bytes``"""
+    invalidations: int = 0
+    """The number of entries invalidated by mutations"""
+
+    _entries: "OrderedDict[CacheKey, CacheEntry]" = PrivateAttr(default_factory=OrderedDict)
+    _size: int = PrivateAttr(default=0)
+
+    @property
+    def size(self) -> int:
+        """The current total size of the cached responses in bytes."""
+        return self._size
+
+    def ttl_for(self, document: str) -> Optional[float]:
+        """The time to live for a query, or None if it should not be cached."""
+        return self.ttls.get(get_operation_name(document), self.default_ttl)
+
+    def get(self, document: str, variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cached data for an operation, if present and fresh."""
+        if get_operation_type(document) != OperationType.QUERY or not self.ttl_for(document):
+            return None
+
+        key = (document, canonicalize(variables))
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at < time.monotonic():
+            if entry is not None:
+                self.remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.data
+
+    def put(self, document: str, variables: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Cache the response of a query, or invalidate on the response of a mutation."""
+        operation_type = get_operation_type(document)
+
+        if operation_type == OperationType.MUTATION:
+            self.invalidate(collect_typenames(data))
+            return
+
+        ttl = self.ttl_for(document)
+        if operation_type != OperationType.QUERY or not ttl:
+            return
+
+        key = (document, canonicalize(variables))
+        if key in self._entries:
+            self.remove(key)
+
+        entry = CacheEntry(
+            data=data,
+            expires_at=time.monotonic() + ttl,
+            size=len(json.dumps(data, default=str)),
+            typenames=frozenset(collect_typenames(data)),
+        )
+        if entry.size > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self._size += entry.size
+        while self._size > self.max_bytes:
+            self.remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, typenames: Set[str]) -> None:
+        """Remove all entries that contain an entity of one of the typenames."""
+        stale = [key for key, entry in self._entries.items() if entry.typenames & typenames]
+        for key in stale:
+            self.remove(key)
+        self.invalidations += len(stale)
+
+    def remove(self, key: CacheKey) -> None:
+        """Remove a single entry."""
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._size = 0
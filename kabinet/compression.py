@@ -0,0 +1,113 @@
+"""Compression codecs for the bodies of GraphQL over HTTP requests and responses.
+
+``gzip`` (and ``deflate``) are always available. ``zstd`` is available if
+the optional ``zstandard`` package is installed (``pip install kabinet[zstd]``).
+
+Example:
+    ```python
+    link = KabinetAIOHttpLink(
+        endpoint_url=...,
+        compression="zstd",
+        compression_threshold=1024,
+        accept_compression=True,
+    )
+    ```
+"""
+
+import zlib
+from typing import Callable, Dict, List, Optional, Protocol
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class Decompressor(Protocol):
+    """Incrementally decompresses a body."""
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress the next chunk of the body."""
+        ...
+
+    def flush(self) -> bytes:
+        """Return whatever is left once the body is complete."""
+        ...
+
+
+class Codec:
+    """A content encoding, e.g. ``gzip``."""
+
+    def __init__(
+        self,
+        name: str,
+        compress: Callable[[bytes], bytes],
+        decompressor: Callable[[], Decompressor],
+    ) -> None:
+        """Create a codec for the ``Content-Encoding`` ``name``."""
+        self.name = name
+        self.compress = compress
+        self.decompressor = decompressor
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress a complete body."""
+        decompressor = self.decompressor()
+        return decompressor.decompress(data) + decompressor.flush()
+
+
+def gzip_compress(data: bytes) -> bytes:
+    """Compress a body with gzip, at a level that favours speed."""
+    compressor = zlib.compressobj(1, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    return compressor.compress(data) + compressor.flush()
+
+
+CODECS: Dict[str, Codec] = {
+    "gzip": Codec(
+        "gzip", gzip_compress, lambda: zlib.decompressobj(zlib.MAX_WBITS | 16)
+    ),
+    "deflate": Codec("deflate", zlib.compress, zlib.decompressobj),
+}
+
+if zstandard is not None:
+    CODECS["zstd"] = Codec(
+        "zstd",
+        zstandard.ZstdCompressor(level=3).compress,
+        lambda: zstandard.ZstdDecompressor().decompressobj(),
+    )
+
+PREFERENCE = ["zstd", "gzip", "deflate"]
+
+
+def get_codec(name: str) -> Codec:
+    """The codec of a content encoding.
+
+    Raises:
+        ValueError: If the encoding is unknown, or needs a package that is not installed
+    """
+    codec = CODECS.get(name.strip().lower())
+    if codec is None:
+        if name == "zstd":
+            raise ValueError("zstd compression needs the zstandard package to be installed")
+        raise ValueError(f"Unsupported content encoding {name!r}")
+    return codec
+
+
+def available_encodings() -> List[str]:
+    """The available encodings, most preferred first."""
+    return [name for name in PREFERENCE if name in CODECS]
+
+
+def accept_encoding() -> str:
+    """The value of an ``Accept-Encoding`` header offering every available encoding."""
+    return ", ".join(available_encodings())
+
+
+def negotiate(accept: Optional[str]) -> Optional[Codec]:
+    """The most preferred available codec of an ``Accept-Encoding`` header, if any."""
+    if not accept:
+        return None
+    offered = {part.split(";")[0].strip().lower() for part in accept.split(",")}
+    for name in available_encodings():
+        if name in offered:
+            return CODECS[name]
+    return None
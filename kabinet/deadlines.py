@@ -0,0 +1,73 @@
+"""Deadlines for operations, per call or for a whole scope.
+
+A deadline is the point in time by which an operation has to complete. It
+is either passed per call (``aexecute(..., timeout=2)``) or set for every
+operation in a scope with :func:`deadline`. Nested scopes and per call
+timeouts can only shorten the deadline, never extend it. When the deadline
+passes, the request is cancelled and :class:`DeadlineExceeded` is raised.
+
+Example:
+    ```python
+    with deadline(5):
+        flavour = await aget_flavour(id)
+        pods = await alist_pods()  # Both together have 5 seconds
+    ```
+"""
+
+import asyncio
+import contextvars
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, Optional
+
+from kabinet.errors import DeadlineExceeded
+
+current_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "current_deadline", default=None
+)
+
+
+def resolve_deadline(timeout: Optional[float] = None) -> Optional[float]:
+    """The monotonic time by which an operation with ``timeout`` has to complete."""
+    scoped = current_deadline.get()
+    if timeout is None:
+        return scoped
+    own = time.monotonic() + timeout
+    return own if scoped is None else min(scoped, own)
+
+
+def remaining(timeout: Optional[float] = None) -> Optional[float]:
+    """The seconds left until the deadline, or None if there is none."""
+    at = resolve_deadline(timeout)
+    return None if at is None else max(at - time.monotonic(), 0)
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[None]:
+    """Give every operation in this context ``timeout`` seconds in total to complete."""
+    token = current_deadline.set(resolve_deadline(timeout))
+    try:
+        yield
+    finally:
+        current_deadline.reset(token)
+
+
+@asynccontextmanager
+async def within_deadline(timeout: Optional[float] = None) -> AsyncIterator[None]:
+    """Cancel the body when the deadline passes, raising :class:`DeadlineExceeded`."""
+    at = resolve_deadline(timeout)
+    if at is None:
+        yield
+        return
+
+    token = current_deadline.set(at)
+    timeout_cm = asyncio.timeout(max(at - time.monotonic(), 0))
+    try:
+        async with timeout_cm:
+            yield
+    except TimeoutError as e:
+        if not timeout_cm.expired() or isinstance(e, DeadlineExceeded):
+            raise
+        raise DeadlineExceeded("The operation did not complete before its deadline") from e
+    finally:
+        current_deadline.reset(token)
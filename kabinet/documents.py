@@ -0,0 +1,33 @@
+"""Cached introspection of the documents of turms operations."""
+
+from functools import lru_cache
+from typing import Tuple
+
+from graphql import FragmentDefinitionNode, OperationDefinitionNode, OperationType, parse
+
+
+@lru_cache(maxsize=256)
+def parse_operation_document(
+    document: str,
+) -> Tuple[OperationDefinitionNode, Tuple[FragmentDefinitionNode, ...]]:
+    """Parse a turms document into its operation and its fragments."""
+    parsed = parse(document)
+    operations = [d for d in parsed.definitions if isinstance(d, OperationDefinitionNode)]
+    fragments = tuple(d for d in parsed.definitions if isinstance(d, FragmentDefinitionNode))
+
+    if len(operations) != 1:
+        raise ValueError("Turms documents need to contain exactly one operation.")
+
+    return operations[0], fragments
+
+
+def get_operation_name(document: str) -> str:
+    """The name of the operation in a turms document, e.g. ``GetRelease``."""
+    operation, _ = parse_operation_document(document)
+    return operation.name.value if operation.name else "Unnamed Operation"
+
+
+def get_operation_type(document: str) -> OperationType:
+    """The type (query, mutation or subscription) of a turms document."""
+    operation, _ = parse_operation_document(document)
+    return operation.operation
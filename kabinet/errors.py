@@ -7,3 +7,20 @@ class NoKabinetFound(Exception):
     This error is raised when a function that requires a kabinet
     is called without a kabinet in the current context.
     """
+
+
+class BatchingError(Exception):
+    """Operations could not be merged into a single batch.
+
+    This error is raised when operations that cannot share a single
+    document (e.g. subscriptions, or queries mixed with mutations)
+    are passed to a batched executor.
+    """
+
+
+class DeadlineExceeded(TimeoutError):
+    """An operation did not complete before its deadline.
+
+    This error is raised when the timeout of a call (or of the enclosing
+    ``deadline`` scope) expires. The underlying request is cancelled.
+    """
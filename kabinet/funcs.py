@@ -5,64 +5,377 @@ allow you to execute queries and mutations using thre rekuest-rath client.
 
 """
 
-from typing import Any, Dict, Generator, AsyncGenerator, Type
+import time
+from contextlib import aclosing
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    AsyncGenerator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    get_args,
+)
 from kabinet.rath import KabinetRath, current_kabinet_rath
 from koil import unkoil, unkoil_gen
 from rath.turms.funcs import TOperation
+from .batching import merge_operations, split_data
+from .buffering import SubscriptionBuffer
+from .deadlines import within_deadline
+from .documents import get_operation_name
 from .errors import NoKabinetFound
+from .metrics import OperationSample, finish_sample, start_sample
+from .priority import Priority, request_priority
+from .variables import variable_cache
+
+
+def build_result(
+    operation: Type[TOperation],
+    data: Dict[str, Any],
+    rath: KabinetRath,
+    sample: Optional[OperationSample] = None,
+) -> TOperation:
+    """Builds the typed result of an operation from the data of a response.
+
+    The time spent validating is added to the ``sample``, if the operation
+    is measured.
+    """
+    if sample is None and rath.tracer is None:
+        return operation(**data)
+
+    span = rath.tracer.start_span("parse") if rath.tracer is not None else None
+    start = time.perf_counter()
+    result = operation(**data)
+    if sample is not None:
+        sample.validation_time += time.perf_counter() - start
+    if span is not None:
+        rath.tracer.end_span(span)  # type: ignore
+    return result
+
+
+def start_measuring(rath: KabinetRath, document: str) -> Optional[OperationSample]:
+    """Start a sample of an operation, if the rath has a metrics sink or a slow log."""
+    if rath.metrics is None and rath.slow_log is None:
+        return None
+    return start_sample(document)
+
+
+def finish_measuring(
+    rath: KabinetRath, sample: OperationSample, error: Optional[BaseException] = None
+) -> None:
+    """Complete a sample and hand it to the metrics sink and the slow log of the rath."""
+    finish_sample(sample, error)
+    if rath.metrics is not None:
+        rath.metrics.record(sample)
+    if rath.slow_log is not None:
+        rath.slow_log.record(sample)
 
 
 def execute(
     operation: Type[TOperation],
     variables: Dict[str, Any],
     rath: KabinetRath | None = None,
+    timeout: Optional[float] = None,
+    priority: Optional[Priority] = None,
+    idempotent: bool = False,
 ) -> TOperation:
     """Executes a query or mutation using rath in a blocking way."""
-    return unkoil(aexecute, operation, variables, rath)
+    return unkoil(aexecute, operation, variables, rath, timeout, priority, idempotent)
 
 
 async def aexecute(
     operation: Type[TOperation],
     variables: Dict[str, Any],
     rath: KabinetRath | None = None,
+    timeout: Optional[float] = None,
+    priority: Optional[Priority] = None,
+    idempotent: bool = False,
 ) -> TOperation:
-    """Executes a query or mutation using rath in a non-blocking way."""
+    """Executes a query or mutation using rath in a non-blocking way.
+
+    The request is cancelled, raising ``DeadlineExceeded``, if it has not
+    completed within ``timeout`` seconds or before the deadline of the
+    enclosing ``deadline`` scope, whichever comes first.
+
+    With a ``priority``, the request is queued with that priority when a
+    limit of the rath is saturated (see ``kabinet.priority``).
+
+    A mutation marked as ``idempotent`` is retried after transient failures
+    like a query, if the rath has a ``KabinetRetryLink``.
+
+    Variables holding the same frozen inputs as an earlier call reuse its
+    serialized payload (see ``kabinet.variables``).
+    """
+    if priority is not None:
+        with request_priority(priority):
+            return await aexecute(operation, variables, rath, timeout, idempotent=idempotent)
+
     rath = rath or current_kabinet_rath.get()
     if not rath:
         raise NoKabinetFound(
             "No rath client found in context. Please provide a rath client."
         )
 
-    x = await rath.aquery(
-        operation.Meta.document,
-        operation.Arguments(**variables).model_dump(by_alias=True, exclude_unset=True),
-    )
-    return operation(**x.data)
+    if rath.metrics is None and rath.slow_log is None and rath.tracer is None:
+        serialized = variable_cache.serialize(operation, variables)
+        return await aexecute_serialized(
+            operation, serialized, rath, timeout, idempotent=idempotent
+        )
+
+    document = operation.Meta.document
+    span = rath.tracer.start_span(get_operation_name(document)) if rath.tracer else None
+    sample = start_measuring(rath, document)
+    error = None
+    try:
+        serialized = variable_cache.serialize(operation, variables)
+        if sample is not None:
+            sample.variables, sample.span = serialized, span
+        return await aexecute_serialized(operation, serialized, rath, timeout, sample, idempotent)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        if span is not None:
+            rath.tracer.end_span(span, error)  # type: ignore
+        if sample is not None:
+            finish_measuring(rath, sample, error)
+
+
+async def aexecute_serialized(
+    operation: Type[TOperation],
+    serialized: Dict[str, Any],
+    rath: KabinetRath,
+    timeout: Optional[float] = None,
+    sample: Optional[OperationSample] = None,
+    idempotent: bool = False,
+) -> TOperation:
+    """Executes a query or mutation whose variables are already serialized.
+
+    The ``sample`` is passed down the link chain, so that the transport can
+    report the sizes of the payloads (see ``kabinet.metrics``).
+    """
+    if rath.cache is not None:
+        cached = rath.cache.get(operation.Meta.document, serialized)
+        if cached is not None:
+            if sample is not None:
+                sample.cached = True
+            return build_result(operation, cached, rath, sample)
+
+    async def afetch() -> Dict[str, Any]:
+        if rath.loader is not None and rath.loader.handles(operation):
+            return await rath.loader.aload(operation, serialized, rath)
+        return (
+            await rath.aquery(
+                operation.Meta.document, serialized, sample=sample, idempotent=idempotent
+            )
+        ).data
+
+    async with within_deadline(timeout):
+        if rath.hedging is not None and rath.hedging.handles(operation):
+            data = await rath.hedging.aexecute(operation, afetch)
+        else:
+            data = await afetch()
+
+    if rath.cache is not None:
+        rath.cache.put(operation.Meta.document, serialized, data)
+
+    return build_result(operation, data, rath, sample)
 
 
 def subscribe(
     operation: Type[TOperation],
     variables: Dict[str, Any],
     rath: KabinetRath | None = None,
+    buffer: Optional[SubscriptionBuffer[TOperation]] = None,
 ) -> Generator[TOperation, None, None]:
     """Subscribes to a query or mutation using rath in a blocking way."""
-    return unkoil_gen(asubscribe, operation, variables, rath)
+    return unkoil_gen(asubscribe, operation, variables, rath, buffer)
 
 
 async def asubscribe(
     operation: Type[TOperation],
     variables: Dict[str, Any],
     rath: KabinetRath | None = None,
+    buffer: Optional[SubscriptionBuffer[TOperation]] = None,
 ) -> AsyncGenerator[TOperation, None]:
-    """Subscribes to a query or mutation using rath in a non-blocking way."""
+    """Subscribes to a query or mutation using rath in a non-blocking way.
+
+    With a ``buffer``, events are received in the background and handed to
+    the caller through the bounded buffer, applying its overflow policy
+    when the caller falls behind.
+    """
     rath = rath or current_kabinet_rath.get()
     if not rath:
         raise NoKabinetFound(
             "No rath client found in context. Please provide a rath client."
         )
 
-    async for event in rath.asubscribe(
-        operation.Meta.document,
-        operation.Arguments(**variables).model_dump(by_alias=True, exclude_unset=True),
-    ):
-        yield operation(**event.data)
+    serialized = variable_cache.serialize(operation, variables)
+    sample = start_measuring(rath, operation.Meta.document)
+    if sample is not None:
+        sample.variables = serialized
+
+    async def aevents() -> AsyncGenerator[TOperation, None]:
+        if rath.hub is not None and rath.hub.handles(operation):
+            async with aclosing(rath.hub.asubscribe(operation, serialized, rath)) as results:
+                async for data in results:
+                    yield build_result(operation, data, rath, sample=sample)
+        else:
+            async for event in rath.asubscribe(
+                operation.Meta.document, serialized, sample=sample
+            ):
+                yield build_result(operation, event.data, rath, sample=sample)
+
+    events = aevents() if buffer is None else buffer.adrain(aevents())
+    error = None
+    try:
+        async with aclosing(events):
+            async for event in events:
+                yield event
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        if sample is not None:
+            finish_measuring(rath, sample, error)
+
+
+@lru_cache(maxsize=None)
+def get_stream_target(operation: Type[Any]) -> Tuple[str, Type[Any]]:
+    """The response key and the item model of the single list field of an operation."""
+    if len(operation.model_fields) != 1:
+        raise ValueError(f"{operation.__name__} needs exactly one root field to be streamed")
+    name, field = next(iter(operation.model_fields.items()))
+    return field.alias or name, get_args(field.annotation)[0]
+
+
+def stream(
+    operation: Type[Any],
+    variables: Dict[str, Any],
+    rath: KabinetRath | None = None,
+) -> Generator[Any, None, None]:
+    """Streams the items of a list query using rath in a blocking way."""
+    return unkoil_gen(astream, operation, variables, rath)
+
+
+async def astream(
+    operation: Type[Any],
+    variables: Dict[str, Any],
+    rath: KabinetRath | None = None,
+) -> AsyncGenerator[Any, None]:
+    """Streams the items of a list query using rath in a non-blocking way.
+
+    Transports that support it (e.g. the ``KabinetAIOHttpLink``) decode the
+    items while the response is received, so that only the current item
+    needs to be held in memory. Other transports return the whole list at
+    once, which is then yielded item by item. Streams always read from the
+    server and skip the response cache of the rath, which would need to hold
+    the whole list.
+
+    Example:
+        ```python
+        async for release in astream(ListReleasesQuery, {}):
+            print(release.version)
+        ```
+    """
+    rath = rath or current_kabinet_rath.get()
+    if not rath:
+        raise NoKabinetFound(
+            "No rath client found in context. Please provide a rath client."
+        )
+
+    key, item = get_stream_target(operation)
+    serialized = variable_cache.serialize(operation, variables)
+    sample = start_measuring(rath, operation.Meta.document)
+    if sample is not None:
+        sample.variables = serialized
+    error = None
+    try:
+        async for result in rath.asubscribe(
+            operation.Meta.document,
+            serialized,
+            stream_field=key,
+            sample=sample,
+        ):
+            for data in result.data[key]:
+                yield build_result(item, data, rath, sample)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        if sample is not None:
+            finish_measuring(rath, sample, error)
+
+
+def execute_many(
+    operations: Sequence[Tuple[Type[Any], Dict[str, Any]]],
+    rath: KabinetRath | None = None,
+) -> List[Any]:
+    """Executes several queries or mutations in one request in a blocking way."""
+    return unkoil(aexecute_many, operations, rath)
+
+
+async def aexecute_many(
+    operations: Sequence[Tuple[Type[Any], Dict[str, Any]]],
+    rath: KabinetRath | None = None,
+) -> List[Any]:
+    """Executes several queries or mutations in one request in a non-blocking way.
+
+    The operations are merged into a single aliased document, sent in one
+    round trip, and the response is split back into the typed operations,
+    in the order they were passed. The responses update the response cache
+    of the rath like those of ``aexecute`` (mutations invalidate the cached
+    reads they affect), but are never served from it.
+
+    Example:
+        ```python
+        pod, flavour = await aexecute_many(
+            [
+                (GetPodQuery, {"id": "1"}),
+                (GetFlavourQuery, {"id": "2"}),
+            ]
+        )
+        ```
+    """
+    rath = rath or current_kabinet_rath.get()
+    if not rath:
+        raise NoKabinetFound(
+            "No rath client found in context. Please provide a rath client."
+        )
+
+    serialized = [
+        variable_cache.serialize(operation, variables) for operation, variables in operations
+    ]
+    document, merged_variables = merge_operations(
+        [
+            (operation.Meta.document, variables)
+            for (operation, _), variables in zip(operations, serialized)
+        ]
+    )
+
+    sample = start_measuring(rath, document)
+    if sample is not None:
+        sample.variables = merged_variables
+    error = None
+    try:
+        async with within_deadline():
+            x = await rath.aquery(document, merged_variables, sample=sample)
+        results = split_data(x.data, len(operations))
+        if rath.cache is not None:
+            # Mutations invalidate the cached reads they affect, queries are cached
+            for (operation, _), variables, data in zip(operations, serialized, results):
+                rath.cache.put(operation.Meta.document, variables, data)
+        return [
+            build_result(operation, data, rath, sample=sample)
+            for (operation, _), data in zip(operations, results)
+        ]
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        if sample is not None:
+            finish_measuring(rath, sample, error)
@@ -0,0 +1,155 @@
+"""Hedged requests for idempotent queries, to cut tail latency.
+
+If a hedged query has not returned after the (recent) 95th percentile of its
+latency, a second copy is sent and whichever answers first is used, while
+the other one is cancelled. Only a few percent of the requests are sent
+twice, but a single slow request no longer determines the latency.
+
+The copy that is cancelled still counts towards the percentile with the
+time it had been waiting, so that the delay grows when the server slows
+down. On top of that, at most a ``budget`` fraction of the recent requests
+of an operation is hedged, so a slow server never gets twice the traffic.
+
+Only idempotent queries should be hedged. By default these are the flavour
+lookups that agents send on every reconcile.
+
+Example:
+    ```python
+    rath = KabinetRath(link=..., hedging=HedgedReads())
+    ```
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Set, Type, TypeVar
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from kabinet.documents import get_operation_name
+
+T = TypeVar("T")
+
+
+def default_hedged_operations() -> Set[str]:
+    """The idempotent queries of the kabinet api that are hedged by default."""
+    return {"GetFlavour", "MatchFlavour"}
+
+
+class HedgedReads(BaseModel):
+    """Sends a second copy of slow idempotent queries."""
+
+    operations: Set[str] = Field(default_factory=default_hedged_operations)
+    """The queries that are hedged, by operation name, e.g. ``GetFlavour``"""
+    percentile: float = 0.95
+    """The latency percentile after which a second copy is sent"""
+    window: int = 200
+    """The number of recent latencies the percentile is computed from, per operation"""
+    min_samples: int = 20
+    """The number of latencies needed before the percentile is used"""
+    default_delay: float = 0.5
+    """The delay in seconds before a second copy is sent, until ``min_samples`` are known"""
+    budget: float = 0.1
+    """The largest fraction of the recent requests of an operation that is hedged"""
+
+    hedged: int = 0
+    """The number of requests for which a second copy was sent"""
+    hedge_wins: int = 0
+    """The number of hedged requests that the second copy answered first"""
+    over_budget: int = 0
+    """The number of slow requests that were not hedged because the budget was spent"""
+
+    _latencies: Dict[str, Deque[float]] = PrivateAttr(default_factory=dict)
+    _hedges: Dict[str, Deque[bool]] = PrivateAttr(default_factory=dict)
+
+    def handles(self, operation: Type[Any]) -> bool:
+        """Whether requests of this operation are hedged."""
+        return get_operation_name(operation.Meta.document) in self.operations
+
+    def delay_for(self, name: str) -> float:
+        """The delay after which a second copy of an operation is sent."""
+        latencies = self._latencies.get(name)
+        if latencies is None or len(latencies) < self.min_samples:
+            return self.default_delay
+        ordered = sorted(latencies)
+        return ordered[min(int(len(ordered) * self.percentile), len(ordered) - 1)]
+
+    def record(self, name: str, latency: float) -> None:
+        """Record the latency of a completed (or cancelled) request."""
+        latencies = self._latencies.get(name)
+        if latencies is None:
+            latencies = self._latencies[name] = deque(maxlen=self.window)
+        latencies.append(latency)
+
+    def within_budget(self, name: str) -> bool:
+        """Whether another request of an operation may be hedged.
+
+        The budget applies to at least ``min_samples`` requests, so that the
+        first slow requests can be hedged too.
+        """
+        recent = self._hedges.get(name, ())
+        return sum(recent) < self.budget * max(len(recent), self.min_samples)
+
+    def note(self, name: str, hedged: bool) -> None:
+        """Note whether a request was hedged, for the budget."""
+        hedges = self._hedges.get(name)
+        if hedges is None:
+            hedges = self._hedges[name] = deque(maxlen=self.window)
+        hedges.append(hedged)
+
+    async def atimed(self, name: str, afetch: Callable[[], Awaitable[T]]) -> T:
+        """Send one copy of a request, recording its latency if it succeeds."""
+        start = time.monotonic()
+        result = await afetch()
+        self.record(name, time.monotonic() - start)
+        return result
+
+    async def aexecute(self, operation: Type[Any], afetch: Callable[[], Awaitable[T]]) -> T:
+        """Execute a request, sending a second copy if the first one is slow.
+
+        Args:
+            operation: The hedged operation, e.g. ``GetFlavourQuery``
+            afetch: Sends one copy of the request
+
+        Returns:
+            The result of whichever copy succeeded first.
+        """
+        name = get_operation_name(operation.Meta.document)
+        starts: Dict["asyncio.Future[T]", float] = {}
+        first = asyncio.ensure_future(self.atimed(name, afetch))
+        starts[first] = time.monotonic()
+        try:
+            done, _ = await asyncio.wait({first}, timeout=self.delay_for(name))
+            if not done and not self.within_budget(name):
+                self.over_budget += 1
+                self.note(name, False)
+                return await first
+        except BaseException:
+            first.cancel()
+            raise
+        self.note(name, not done)
+        if done:
+            return first.result()
+
+        self.hedged += 1
+        second = asyncio.ensure_future(self.atimed(name, afetch))
+        starts[second] = time.monotonic()
+        pending = {first, second}
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    for task in pending:
+                        # The slower copy took at least this long, which the percentile must see
+                        self.record(name, time.monotonic() - starts[task])
+                    if first in succeeded:
+                        return first.result()
+                    self.hedge_wins += 1
+                    return second.result()
+                # A failed copy only counts if the other one fails too
+                if not pending:
+                    return done.pop().result()
+        finally:
+            for task in pending:
+                task.cancel()
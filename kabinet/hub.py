@@ -0,0 +1,153 @@
+"""Local demultiplexing of pod subscriptions over a single ``pods`` stream.
+
+Every ``awatch_pod`` opens its own subscription on the server, so watching
+hundreds of pods means hundreds of server side subscriptions. With a
+:class:`PodHub` on the rath, all ``WatchPod`` subscriptions share one
+``pods`` subscription instead, whose updates are routed to the watchers of
+each pod locally. The shared subscription is opened for the first watcher
+and closed again once the last watcher has stopped.
+
+Example:
+    ```python
+    rath = KabinetRath(link=..., hub=PodHub())
+
+    async with rath:
+        # Both share the same upstream subscription
+        async for update in awatch_pod(pod_id):
+            ...
+    ```
+"""
+
+import asyncio
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Set, Type
+
+from pydantic import BaseModel, PrivateAttr, field_validator
+
+from kabinet.buffering import OverflowPolicy, SubscriptionBuffer
+
+if TYPE_CHECKING:
+    from kabinet.rath import KabinetRath
+
+Message = Dict[str, Any]
+
+
+def message_id(message: Message) -> str:
+    """The ID of the pod a ``PodUpdateMessage`` is about."""
+    return message["id"]
+
+
+class PodHub(BaseModel):
+    """Routes the updates of one shared ``pods`` subscription to per-pod watchers.
+
+    Every watcher has its own bounded buffer, so that a slow watcher never
+    holds back the others. The buffers therefore drop or coalesce updates
+    when they are full: with ``BLOCK``, one full buffer would stall the
+    shared subscription for every watcher, so it is not allowed.
+    """
+
+    maxsize: int = 1000
+    """The maximum number of updates buffered per watcher"""
+    policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    """What to do with new updates when a watcher's buffer is full"""
+
+    _watchers: Dict[Optional[str], Set[SubscriptionBuffer[Message]]] = PrivateAttr(
+        default_factory=dict
+    )
+    _upstream: Optional["asyncio.Task[None]"] = PrivateAttr(default=None)
+
+    @field_validator("policy")
+    @classmethod
+    def check_policy(cls, value: OverflowPolicy) -> OverflowPolicy:
+        """Refuse ``BLOCK``, with which one slow watcher would stall all others."""
+        if value == OverflowPolicy.BLOCK:
+            raise ValueError(
+                "A hub cannot block on a full watcher without stalling all others, "
+                "use drop_oldest or latest"
+            )
+        return value
+
+    @property
+    def watchers(self) -> int:
+        """The number of active watchers."""
+        return sum(len(buffers) for buffers in self._watchers.values())
+
+    @property
+    def connected(self) -> bool:
+        """Whether the shared subscription is currently open."""
+        return self._upstream is not None and not self._upstream.done()
+
+    def handles(self, operation: Type[Any]) -> bool:
+        """Whether subscriptions through this operation are routed through the hub."""
+        return operation.__name__ == "WatchPodSubscription"
+
+    async def asubscribe(
+        self, operation: Type[Any], variables: Dict[str, Any], rath: "KabinetRath"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the data of a ``WatchPod`` subscription from the shared stream.
+
+        Args:
+            operation: The subscription, i.e. ``WatchPodSubscription``
+            variables: The serialized variables of the subscription
+            rath: The rath that opens the shared subscription
+
+        Yields:
+            The data of every update, as if the subscription was opened on its own.
+        """
+        async with aclosing(self.awatch(variables["podId"], rath)) as messages:
+            async for message in messages:
+                yield {"pod": message}
+
+    async def awatch(
+        self, pod_id: Optional[str], rath: "KabinetRath"
+    ) -> AsyncIterator[Message]:
+        """Yield the update messages of a pod (or of all pods, if ``pod_id`` is None)."""
+        buffer: SubscriptionBuffer[Message] = SubscriptionBuffer(
+            maxsize=self.maxsize, policy=self.policy, key=message_id
+        )
+        self._watchers.setdefault(pod_id, set()).add(buffer)
+        if not self.connected:
+            self._upstream = asyncio.create_task(self.arun(rath))
+
+        try:
+            while True:
+                try:
+                    yield await buffer.aget()
+                except StopAsyncIteration:
+                    return
+        finally:
+            await self.aunwatch(pod_id, buffer)
+
+    async def aunwatch(self, pod_id: Optional[str], buffer: SubscriptionBuffer[Message]) -> None:
+        """Remove a watcher, closing the shared subscription if it was the last one."""
+        buffers = self._watchers.get(pod_id, set())
+        buffers.discard(buffer)
+        if not buffers:
+            self._watchers.pop(pod_id, None)
+
+        if not self._watchers and self._upstream is not None:
+            upstream, self._upstream = self._upstream, None
+            upstream.cancel()
+            try:
+                await upstream
+            except asyncio.CancelledError:
+                pass
+
+    async def arun(self, rath: "KabinetRath") -> None:
+        """Receive the shared subscription and route its updates to the watchers."""
+        from kabinet.api.schema import WatchPodsSubscription
+
+        error: Optional[BaseException] = None
+        try:
+            async for result in rath.asubscribe(WatchPodsSubscription.Meta.document, {}):
+                message = result.data["pods"]
+                for pod_id in (message_id(message), None):
+                    for buffer in list(self._watchers.get(pod_id, ())):
+                        await buffer.aput(message)
+        except Exception as e:
+            error = e
+
+        # The subscription ended (or failed), which ends every watcher
+        for buffers in list(self._watchers.values()):
+            for buffer in list(buffers):
+                await buffer.aclose(error)
@@ -0,0 +1,153 @@
+"""Incremental decoding of the items of one array in a GraphQL response.
+
+The :class:`ArrayItemDecoder` is fed the text of a response chunk by chunk.
+It only keeps the part of the text that belongs to the item it is currently
+decoding, so that memory stays proportional to a single item rather than to
+the whole response. Everything outside of the requested array is skipped,
+except for a top level ``errors`` array, which is kept so that it can be
+raised once the response is complete.
+
+Example:
+    ```python
+    decoder = ArrayItemDecoder(("data", "releases"))
+    async for chunk in response.content.iter_chunked(65536):
+        for release in decoder.feed(chunk):
+            ...
+    decoder.close()
+    ```
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+TOKEN = re.compile(r'["{}\[\]]')
+STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+WHITESPACE = re.compile(r"\s*")
+
+ERRORS_PATH = ("errors",)
+
+
+class StreamDecodeError(ValueError):
+    """Raised when a streamed response is not valid (or not complete) JSON."""
+
+
+class Frame:
+    """An open object or array while scanning the response."""
+
+    __slots__ = ("kind", "key", "target")
+
+    def __init__(self, kind: str, key: Optional[str] = None) -> None:
+        """Open a frame of the given kind (``{`` or ``[``)."""
+        self.kind = kind
+        self.key = key
+        self.target = False
+
+
+class ArrayItemDecoder:
+    """Decodes the items of the array at ``path`` from a stream of JSON text."""
+
+    def __init__(
+        self, path: Sequence[str], loads: Callable[[str], Any] = json.loads
+    ) -> None:
+        """Create a decoder for the array at ``path``, e.g. ``("data", "releases")``.
+
+        Every item is parsed with ``loads``.
+        """
+        self.path = tuple(path)
+        self.loads = loads
+        self.found = False
+        self.errors: Optional[List[Any]] = None
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._stack: List[Frame] = []
+        self._capture: Optional[int] = None
+        self._capture_depth = 0
+        self._capture_errors = False
+
+    def _path(self) -> Tuple[Optional[str], ...]:
+        return tuple(frame.key for frame in self._stack)
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Feed the next chunk of the response, returning the items it completed."""
+        self._buffer += self._utf8.decode(chunk)
+        items = self._scan()
+        self._trim()
+        return items
+
+    def close(self) -> None:
+        """Signal the end of the response, checking that it was complete."""
+        self._buffer += self._utf8.decode(b"", final=True)
+        self._scan()
+        if self._stack or self._buffer[self._pos :].strip():
+            raise StreamDecodeError("The response ended before the JSON document was complete")
+
+    def _scan(self) -> List[Any]:
+        items: List[Any] = []
+        buffer = self._buffer
+
+        while True:
+            match = TOKEN.search(buffer, self._pos)
+            if match is None:
+                self._pos = len(buffer)
+                return items
+
+            char = match.group()
+            index = match.start()
+
+            if char == '"':
+                string = STRING.match(buffer, index)
+                if string is None:
+                    # The string continues in the next chunk
+                    self._pos = index
+                    return items
+                if self._capture is None and self._stack and self._stack[-1].kind == "{":
+                    after = WHITESPACE.match(buffer, string.end()).end()
+                    if after == len(buffer):
+                        self._pos = index
+                        return items
+                    if buffer[after] == ":":
+                        self._stack[-1].key = json.loads(string.group())
+                self._pos = string.end()
+                continue
+
+            self._pos = index + 1
+
+            if char in "{[":
+                parent = self._stack[-1] if self._stack else None
+                if self._capture is None:
+                    if parent is not None and parent.target:
+                        self._capture = index
+                        self._capture_depth = len(self._stack)
+                    elif char == "[" and self._path() == ERRORS_PATH:
+                        self._capture = index
+                        self._capture_depth = len(self._stack)
+                        self._capture_errors = True
+                frame = Frame(char)
+                if char == "[" and self._capture is None and self._path() == self.path:
+                    frame.target = True
+                    self.found = True
+                self._stack.append(frame)
+                continue
+
+            if not self._stack:
+                raise StreamDecodeError(f"Unexpected {char!r} at the top level")
+            self._stack.pop()
+            if self._capture is not None and len(self._stack) == self._capture_depth:
+                value = self.loads(buffer[self._capture : index + 1])
+                if self._capture_errors:
+                    self.errors = value
+                    self._capture_errors = False
+                else:
+                    items.append(value)
+                self._capture = None
+
+    def _trim(self) -> None:
+        keep = self._pos if self._capture is None else self._capture
+        if keep:
+            self._buffer = self._buffer[keep:]
+            self._pos -= keep
+            if self._capture is not None:
+                self._capture = 0
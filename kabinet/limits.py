@@ -0,0 +1,244 @@
+"""Client side concurrency and rate limits for outgoing operations.
+
+A :class:`RequestLimiter` on the rath caps the number of operations in
+flight (a semaphore) and the rate at which they are sent (a token bucket),
+separately for queries, mutations and subscriptions. Operations that exceed
+a limit wait in the client instead of tripping the limits of the server.
+
+Every :class:`Limit` records how long operations waited for it, which tells
+client side throttling apart from a slow server. When a concurrency cap is
+saturated or the token bucket is empty, waiting operations are served in
+the order of their priority (see :mod:`kabinet.priority`).
+
+Example:
+    ```python
+    rath = KabinetRath(
+        link=...,
+        limiter=RequestLimiter(mutation=Limit(max_concurrency=20, rate=50)),
+    )
+
+    ...
+    print(rath.limiter.mutation.mean_wait)
+    ```
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from graphql import OperationType
+from pydantic import BaseModel, Field, PrivateAttr
+from rath.operation import Operation
+
+from kabinet.priority import Priority, current_priority, default_priority
+
+
+class PrioritySemaphore:
+    """A semaphore that hands out free slots to the waiter with the highest priority."""
+
+    def __init__(self, value: int) -> None:
+        """Create a semaphore with ``value`` slots."""
+        self._value = value
+        self._waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: int = Priority.NORMAL) -> None:
+        """Wait for a slot, behind all waiters with the same or a higher priority."""
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the cancellation
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a slot, handing it to the next waiter if there is one."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+
+class Limit(BaseModel):
+    """A concurrency cap and a token bucket rate limit for one type of operation."""
+
+    max_concurrency: Optional[int] = None
+    """The maximum number of operations in flight (None for no cap)"""
+    rate: Optional[float] = None
+    """The maximum number of operations sent per second on average (None for no limit)"""
+    burst: Optional[int] = None
+    """The number of operations that may be sent at once after a pause (defaults to ``rate``)"""
+
+    acquired: int = 0
+    """The number of operations that passed the limit"""
+    throttled: int = 0
+    """The number of operations that had to wait"""
+    total_wait: float = 0.0
+    """The total time in seconds operations waited for the limit"""
+    max_wait: float = 0.0
+    """The longest time in seconds an operation waited for the limit"""
+    wait_by_priority: Dict[str, float] = Field(default_factory=dict)
+    """The total time in seconds operations waited for the limit, per priority"""
+
+    _semaphore: Optional[PrioritySemaphore] = PrivateAttr(default=None)
+    _tokens: Optional[float] = PrivateAttr(default=None)
+    _refilled_at: float = PrivateAttr(default_factory=time.monotonic)
+    _token_waiters: List[List[Any]] = PrivateAttr(default_factory=list)
+    _counter: Iterator[int] = PrivateAttr(default_factory=itertools.count)
+    _waiting: int = PrivateAttr(default=0)
+    _in_flight: int = PrivateAttr(default=0)
+
+    @property
+    def capacity(self) -> float:
+        """The maximum number of tokens in the bucket."""
+        return float(self.burst or max(self.rate or 1, 1))
+
+    @property
+    def waiting(self) -> int:
+        """The number of operations currently waiting for the limit."""
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        """The number of operations currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def mean_wait(self) -> float:
+        """The mean time in seconds operations waited for the limit."""
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+    def refill(self) -> float:
+        """Add the tokens earned since the last refill, and return the tokens in the bucket."""
+        now = time.monotonic()
+        if self._tokens is None:
+            self._tokens = self.capacity
+        else:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._refilled_at) * self.rate  # type: ignore
+            )
+        self._refilled_at = now
+        return self._tokens
+
+    async def atake_token(self, priority: int = Priority.NORMAL) -> None:
+        """Wait until the token bucket has a token, and take it.
+
+        Operations waiting for a token queue up by priority (and by arrival
+        within a priority). Only the first in line waits for the next token,
+        the others wait until they move up.
+        """
+        if not self._token_waiters and self.refill() >= 1:
+            self._tokens -= 1  # type: ignore
+            return
+
+        loop = asyncio.get_running_loop()
+        entry = [priority, next(self._counter), loop.create_future()]
+        heapq.heappush(self._token_waiters, entry)
+        try:
+            while True:
+                if self._token_waiters[0] is not entry:
+                    entry[2] = loop.create_future()
+                    await entry[2]
+                elif self.refill() >= 1:
+                    self._tokens -= 1  # type: ignore
+                    return
+                else:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)  # type: ignore
+        finally:
+            self._token_waiters.remove(entry)
+            heapq.heapify(self._token_waiters)
+            if self._token_waiters and not self._token_waiters[0][2].done():
+                # Hand the front of the line to the next waiter
+                self._token_waiters[0][2].set_result(None)
+
+    @asynccontextmanager
+    async def aslot(self, priority: Priority = Priority.NORMAL) -> AsyncIterator[None]:
+        """Hold a slot of this limit while the body runs."""
+        if self.max_concurrency is None and self.rate is None:
+            self.acquired += 1
+            self._in_flight += 1
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
+            return
+
+        start = time.monotonic()
+        self._waiting += 1
+        try:
+            if self.rate is not None:
+                await self.atake_token(priority)
+            if self.max_concurrency is not None:
+                if self._semaphore is None:
+                    self._semaphore = PrioritySemaphore(self.max_concurrency)
+                await self._semaphore.acquire(priority)
+        finally:
+            self._waiting -= 1
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        if waited > 0.001:
+            self.throttled += 1
+            self.wait_by_priority[priority.name] = (
+                self.wait_by_priority.get(priority.name, 0.0) + waited
+            )
+
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+
+class RequestLimiter(BaseModel):
+    """Separate limits for queries, mutations and subscriptions.
+
+    Subscriptions hold their slot for as long as they are open, so the
+    concurrency cap of subscriptions limits the number of open subscriptions.
+    """
+
+    query: Limit = Field(default_factory=Limit)
+    """The limit of queries"""
+    mutation: Limit = Field(default_factory=Limit)
+    """The limit of mutations"""
+    subscription: Limit = Field(default_factory=Limit)
+    """The limit of subscriptions"""
+    priorities: Dict[str, Priority] = Field(default_factory=dict)
+    """The priority per operation name, overriding ``default_priority``"""
+
+    def priority_for(self, operation: Operation) -> Priority:
+        """The priority of an operation (see :mod:`kabinet.priority`)."""
+        priority = operation.context.kwargs.get("priority")
+        if priority is None:
+            priority = current_priority.get()
+        if priority is None:
+            name = operation.node.name.value if operation.node.name else None
+            priority = self.priorities.get(name) if name else None
+            if priority is None:
+                priority = default_priority(name)
+        return Priority(priority)
+
+    def limit_for(self, operation: Operation) -> Limit:
+        """The limit that applies to an operation."""
+        kind = operation.node.operation
+        if kind == OperationType.MUTATION:
+            return self.mutation
+        if kind == OperationType.SUBSCRIPTION:
+            return self.subscription
+        return self.query
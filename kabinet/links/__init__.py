@@ -0,0 +1,20 @@
+"""Links that can be composed into the kabinet link chain."""
+
+from .errors import CircuitOpenError, ExchangeNotRecordedError, TransientLinkError
+from .faults import Fault, FaultInjectionLink, Latency
+from .graphql_ws import KabinetGraphQLWSLink
+from .persisted import PersistedQueryLink
+from .retry import CircuitBreaker, KabinetRetryLink
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ExchangeNotRecordedError",
+    "Fault",
+    "FaultInjectionLink",
+    "KabinetGraphQLWSLink",
+    "KabinetRetryLink",
+    "Latency",
+    "PersistedQueryLink",
+    "TransientLinkError",
+]
@@ -0,0 +1,247 @@
+"""The aiohttp transport of the kabinet link chain."""
+
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Dict, Literal, Optional, Tuple
+
+import aiohttp
+from graphql import OperationType
+from pydantic import field_validator
+from rath.links.aiohttp import AIOHttpLink, DateTimeEncoder
+from rath.links.errors import AuthenticationError, MalformedResponseError
+from rath.links.types import Payload
+from rath.operation import GraphQLException, GraphQLResult, Operation
+
+from kabinet.compression import accept_encoding, get_codec
+from kabinet.jsonstream import ArrayItemDecoder
+from kabinet.links.errors import TransientLinkError
+from kabinet.serialization import JSONCodec, default_json_codec
+
+
+class KabinetAIOHttpLink(AIOHttpLink):
+    """An aiohttp link that understands the kabinet link extensions.
+
+    In addition to the standard aiohttp link, this link honours
+    ``omit_document`` and the ``extensions`` of the operation context, as
+    set by the :class:`kabinet.links.persisted.PersistedQueryLink`.
+
+    If the operation is executed with a ``stream_field`` keyword (see
+    :func:`kabinet.funcs.astream`), the items of that root field are decoded
+    while the response is received and yielded in batches, instead of
+    buffering and parsing the whole response.
+
+    Request bodies of at least ``compression_threshold`` bytes are
+    compressed with ``compression``, and with ``accept_compression`` the
+    server may compress its responses with any available codec (see
+    :mod:`kabinet.compression`).
+
+    Requests are encoded and responses decoded with ``json_codec``, which
+    defaults to the fastest available codec (see :mod:`kabinet.serialization`),
+    or to the standard library with a custom ``json_encoder``. The sizes of
+    both are reported to the ``sample`` of measured operations (see
+    :mod:`kabinet.metrics`).
+    """
+
+    stream_chunk_size: int = 64 * 1024
+    """The size of the chunks read from a streamed response"""
+    transient_statuses: Tuple[int, ...] = (502, 503, 504)
+    """The response statuses that signal a transient failure (see ``TransientLinkError``)"""
+    compression: Optional[Literal["gzip", "zstd"]] = None
+    """The codec request bodies are compressed with (None to send them uncompressed)"""
+    compression_threshold: int = 1024
+    """The size in bytes below which request bodies are sent uncompressed"""
+    accept_compression: bool = False
+    """Whether to accept responses compressed with any available codec, including zstd"""
+    json_codec: Optional[JSONCodec] = None
+    """The codec of requests and responses (None for the fastest available codec)"""
+
+    @field_validator("compression")
+    @classmethod
+    def check_codec(cls, value: Optional[str]) -> Optional[str]:
+        """Fail early if the codec is not available."""
+        if value is not None:
+            get_codec(value)
+        return value
+
+    @property
+    def codec(self) -> JSONCodec:
+        """The codec of requests and responses.
+
+        A custom ``json_encoder`` is honoured by encoding with the standard
+        library, even if a faster codec is available.
+        """
+        if self.json_codec is not None:
+            return self.json_codec
+        custom = self.json_encoder if self.json_encoder is not DateTimeEncoder else None
+        return default_json_codec(custom)
+
+    def compress(self, body: bytes, headers: Dict[str, str]) -> bytes:
+        """Compress a serialized payload if it is large enough."""
+        headers["Content-Type"] = "application/json"
+        if self.compression is not None and len(body) >= self.compression_threshold:
+            body = get_codec(self.compression).compress(body)
+            headers["Content-Encoding"] = self.compression
+        return body
+
+    async def aiter_body(self, response: aiohttp.ClientResponse) -> AsyncIterator[bytes]:
+        """Iterate over the (decompressed) chunks of a response body."""
+        encoding = response.headers.get("Content-Encoding", "identity")
+        if not self.accept_compression or encoding == "identity":
+            async for chunk in response.content.iter_chunked(self.stream_chunk_size):
+                yield chunk
+            return
+
+        decompressor = get_codec(encoding).decompressor()
+        async for chunk in response.content.iter_chunked(self.stream_chunk_size):
+            yield decompressor.decompress(chunk)
+        yield decompressor.flush()
+
+    async def aread_body(self, response: aiohttp.ClientResponse) -> bytes:
+        """Read a complete (decompressed) response body."""
+        if not self.accept_compression:
+            return await response.read()
+        return b"".join([chunk async for chunk in self.aiter_body(response)])
+
+    def build_payload(self, operation: Operation) -> Payload:
+        """Build the GraphQL over HTTP payload of an operation."""
+        payload: Payload = {}
+        if not operation.context.omit_document:
+            payload["query"] = operation.document
+        if operation.context.extensions:
+            payload["extensions"] = operation.context.extensions
+        if operation.operation_name:
+            payload["operationName"] = operation.operation_name
+        payload["variables"] = operation.variables
+        return payload
+
+    async def astream(
+        self, operation: Operation, response: aiohttp.ClientResponse, field: str
+    ) -> AsyncIterator[GraphQLResult]:
+        """Decode the items of a root field while the response is received.
+
+        Every chunk of the response yields a result holding the items it
+        completed, e.g. ``{"releases": [...]}``.
+        """
+        decoder = ArrayItemDecoder(("data", field), loads=self.codec.loads)
+        sample = operation.context.kwargs.get("sample")
+        async for chunk in self.aiter_body(response):
+            if sample is not None:
+                sample.response_bytes += len(chunk)
+            items = decoder.feed(chunk)
+            if items:
+                yield GraphQLResult(data={field: items})
+        decoder.close()
+
+        if decoder.errors:
+            raise GraphQLException(
+                "\n".join([e["message"] for e in decoder.errors]),
+                operation=operation,
+                endpoint_url=self.endpoint_url,
+                errors=decoder.errors,
+            )
+
+        if not decoder.found:
+            raise MalformedResponseError(
+                f"Response from {self.endpoint_url} for operation "
+                f"'{operation.display_name}' contains no '{field}' list"
+            )
+
+    async def aexecute(self, operation: Operation) -> AsyncIterator[GraphQLResult]:
+        """Executes an operation against the link
+
+        Parameters
+        ----------
+        operation : Operation
+            The operation to execute
+
+        Yields
+        ------
+        GraphQLResult
+            The result of the operation
+        """
+        if not self._connected:
+            await self.aconnect(operation)
+
+        if operation.node.operation == OperationType.SUBSCRIPTION:
+            raise NotImplementedError(
+                "Aiohttp Transport does not support subscriptions. Use a websocket link "
+                "(e.g. GraphQLWSLink) for subscriptions, e.g. via a SplitLink."
+            )
+
+        payload = self.build_payload(operation)
+        sample = operation.context.kwargs.get("sample")
+
+        if operation.context.files:
+            files = operation.context.files
+            data = aiohttp.FormData()
+            data.add_field(
+                "operations",
+                self.codec.dumps(payload),
+                content_type="application/json",
+            )
+            data.add_field(
+                "map",
+                self.codec.dumps({str(i): [path] for i, path in enumerate(files)}),
+                content_type="application/json",
+            )
+            for i, path in enumerate(files):
+                stream = files[path]
+                data.add_field(str(i), stream, filename=getattr(stream, "name", str(i)))
+
+            post_kwargs: Dict[str, Any] = {"data": data}
+        else:
+            body = self.codec.dumps(payload)
+            if sample is not None:
+                sample.request_bytes += len(body)
+            headers = dict(operation.context.headers)
+            post_kwargs = {"data": self.compress(body, headers), "headers": headers}
+
+        if self.accept_compression:
+            headers = post_kwargs.setdefault("headers", dict(operation.context.headers))
+            headers["Accept-Encoding"] = accept_encoding()
+        post_kwargs.setdefault("headers", operation.context.headers)
+
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(ssl=self.ssl_context),
+            auto_decompress=not self.accept_compression,
+        ) as session:
+            try:
+                request = await session.post(self.endpoint_url, **post_kwargs)
+            except aiohttp.ClientConnectionError as e:
+                raise TransientLinkError(f"Could not reach {self.endpoint_url}: {e}") from e
+
+            async with request as response:
+                if response.status in self.auth_errors:
+                    raise AuthenticationError(f"Token Expired Error {operation.context.headers}")
+
+                if response.status in self.transient_statuses:
+                    raise TransientLinkError(
+                        f"{self.endpoint_url} is temporarily unavailable ({response.status})"
+                    )
+
+                stream_field = operation.context.kwargs.get("stream_field")
+                if stream_field and response.status == HTTPStatus.OK:
+                    async for result in self.astream(operation, response, stream_field):
+                        yield result
+                    return
+
+                body = await self.aread_body(response)
+                if sample is not None:
+                    sample.response_bytes += len(body)
+                json_response = self.codec.loads(body)
+
+                if "errors" in json_response:
+                    raise GraphQLException(
+                        "\n".join([e["message"] for e in json_response["errors"]]),
+                        operation=operation,
+                        endpoint_url=self.endpoint_url,
+                        errors=json_response["errors"],
+                    )
+
+                if "data" not in json_response or response.status != HTTPStatus.OK:
+                    raise MalformedResponseError(
+                        f"Response from {self.endpoint_url} for operation "
+                        f"'{operation.display_name}' contains neither "
+                        f"'data' nor 'errors': {json_response}"
+                    )
+
+                yield GraphQLResult(data=json_response["data"])
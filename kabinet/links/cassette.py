@@ -0,0 +1,288 @@
+"""Recording and replaying the exchanges of the kabinet link chain.
+
+A :class:`RecordingLink` in the ``recording`` slot of the
+:class:`kabinet.rath.KabinetLinkComposition` records every exchange with
+the server (the operation, its variables, its results or error and their
+timing) into a :class:`Cassette`. The slot comes before the retry link, so
+an exchange spans all attempts of an operation. A :class:`ReplayLink` then serves the
+recorded results instead of a transport, optionally with the original
+timing, so that recorded traffic can be replayed offline and reproducibly,
+e.g. through :func:`kabinet.replay.areplay`.
+
+Cassettes are stored as JSON lines (gzipped if the path ends with
+``.gz``): the document of every operation is written once, followed by a
+line per exchange. The recording link appends to its file as it records,
+so a long recording does not need to be held in memory.
+
+Example:
+    ```python
+    recorder = RecordingLink(path="traffic.jsonl.gz")
+    rath = KabinetRath(link=KabinetLinkComposition(..., recording=recorder))
+
+    ...
+    replay = ReplayLink(cassette=Cassette.load("traffic.jsonl.gz"), timing=True)
+    rath = KabinetRath(link=replay)
+    ```
+"""
+
+import asyncio
+import gzip
+import json
+import time
+from typing import IO, Any, AsyncIterator, Dict, List, Optional, Set, Tuple, Type
+
+from graphql import OperationType
+from pydantic import BaseModel, Field, PrivateAttr
+from rath.errors import NotComposedError
+from rath.links.base import AsyncTerminatingLink, ContinuationLink
+from rath.operation import GraphQLException, GraphQLResult, Operation, SubscriptionDisconnect
+
+from kabinet.documents import get_operation_name
+from kabinet.links.errors import ExchangeNotRecordedError, TransientLinkError
+from kabinet.serialization import DateTimeEncoder, default_json_codec
+
+REPLAYED_ERRORS: Dict[str, Type[Exception]] = {
+    "TransientLinkError": TransientLinkError,
+    "SubscriptionDisconnect": SubscriptionDisconnect,
+    "ConnectionError": ConnectionError,
+}
+"""The errors that are replayed as themselves, all others become a ``GraphQLException``"""
+
+
+def variables_key(variables: Optional[Dict[str, Any]]) -> str:
+    """A canonical JSON of variables, the same for recorded and live variables."""
+    return json.dumps(variables or {}, sort_keys=True, separators=(",", ":"), cls=DateTimeEncoder)
+
+
+def open_cassette(path: str, mode: str) -> IO[bytes]:
+    """Open a cassette file, gzipped if the path ends with ``.gz``."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode)  # type: ignore
+    return open(path, mode)
+
+
+class Exchange(BaseModel):
+    """A recorded exchange of an operation with the server."""
+
+    operation: str
+    """The name of the operation, e.g. ``ListReleases``"""
+    kind: str
+    """``query``, ``mutation`` or ``subscription``"""
+    at: float
+    """The (epoch) time at which the operation was sent"""
+    variables: Dict[str, Any] = {}
+    """The variables the operation was sent with"""
+    results: List[Dict[str, Any]] = []
+    """The data of every result, in order"""
+    offsets: List[float] = []
+    """The time in seconds from sending the operation until every result"""
+    duration: float = 0
+    """The time in seconds from sending the operation until it completed or failed"""
+    error: Optional[str] = None
+    """The type of the exception the operation failed with, if any"""
+    message: Optional[str] = None
+    """The message of that exception"""
+
+    def replayed_error(self) -> Exception:
+        """The exception to replay a failed exchange with."""
+        message = self.message or ""
+        if self.error in REPLAYED_ERRORS:
+            return REPLAYED_ERRORS[self.error](message)
+        return GraphQLException(message)
+
+
+class Cassette(BaseModel):
+    """Recorded exchanges and the documents of their operations."""
+
+    documents: Dict[str, str] = {}
+    """The document of every recorded operation, by operation name"""
+    exchanges: List[Exchange] = []
+    """The recorded exchanges, in the order they completed"""
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """Load a cassette from a file."""
+        cassette = cls()
+        codec = default_json_codec()
+        with open_cassette(path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = codec.loads(line)
+                if "document" in entry:
+                    cassette.documents[entry["operation"]] = entry["document"]
+                else:
+                    cassette.exchanges.append(Exchange(**entry))
+        return cassette
+
+    def dump(self, path: str) -> None:
+        """Write the cassette to a file."""
+        with open_cassette(path, "wb") as f:
+            for line in self.lines():
+                f.write(line)
+
+    def lines(self) -> List[bytes]:
+        """The lines of the cassette file."""
+        documents = [encode_document(name, document) for name, document in self.documents.items()]
+        return documents + [encode_exchange(exchange) for exchange in self.exchanges]
+
+
+def encode_document(operation: str, document: str) -> bytes:
+    """The line of the document of an operation."""
+    return default_json_codec().dumps({"operation": operation, "document": document}) + b"\n"
+
+
+def encode_exchange(exchange: Exchange) -> bytes:
+    """The line of an exchange, leaving out empty fields."""
+    return default_json_codec().dumps(exchange.model_dump(exclude_defaults=True)) + b"\n"
+
+
+class RecordingLink(ContinuationLink):
+    """Records the exchanges of the operations passing through it.
+
+    With a ``path``, exchanges are appended to that file as they complete,
+    otherwise they are kept in the ``cassette``. Queries and mutations are
+    recorded when their result arrives, subscriptions when they end.
+    """
+
+    path: Optional[str] = None
+    """The file to append the exchanges to (None to keep them in ``cassette``)"""
+    cassette: Cassette = Field(default_factory=Cassette, exclude=True)
+    """The recorded exchanges, if there is no ``path``"""
+
+    recorded: int = 0
+    """The number of recorded exchanges"""
+
+    _file: Optional[IO[bytes]] = PrivateAttr(default=None)
+    _written: Set[str] = PrivateAttr(default_factory=set)
+
+    def record(self, exchange: Exchange, document: str) -> None:
+        """Record an exchange."""
+        self.recorded += 1
+        if self.path is None:
+            self.cassette.documents.setdefault(exchange.operation, document)
+            self.cassette.exchanges.append(exchange)
+            return
+
+        if self._file is None:
+            self._file = open_cassette(self.path, "ab")
+        if exchange.operation not in self._written:
+            self._written.add(exchange.operation)
+            self._file.write(encode_document(exchange.operation, document))
+        self._file.write(encode_exchange(exchange))
+        self._file.flush()
+
+    async def aexecute(self, operation: Operation) -> AsyncIterator[GraphQLResult]:
+        """Execute the operation against the next link, recording the exchange."""
+        if not self.next:
+            raise NotComposedError("No next link set")
+
+        exchange = Exchange(
+            operation=get_operation_name(operation.document),
+            kind=operation.node.operation.value,
+            at=time.time(),
+            variables=operation.variables or {},
+        )
+        subscription = operation.node.operation == OperationType.SUBSCRIPTION
+        start = time.perf_counter()
+        recorded = False
+        try:
+            async for result in self.next.aexecute(operation):
+                exchange.offsets.append(time.perf_counter() - start)
+                exchange.results.append(result.data)
+                if not subscription:
+                    # The caller stops consuming after the first result
+                    exchange.duration = exchange.offsets[-1]
+                    self.record(exchange, operation.document)
+                    recorded = True
+                yield result
+        except Exception as e:
+            exchange.error, exchange.message = type(e).__name__, str(e)
+            raise
+        finally:
+            # Cancelled queries and mutations have nothing to replay
+            if not recorded and (subscription or exchange.error is not None):
+                exchange.duration = time.perf_counter() - start
+                self.record(exchange, operation.document)
+
+    async def __aexit__(self, *args: Any) -> None:  # noqa: ANN401
+        """Close the cassette file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._written.clear()
+        await super().__aexit__(*args)
+
+
+class ReplayLink(AsyncTerminatingLink):
+    """Serves recorded exchanges instead of sending operations to a server.
+
+    Operations are matched on their name and variables. Repeated operations
+    get the recorded exchanges in the order they were recorded, the last one
+    being served again once they are exhausted. Operations that were never
+    recorded fail with an :class:`ExchangeNotRecordedError`.
+    """
+
+    cassette: Cassette = Field(exclude=True)
+    """The recorded exchanges to serve"""
+    timing: bool = False
+    """Whether results are delayed like they were when they were recorded"""
+    speed: float = 1.0
+    """How much faster than recorded the results are delivered, if ``timing``"""
+
+    served: int = 0
+    """The number of operations served from the cassette"""
+    missed: int = 0
+    """The number of operations that were not recorded"""
+
+    _index: Dict[Tuple[str, str], List[Exchange]] = PrivateAttr(default_factory=dict)
+    _positions: Dict[Tuple[str, str], int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any) -> None:  # noqa: ANN401
+        """Index the exchanges of the cassette."""
+        for exchange in self.cassette.exchanges:
+            key = (exchange.operation, variables_key(exchange.variables))
+            self._index.setdefault(key, []).append(exchange)
+
+    def next_exchange(self, operation: Operation) -> Exchange:
+        """The exchange to serve an operation with."""
+        key = (get_operation_name(operation.document), variables_key(operation.variables))
+        exchanges = self._index.get(key)
+        if not exchanges:
+            self.missed += 1
+            raise ExchangeNotRecordedError(
+                f"No exchange of {key[0]} with the variables {key[1]} was recorded"
+            )
+        position = self._positions.get(key, 0)
+        self._positions[key] = position + 1
+        self.served += 1
+        return exchanges[min(position, len(exchanges) - 1)]
+
+    async def wait_until(self, offset: float, start: float) -> None:
+        """Wait until ``offset`` recorded seconds have passed since ``start``."""
+        if self.timing:
+            delay = offset / self.speed - (time.perf_counter() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def aexecute(self, operation: Operation) -> AsyncIterator[GraphQLResult]:
+        """Serve the recorded results of an operation.
+
+        Parameters
+        ----------
+        operation : Operation
+            The operation to serve
+
+        Yields
+        ------
+        GraphQLResult
+            The recorded result(s) of the operation
+        """
+        exchange = self.next_exchange(operation)
+        start = time.perf_counter()
+        for data, offset in zip(exchange.results, exchange.offsets):
+            await self.wait_until(offset, start)
+            yield GraphQLResult(data=data)
+        if exchange.error is not None:
+            await self.wait_until(exchange.duration, start)
+            raise exchange.replayed_error()
@@ -0,0 +1,29 @@
+"""Errors raised by the links of the kabinet link chain."""
+
+from rath.links.errors import ContinuationLinkError, TerminatingLinkError
+
+
+class TransientLinkError(TerminatingLinkError):
+    """The server could not be reached or is temporarily unavailable.
+
+    This error is raised by the transport for failures that are likely to
+    go away on their own (e.g. a dropped connection or a 502 response), so
+    that retrying the operation makes sense.
+    """
+
+
+class CircuitOpenError(ContinuationLinkError):
+    """The circuit breaker is open, so the operation was not sent.
+
+    This error is raised without contacting the server after too many
+    consecutive transient failures, until the breaker lets a trial
+    request through again.
+    """
+
+
+class ExchangeNotRecordedError(TerminatingLinkError):
+    """The replayed cassette holds no exchange of the operation.
+
+    This error is raised by the :class:`kabinet.links.cassette.ReplayLink`
+    for operations whose name and variables were never recorded.
+    """
@@ -0,0 +1,213 @@
+"""Fault and latency injection for the kabinet link chain.
+
+A :class:`FaultInjectionLink` in the ``faults`` slot of the
+:class:`kabinet.rath.KabinetLinkComposition` degrades the operations
+passing through it, as configured per operation name with a :class:`Fault`:
+
+- ``latency``: a delay drawn from a :class:`Latency` distribution before
+  every result (for subscriptions, before every event)
+- ``error_rate``: the fraction of operations that fail before reaching the
+  transport, with a transient (retryable), GraphQL or connection error
+- ``partial_rate``: the fraction of results whose lists are cut short,
+  like a server that gave up half way through a page
+- ``disconnect_rate`` and ``disconnect_after``: subscriptions whose
+  connection drops after an event, with the ``SubscriptionDisconnect`` of
+  a dead websocket
+
+The slot comes right before the transport, after the retry link, so that
+injected faults exercise retries, timeouts and the recovery of
+subscriptions. The link does not depend on the transport, so it works
+offline with the :class:`kabinet.testing.StandInLink`.
+
+Example:
+    ```python
+    faults = FaultInjectionLink(
+        faults={
+            "ListReleases": Fault(latency=Latency(distribution="lognormal", mean=0.2, spread=0.1)),
+            "MatchFlavour": Fault(error_rate=0.1),
+            "WatchPods": Fault(disconnect_rate=0.01),
+        },
+        seed=42,
+    )
+    rath = KabinetRath(link=KabinetLinkComposition(..., retry=KabinetRetryLink(), faults=faults))
+    ```
+"""
+
+import asyncio
+import math
+import random
+from typing import Any, AsyncIterator, Dict, Literal, Optional
+
+from graphql import OperationType
+from pydantic import BaseModel, PrivateAttr
+from rath.errors import NotComposedError
+from rath.links.base import ContinuationLink
+from rath.operation import GraphQLException, GraphQLResult, Operation, SubscriptionDisconnect
+
+from kabinet.documents import get_operation_name
+from kabinet.links.errors import TransientLinkError
+
+
+class Latency(BaseModel):
+    """A distribution of delays in seconds.
+
+    The ``constant`` and ``exponential`` distributions only use the ``mean``.
+    """
+
+    distribution: Literal["constant", "uniform", "normal", "lognormal", "exponential"] = (
+        "constant"
+    )
+    """The shape of the distribution"""
+    mean: float = 0.0
+    """The mean delay"""
+    spread: float = 0.0
+    """The standard deviation (the half width for ``uniform``)"""
+    max: Optional[float] = None
+    """The longest delay, cutting off the tail of the distribution"""
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a delay."""
+        if self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.spread, self.mean + self.spread)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean, self.spread)
+        elif self.distribution == "lognormal" and self.mean > 0:
+            # The parameters of the underlying normal distribution for the given mean and spread
+            sigma = math.sqrt(math.log(1 + (self.spread / self.mean) ** 2))
+            value = rng.lognormvariate(math.log(self.mean) - sigma**2 / 2, sigma)
+        elif self.distribution == "exponential" and self.mean > 0:
+            value = rng.expovariate(1 / self.mean)
+        else:
+            value = self.mean
+        if self.max is not None:
+            value = min(value, self.max)
+        return max(value, 0.0)
+
+
+class Fault(BaseModel):
+    """The faults injected into an operation."""
+
+    latency: Optional[Latency] = None
+    """The delay before every result"""
+    error_rate: float = 0.0
+    """The fraction of operations that fail before reaching the transport"""
+    error: Literal["transient", "graphql", "connection"] = "transient"
+    """The kind of error failing operations raise"""
+    partial_rate: float = 0.0
+    """The fraction of results that are only partially returned"""
+    partial_keep: float = 0.5
+    """The fraction of the items of a list that a partial result keeps"""
+    disconnect_rate: float = 0.0
+    """The chance that a subscription disconnects after an event"""
+    disconnect_after: Optional[int] = None
+    """The number of events after which a subscription disconnects for sure"""
+
+
+def truncate(value: Any, keep: float) -> Any:  # noqa: ANN401
+    """A partial copy of the data of a result."""
+    if isinstance(value, list):
+        return [truncate(item, keep) for item in value[: int(len(value) * keep)]]
+    if isinstance(value, dict):
+        return {key: truncate(item, keep) for key, item in value.items()}
+    return value
+
+
+class FaultInjectionLink(ContinuationLink):
+    """Injects latency, errors, partial results and disconnects per operation name."""
+
+    faults: Dict[str, Fault] = {}
+    """The faults per operation name"""
+    default: Optional[Fault] = None
+    """The faults of the operations not in ``faults`` (None to leave them alone)"""
+    seed: Optional[int] = None
+    """The seed of the random choices, for reproducible runs"""
+    enabled: bool = True
+    """Whether faults are injected, e.g. to switch them off during a warm up"""
+
+    injected: Dict[str, int] = {}
+    """The number of injected faults per kind (latency, error, partial and disconnect)"""
+
+    _rng: random.Random = PrivateAttr(default_factory=random.Random)
+
+    def model_post_init(self, context: Any) -> None:  # noqa: ANN401
+        """Seed the random choices."""
+        self._rng.seed(self.seed)
+
+    def fault_for(self, operation: Operation) -> Optional[Fault]:
+        """The faults to inject into an operation."""
+        if not self.enabled:
+            return None
+        return self.faults.get(get_operation_name(operation.document), self.default)
+
+    def count(self, kind: str) -> None:
+        """Count an injected fault."""
+        self.injected[kind] = self.injected.get(kind, 0) + 1
+
+    def chance(self, rate: float) -> bool:
+        """Whether an event with the given rate happens."""
+        return rate > 0 and self._rng.random() < rate
+
+    def error(self, fault: Fault, operation: Operation) -> Exception:
+        """The error an operation fails with."""
+        message = f"Injected fault in {get_operation_name(operation.document)}"
+        if fault.error == "graphql":
+            return GraphQLException(message)
+        if fault.error == "connection":
+            return ConnectionError(message)
+        return TransientLinkError(message)
+
+    async def delay(self, fault: Fault) -> None:
+        """Wait for the injected latency, if any."""
+        if fault.latency is not None:
+            self.count("latency")
+            await asyncio.sleep(fault.latency.sample(self._rng))
+
+    async def aexecute(self, operation: Operation) -> AsyncIterator[GraphQLResult]:
+        """Execute the operation against the next link, injecting its faults.
+
+        Parameters
+        ----------
+        operation : Operation
+            The operation to execute
+
+        Yields
+        ------
+        GraphQLResult
+            The (degraded) result(s) of the operation
+        """
+        if not self.next:
+            raise NotComposedError("No next link set")
+
+        fault = self.fault_for(operation)
+        if fault is None:
+            async for result in self.next.aexecute(operation):
+                yield result
+            return
+
+        if self.chance(fault.error_rate):
+            await self.delay(fault)
+            self.count("error")
+            raise self.error(fault, operation)
+
+        subscription = operation.node.operation == OperationType.SUBSCRIPTION
+        events = 0
+        results = self.next.aexecute(operation)
+        try:
+            async for result in results:
+                await self.delay(fault)
+                if self.chance(fault.partial_rate):
+                    self.count("partial")
+                    result = GraphQLResult(data=truncate(result.data, fault.partial_keep))
+                yield result
+
+                events += 1
+                if subscription and (
+                    events == fault.disconnect_after or self.chance(fault.disconnect_rate)
+                ):
+                    self.count("disconnect")
+                    raise SubscriptionDisconnect(
+                        f"Injected disconnect of {get_operation_name(operation.document)}"
+                    )
+        finally:
+            # Like a dropped connection, a disconnect ends the subscription upstream
+            await results.aclose()  # type: ignore
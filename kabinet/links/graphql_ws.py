@@ -0,0 +1,154 @@
+"""The graphql-ws transport of the kabinet link chain."""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from graphql import OperationType
+from rath.links.errors import LinkNotConnectedError
+from rath.links.graphql_ws import (
+    GQL_COMPLETE,
+    GQL_CONNECTION_INIT,
+    GQL_DATA,
+    GQL_ERROR,
+    GQL_START,
+    GQL_STOP,
+    WEBSOCKET_DEAD,
+    GraphQLWSLink,
+    TransportMessage,
+)
+from rath.operation import GraphQLException, GraphQLResult, Operation, SubscriptionDisconnect
+
+from kabinet.serialization import JSONCodec, default_json_codec
+
+logger = logging.getLogger(__name__)
+
+
+class KabinetGraphQLWSLink(GraphQLWSLink):
+    """A graphql-ws link that encodes and decodes its messages with a pluggable codec.
+
+    Every event of a subscription is a message that needs to be decoded, so
+    a fast codec (see :mod:`kabinet.serialization`) pays off for busy
+    subscriptions like ``WatchPods``. Unlike the standard link, this link
+    can also send variables that hold datetimes.
+    """
+
+    json_codec: Optional[JSONCodec] = None
+    """The codec of the messages (None for the fastest available codec)"""
+
+    @property
+    def codec(self) -> JSONCodec:
+        """The codec of the messages."""
+        return self.json_codec or default_json_codec()
+
+    def encode(self, message: Dict[str, Any]) -> str:
+        """Encode a message as a text frame."""
+        return self.codec.dumps(message).decode("utf-8")
+
+    async def sending(self, client: Any, initiating_operation: Operation) -> None:  # noqa: ANN401
+        """Send the connection init message, then the messages of the send queue."""
+        payload: Dict[str, Any] = {
+            "type": GQL_CONNECTION_INIT,
+            "payload": initiating_operation.context.initial_payload,
+        }
+        await client.send(self.encode(payload))
+
+        while True:
+            if not self._send_queue:
+                raise LinkNotConnectedError("Link is not connected")
+
+            message = await self._send_queue.get()
+            logger.debug("GraphQL Websocket: >>>>>> %s", message)
+            await client.send(message)
+            self._send_queue.task_done()
+
+    async def receiving(
+        self,
+        client: Any,  # noqa: ANN401
+        initial_connection_future: "asyncio.Future[bool]",
+    ) -> None:
+        """Decode the received messages and broadcast them to the subscriptions."""
+        async for message in client:
+            logger.debug("GraphQL Websocket: <<<<<<< %s", message)
+            try:
+                decoded = self.codec.loads(message)
+            except ValueError as err:
+                logger.warning("Ignoring. Server sent invalid JSON data: %s \n %s", message, err)
+                continue
+            await self.broadcast(decoded, initial_connection_future)
+
+    async def aexecute(self, operation: Operation) -> AsyncIterator[GraphQLResult]:
+        """Start a subscription and yield its events until it completes.
+
+        Parameters
+        ----------
+        operation : Operation
+            The subscription to execute
+
+        Yields
+        ------
+        GraphQLResult
+            The events of the subscription
+        """
+        if not self._connection_lock:
+            raise LinkNotConnectedError("Link is not connected")
+
+        async with self._connection_lock:
+            if self._connection_task is None or self._connection_task.done():
+                await self.aconnect(operation)
+
+        assert operation.node.operation == OperationType.SUBSCRIPTION, (
+            "Operation is not a subscription"
+        )
+        assert not operation.context.files, "We cannot send files through websockets"
+
+        id = operation.id
+        queue: "asyncio.Queue[TransportMessage]" = asyncio.Queue()
+        if self._ongoing_subscriptions is None:
+            self._ongoing_subscriptions = {}
+        self._ongoing_subscriptions[id] = queue
+
+        frame: Dict[str, Any] = {
+            "id": id,
+            "type": GQL_START,
+            "payload": {
+                "headers": operation.context.headers,
+                "query": operation.document,
+                "variables": operation.variables,
+            },
+        }
+
+        try:
+            await self.aforward(self.encode(frame))
+
+            while True:
+                answer = await queue.get()
+
+                if answer["type"] == GQL_ERROR:
+                    payload = answer["payload"]
+                    errors: List[Dict[str, Any]] = (
+                        payload if isinstance(payload, list) else [payload]
+                    )
+                    raise GraphQLException("\n".join([e["message"] for e in errors]))
+
+                if answer["type"] == GQL_DATA:
+                    payload = answer["payload"]
+                    if "errors" in payload:
+                        raise GraphQLException(
+                            "\n".join([e["message"] for e in payload["errors"]])
+                        )
+                    if "data" in payload:
+                        yield GraphQLResult(data=payload["data"])
+                        queue.task_done()
+
+                if answer["type"] == WEBSOCKET_DEAD:
+                    raise SubscriptionDisconnect(
+                        f"Subscription {id} failed propagating Error {operation}"
+                    )
+
+                if answer["type"] == GQL_COMPLETE:
+                    return
+
+        except asyncio.CancelledError:
+            await self.aforward(self.encode({"id": id, "type": GQL_STOP}))
+            raise
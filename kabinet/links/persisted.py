@@ -0,0 +1,82 @@
+"""Automatic persisted queries for the kabinet link chain."""
+
+import hashlib
+from functools import lru_cache
+from typing import AsyncIterator
+
+from graphql import OperationType
+from rath.errors import NotComposedError
+from rath.links.base import ContinuationLink
+from rath.operation import GraphQLException, GraphQLResult, Operation
+
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+
+
+@lru_cache(maxsize=256)
+def hash_document(document: str) -> str:
+    """The SHA-256 hash of a document, as used to identify persisted queries."""
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+
+def is_persisted_query_not_found(exception: GraphQLException) -> bool:
+    """Whether the server reported that it does not know the hash of a query."""
+    if PERSISTED_QUERY_NOT_FOUND in exception.message:
+        return True
+    errors = exception.errors if isinstance(exception.errors, list) else []
+    return any(
+        e.get("extensions", {}).get("code") == "PERSISTED_QUERY_NOT_FOUND"
+        for e in errors
+        if isinstance(e, dict)
+    )
+
+
+class PersistedQueryLink(ContinuationLink):
+    """Sends only the SHA-256 hash of a document instead of its full text.
+
+    Queries and mutations are first sent with the hash alone. If the server
+    reports that it does not know the hash, the operation is resent with
+    both the hash and the full document, so that the server can persist it
+    for the next request. Subscriptions are passed through unchanged.
+
+    The terminating link needs to honour ``omit_document`` and the
+    ``extensions`` of the operation context, as the
+    :class:`kabinet.links.aiohttp.KabinetAIOHttpLink` does.
+    """
+
+    async def aexecute(self, operation: Operation) -> AsyncIterator[GraphQLResult]:
+        """Executes an operation against the next link, sending only its hash
+
+        Parameters
+        ----------
+        operation : Operation
+            The operation to execute
+
+        Yields
+        ------
+        GraphQLResult
+            The result of the operation
+        """
+        if not self.next:
+            raise NotComposedError("No next link set")
+
+        if operation.node.operation == OperationType.SUBSCRIPTION:
+            async for result in self.next.aexecute(operation):
+                yield result
+            return
+
+        operation.context.extensions["persistedQuery"] = {
+            "version": 1,
+            "sha256Hash": hash_document(operation.document),
+        }
+        operation.context.omit_document = True
+
+        try:
+            async for result in self.next.aexecute(operation):
+                yield result
+        except GraphQLException as e:
+            if not is_persisted_query_not_found(e):
+                raise
+
+            operation.context.omit_document = False
+            async for result in self.next.aexecute(operation):
+                yield result
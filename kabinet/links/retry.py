@@ -0,0 +1,196 @@
+"""Retries with exponential backoff and a circuit breaker for the kabinet link chain."""
+
+import asyncio
+import random
+import time
+from typing import AsyncIterator, Optional, Set, Tuple, Type
+
+from graphql import OperationType
+from pydantic import BaseModel, Field, PrivateAttr
+from rath.errors import NotComposedError
+from rath.links.base import ContinuationLink
+from rath.operation import GraphQLResult, Operation, SubscriptionDisconnect
+
+from kabinet.deadlines import remaining
+from kabinet.links.errors import CircuitOpenError, TransientLinkError
+
+TRANSIENT_ERRORS: Tuple[Type[BaseException], ...] = (
+    TransientLinkError,
+    SubscriptionDisconnect,
+    ConnectionError,
+)
+
+
+class CircuitBreaker(BaseModel):
+    """Fails fast while the server is down.
+
+    After ``failure_threshold`` consecutive transient failures the breaker
+    opens, and operations fail with :class:`CircuitOpenError` without being
+    sent. After ``reset_timeout`` seconds a single trial operation is let
+    through: if it succeeds the breaker closes again, otherwise it stays open
+    for another ``reset_timeout``.
+    """
+
+    failure_threshold: int = 5
+    """The number of consecutive transient failures after which the breaker opens"""
+    reset_timeout: float = 10.0
+    """The time in seconds after which an open breaker lets a trial operation through"""
+
+    opened: int = 0
+    """The number of times the breaker opened"""
+    rejected: int = 0
+    """The number of operations that failed fast because the breaker was open"""
+
+    _failures: int = PrivateAttr(default=0)
+    _opened_at: Optional[float] = PrivateAttr(default=None)
+    _probing: bool = PrivateAttr(default=False)
+
+    @property
+    def state(self) -> str:
+        """``closed``, ``open`` or ``half_open`` (while a trial operation is in flight)."""
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if self._probing else "open"
+
+    def acquire(self) -> bool:
+        """Check whether an operation may be sent, returning whether it is the trial.
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+        """
+        if self._opened_at is None:
+            return False
+        if self._probing or time.monotonic() - self._opened_at < self.reset_timeout:
+            self.rejected += 1
+            raise CircuitOpenError(
+                f"The server failed {self._failures} times in a row, not sending the operation"
+            )
+        self._probing = True
+        return True
+
+    def release(self) -> None:
+        """Give up a trial without an outcome, e.g. because it was cancelled."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Record that the server answered, closing the breaker."""
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a transient failure, opening the breaker if there were too many."""
+        self._failures += 1
+        if self._probing or (self._opened_at is None and self._failures >= self.failure_threshold):
+            self._opened_at = time.monotonic()
+            self._probing = False
+            self.opened += 1
+
+
+class KabinetRetryLink(ContinuationLink):
+    """Retries operations that failed with a transient error.
+
+    Queries and subscriptions are retried automatically. Mutations are only
+    retried if they are marked as idempotent, either by name in
+    ``idempotent_operations`` or per call with an ``idempotent=True``
+    keyword. Between attempts the link waits for an exponentially growing,
+    fully jittered delay, so that many clients do not retry in lockstep. A
+    retry is never started if the delay would outlast the deadline of the
+    operation (see :mod:`kabinet.deadlines`).
+
+    A query is not retried once it has yielded a result, as a partially
+    streamed response cannot be resumed. Subscriptions are resubscribed
+    after a disconnect, resetting the number of attempts once they
+    received an event again.
+
+    All operations go through the :class:`CircuitBreaker`, which fails fast
+    while the server is down.
+    """
+
+    max_retries: int = 3
+    """The maximum number of retries per operation"""
+    base_delay: float = 0.1
+    """The delay in seconds before the first retry (doubled for every further retry)"""
+    max_delay: float = 10.0
+    """The maximum delay in seconds between two attempts"""
+    idempotent_operations: Set[str] = Field(default_factory=set)
+    """The names of mutations that are safe to retry, e.g. ``{"DeclareBackend"}``"""
+    retry_on: Tuple[Type[BaseException], ...] = TRANSIENT_ERRORS
+    """The errors that are considered transient"""
+    breaker: CircuitBreaker = Field(default_factory=CircuitBreaker)
+    """The circuit breaker shared by all operations of this link"""
+
+    retries: int = 0
+    """The number of retries that were sent"""
+
+    _random: random.Random = PrivateAttr(default_factory=random.Random)
+
+    def is_retryable(self, operation: Operation) -> bool:
+        """Whether an operation may be retried."""
+        if operation.node.operation != OperationType.MUTATION:
+            return True
+        if operation.context.kwargs.get("idempotent"):
+            return True
+        return operation.node.name is not None and (
+            operation.node.name.value in self.idempotent_operations
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """The (jittered) delay before the retry following the ``attempt``-th attempt."""
+        return self._random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def aexecute(self, operation: Operation) -> AsyncIterator[GraphQLResult]:
+        """Executes an operation against the next link, retrying transient failures
+
+        Parameters
+        ----------
+        operation : Operation
+            The operation to execute
+
+        Yields
+        ------
+        GraphQLResult
+            The result of the operation
+        """
+        if not self.next:
+            raise NotComposedError("No next link set")
+
+        retryable = self.is_retryable(operation)
+        resumable = operation.node.operation == OperationType.SUBSCRIPTION
+        attempt = 0
+
+        while True:
+            trial = self.breaker.acquire()
+            yielded = False
+            try:
+                async for result in self.next.aexecute(operation):
+                    self.breaker.record_success()
+                    yielded = True
+                    attempt = 0
+                    yield result
+                self.breaker.record_success()
+                return
+            except self.retry_on as e:
+                self.breaker.record_failure()
+                if not retryable or (yielded and not resumable) or attempt >= self.max_retries:
+                    raise
+                error = e
+            except Exception:
+                # The server answered, even if with an error
+                self.breaker.record_success()
+                raise
+            finally:
+                if trial:
+                    self.breaker.release()
+
+            delay = self.backoff(attempt)
+            left = remaining()
+            if left is not None and left <= delay:
+                # The deadline would pass before the retry is sent
+                raise error
+            attempt += 1
+            self.retries += 1
+            sample = operation.context.kwargs.get("sample")
+            if sample is not None:
+                sample.retries += 1
+            await asyncio.sleep(delay)
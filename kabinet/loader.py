@@ -0,0 +1,172 @@
+"""DataLoader-style coalescing of by-ID lookups.
+
+When many coroutines call e.g. ``aget_flavour`` in the same event loop tick,
+the :class:`KabinetLoader` of the rath collects their IDs and resolves them
+with one list query using the ``ids`` filter, instead of sending one request
+per lookup.
+
+Example:
+    ```python
+    rath = KabinetRath(link=..., loader=KabinetLoader(window=0.005))
+
+    async with rath:
+        # Sends a single `GetFlavours` query
+        flavours = await asyncio.gather(*(aget_flavour(id) for id in ids))
+    ```
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Type
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from rath.operation import GraphQLException
+
+if TYPE_CHECKING:
+    from kabinet.rath import KabinetRath
+
+
+class ByIdLookup(BaseModel):
+    """Describes how a by-ID operation is resolved through a list query."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    operation: Type[Any]
+    """The single lookup operation, e.g. ``GetFlavourQuery``"""
+    field: str
+    """The field of the single operation that holds the entity, e.g. ``flavour``"""
+    many: Type[Any]
+    """The list operation filtering on ``ids``, e.g. ``GetFlavoursQuery``"""
+    many_field: str
+    """The field of the list operation that holds the entities, e.g. ``flavours``"""
+
+
+def default_lookups() -> Dict[str, ByIdLookup]:
+    """The by-ID lookups of the kabinet api that can be coalesced."""
+    from kabinet.api import schema
+
+    lookups = [
+        ByIdLookup(
+            operation=schema.GetPodQuery, field="pod", many=schema.GetPodsQuery, many_field="pods"
+        ),
+        ByIdLookup(
+            operation=schema.GetFlavourQuery,
+            field="flavour",
+            many=schema.GetFlavoursQuery,
+            many_field="flavours",
+        ),
+        ByIdLookup(
+            operation=schema.GetDeploymentQuery,
+            field="deployment",
+            many=schema.GetDeploymentsQuery,
+            many_field="deployments",
+        ),
+        ByIdLookup(
+            operation=schema.GetReleaseQuery,
+            field="release",
+            many=schema.GetReleasesQuery,
+            many_field="releases",
+        ),
+        ByIdLookup(
+            operation=schema.GetDefinitionQuery,
+            field="definition",
+            many=schema.GetDefinitionsQuery,
+            many_field="definitions",
+        ),
+    ]
+    return {lookup.operation.__name__: lookup for lookup in lookups}
+
+
+class KabinetLoader(BaseModel):
+    """Coalesces concurrent by-ID lookups into list queries.
+
+    Lookups are collected for ``window`` seconds (by default only until the
+    current event loop tick has finished), deduplicated, and resolved with
+    one list query per ``max_batch_size`` IDs.
+    """
+
+    window: float = 0.0
+    """The time in seconds to collect lookups before sending them"""
+    max_batch_size: int = 100
+    """The maximum number of IDs resolved with a single list query"""
+    lookups: Dict[str, ByIdLookup] = Field(default_factory=default_lookups)
+    """The lookups that should be coalesced, keyed by operation name"""
+
+    _pending: Dict[str, Dict[str, List["asyncio.Future[Dict[str, Any]]"]]] = PrivateAttr(
+        default_factory=dict
+    )
+    _flushing: Dict[str, "asyncio.Task[None]"] = PrivateAttr(default_factory=dict)
+
+    def handles(self, operation: Type[Any]) -> bool:
+        """Whether lookups through this operation are coalesced."""
+        return operation.__name__ in self.lookups
+
+    async def aload(
+        self, operation: Type[Any], variables: Dict[str, Any], rath: "KabinetRath"
+    ) -> Dict[str, Any]:
+        """Load the entity of a by-ID operation through the next batch.
+
+        Args:
+            operation: The by-ID operation, e.g. ``GetFlavourQuery``
+            variables: The serialized variables of the operation
+            rath: The rath that sends the list query
+
+        Returns:
+            The data of the operation, as if it was executed on its own.
+        """
+        lookup = self.lookups[operation.__name__]
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(lookup.operation.__name__, {}).setdefault(
+            str(variables["id"]), []
+        ).append(future)
+
+        if lookup.operation.__name__ not in self._flushing:
+            self._flushing[lookup.operation.__name__] = asyncio.create_task(
+                self.aflush(lookup, rath)
+            )
+
+        return {lookup.field: await future}
+
+    async def aflush(self, lookup: ByIdLookup, rath: "KabinetRath") -> None:
+        """Resolve all pending lookups of an operation after the window closed."""
+        await asyncio.sleep(self.window)
+        pending = self._pending.pop(lookup.operation.__name__, {})
+        del self._flushing[lookup.operation.__name__]
+
+        ids = list(pending)
+        await asyncio.gather(
+            *(
+                self.aresolve(lookup, ids[i : i + self.max_batch_size], pending, rath)
+                for i in range(0, len(ids), self.max_batch_size)
+            )
+        )
+
+    async def aresolve(
+        self,
+        lookup: ByIdLookup,
+        ids: List[str],
+        pending: Dict[str, List["asyncio.Future[Dict[str, Any]]"]],
+        rath: "KabinetRath",
+    ) -> None:
+        """Resolve one chunk of IDs and fan the entities out to the waiting callers."""
+        try:
+            x = await rath.aquery(lookup.many.Meta.document, {"ids": ids})
+        except Exception as e:
+            for id in ids:
+                for future in pending[id]:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        entities = {str(entity["id"]): entity for entity in x.data[lookup.many_field]}
+        for id in ids:
+            for future in pending[id]:
+                if future.done():
+                    continue
+                if id in entities:
+                    future.set_result(entities[id])
+                else:
+                    future.set_exception(
+                        GraphQLException(
+                            f"{lookup.field.capitalize()} matching query does not exist. (ID: {id})"
+                        )
+                    )
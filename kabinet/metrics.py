@@ -0,0 +1,192 @@
+"""Per-operation metrics of the kabinet client.
+
+With a :class:`MetricsSink` on the rath, every query, mutation, stream and
+subscription executed through :mod:`kabinet.funcs` records an
+:class:`OperationSample`: its wall latency, the size of its request and
+response payloads (as reported by the transport, e.g. the
+``KabinetAIOHttpLink``), the time spent validating the response into the
+typed models, and the error it failed with, if any. Without a sink nothing
+is measured.
+
+The :class:`InMemoryMetricsSink` aggregates the samples per operation name
+into histograms. Other backends (e.g. Prometheus or OpenTelemetry) can be
+connected by implementing ``record``.
+
+Example:
+    ```python
+    rath = KabinetRath(link=..., metrics=InMemoryMetricsSink())
+
+    ...
+    flavours = rath.metrics.operations["MatchFlavour"]
+    print(flavours.latency.quantile(0.95), flavours.validation.mean)
+    ```
+"""
+
+import bisect
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from kabinet.documents import get_operation_name, get_operation_type
+from kabinet.tracing import Span
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30
+)
+
+
+@dataclass
+class OperationSample:
+    """The measurements of a single operation."""
+
+    operation: str
+    """The name of the operation, e.g. ``MatchFlavour``"""
+    kind: str
+    """The type of the operation (``query``, ``mutation`` or ``subscription``)"""
+    started_at: float = field(default_factory=time.perf_counter)
+    """The ``perf_counter`` time at which the operation started"""
+    latency: float = 0.0
+    """The wall time in seconds from the call until the result was built (or the
+    subscription closed)"""
+    request_bytes: int = 0
+    """The size of the (uncompressed) request payload in bytes, if the transport reports it"""
+    response_bytes: int = 0
+    """The size of the (uncompressed) response payload in bytes, if the transport reports it"""
+    validation_time: float = 0.0
+    """The time in seconds spent building the typed results"""
+    retries: int = 0
+    """The number of retries sent by the ``KabinetRetryLink``"""
+    variables: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    """The serialized variables of the operation"""
+    span: Optional[Span] = field(default=None, repr=False)
+    """The root span of the operation, if it was traced (see ``kabinet.tracing``)"""
+    cached: bool = False
+    """Whether the response was served from the response cache"""
+    error: Optional[str] = None
+    """The type of the exception the operation failed with, if any"""
+
+
+class Histogram(BaseModel):
+    """A histogram with fixed buckets, e.g. of latencies in seconds."""
+
+    buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    """The upper bounds of the buckets (an implicit last bucket holds everything above)"""
+    counts: List[int] = Field(default_factory=list)
+    """The number of observations per bucket"""
+    count: int = 0
+    """The number of observations"""
+    sum: float = 0.0
+    """The sum of all observations"""
+
+    def observe(self, value: float) -> None:
+        """Add an observation."""
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        """The mean of all observations."""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """The upper bound of the bucket that holds the ``q`` quantile (inf if above all)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class OperationMetrics(BaseModel):
+    """The aggregated metrics of one operation."""
+
+    calls: int = 0
+    """The number of calls"""
+    cached: int = 0
+    """The number of calls that were served from the response cache"""
+    errors: Dict[str, int] = Field(default_factory=dict)
+    """The number of failed calls per exception type"""
+    latency: Histogram = Field(default_factory=Histogram)
+    """The wall latency in seconds"""
+    validation: Histogram = Field(default_factory=Histogram)
+    """The time in seconds spent building the typed results"""
+    request_bytes: int = 0
+    """The total size of the request payloads in bytes"""
+    response_bytes: int = 0
+    """The total size of the response payloads in bytes"""
+
+    @property
+    def error_count(self) -> int:
+        """The number of failed calls."""
+        return sum(self.errors.values())
+
+
+class MetricsSink(BaseModel):
+    """Receives the samples of all operations."""
+
+    def record(self, sample: OperationSample) -> None:
+        """Receive the sample of a completed (or failed) operation."""
+        raise NotImplementedError("A metrics sink needs to implement record")
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """Aggregates samples in memory, per operation name."""
+
+    keep: int = 1000
+    """The number of recent samples to keep, e.g. for inspection in tests"""
+    operations: Dict[str, OperationMetrics] = Field(default_factory=dict)
+    """The aggregated metrics per operation name"""
+
+    _samples: Deque[OperationSample] = PrivateAttr(default_factory=deque)
+
+    @property
+    def samples(self) -> List[OperationSample]:
+        """The most recent samples, oldest first."""
+        return list(self._samples)
+
+    def record(self, sample: OperationSample) -> None:
+        """Aggregate a sample."""
+        metrics = self.operations.get(sample.operation)
+        if metrics is None:
+            metrics = self.operations[sample.operation] = OperationMetrics()
+        metrics.calls += 1
+        metrics.cached += sample.cached
+        if sample.error is not None:
+            metrics.errors[sample.error] = metrics.errors.get(sample.error, 0) + 1
+        metrics.latency.observe(sample.latency)
+        metrics.validation.observe(sample.validation_time)
+        metrics.request_bytes += sample.request_bytes
+        metrics.response_bytes += sample.response_bytes
+
+        self._samples.append(sample)
+        while len(self._samples) > self.keep:
+            self._samples.popleft()
+
+    def reset(self) -> None:
+        """Forget all metrics and samples."""
+        self.operations.clear()
+        self._samples.clear()
+
+
+def start_sample(document: str) -> OperationSample:
+    """Start measuring an operation of a turms document."""
+    return OperationSample(
+        operation=get_operation_name(document), kind=get_operation_type(document).value
+    )
+
+
+def finish_sample(sample: OperationSample, error: Optional[BaseException] = None) -> None:
+    """Complete a sample with its latency (and error)."""
+    sample.latency = time.perf_counter() - sample.started_at
+    if error is not None:
+        sample.error = type(error).__name__
@@ -0,0 +1,268 @@
+"""Auto-paginating iterators over the list operations.
+
+The ``aiter_*`` functions stream the items of a list operation page by page.
+While the caller processes one page, the next page is already being fetched.
+Iteration stops on the first page that is shorter than the page size, so only
+(at most) two pages are held in memory at a time.
+
+For full syncs, :func:`afetch_all` requests several pages concurrently
+through the generated list functions and reassembles them in order.
+
+Example:
+    ```python
+    async for pod in aiter_pods(page_size=500):
+        print(pod.pod_id)
+    ```
+"""
+
+import asyncio
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+from koil import unkoil, unkoil_gen
+
+from kabinet.api.schema import (
+    BackendFilter,
+    DefinitionFilter,
+    DeploymentFilter,
+    FlavourFilter,
+    ListBackend,
+    ListBackendsQuery,
+    ListDefinition,
+    ListDefinitionsQuery,
+    ListDeployment,
+    ListDeploymentsQuery,
+    ListFlavour,
+    ListFlavoursQuery,
+    ListPod,
+    ListPodQuery,
+    ListRelease,
+    ListReleasesQuery,
+    ListResource,
+    ListResourcesQuery,
+    OffsetPaginationInput,
+    PodFilter,
+    ReleaseFilter,
+    ResourceFilter,
+)
+from kabinet.funcs import aexecute
+from kabinet.rath import KabinetRath
+
+T = TypeVar("T")
+
+PageFetcher = Callable[[int, int], Awaitable[Sequence[T]]]
+
+DEFAULT_PAGE_SIZE = 100
+
+
+async def apages(
+    afetch: PageFetcher[T],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    concurrency: int = 1,
+) -> AsyncIterator[Sequence[T]]:
+    """Fetch pages with up to ``concurrency`` requests in flight, yielding them in order.
+
+    Pages are requested ahead of the caller. As soon as a short page is
+    seen, no further pages are requested and the ones still in flight are
+    cancelled.
+
+    Args:
+        afetch: Fetches the page at an offset, called as ``afetch(offset, limit)``
+        page_size: The number of items requested per page
+        concurrency: The maximum number of page requests in flight
+
+    Yields:
+        The pages, in order, up to and including the first short page.
+    """
+    if page_size < 1 or concurrency < 1:
+        raise ValueError("page_size and concurrency need to be at least 1")
+
+    offset = 0
+    in_flight: Deque["asyncio.Future[Sequence[T]]"] = deque()
+    for _ in range(concurrency):
+        in_flight.append(asyncio.ensure_future(afetch(offset, page_size)))
+        offset += page_size
+
+    try:
+        while in_flight:
+            page = await in_flight.popleft()
+            if len(page) < page_size:
+                yield page
+                return
+
+            in_flight.append(asyncio.ensure_future(afetch(offset, page_size)))
+            offset += page_size
+            yield page
+    finally:
+        for future in in_flight:
+            future.cancel()
+        # Wait for the cancelled prefetches, so that no task outlives the iterator
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+async def aiterate(
+    operation: Type[Any],
+    field: str,
+    variables: Optional[Dict[str, Any]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    rath: Optional[KabinetRath] = None,
+    concurrency: int = 1,
+) -> AsyncIterator[Any]:
+    """Iterate over the items of a paginated list operation.
+
+    Args:
+        operation: The list operation, which needs a ``pagination`` argument
+        field: The field of the operation that holds the items
+        variables: The other variables of the operation (e.g. ``filters``)
+        page_size: The number of items requested per page
+        rath: The client we want to use (defaults to the currently active client)
+        concurrency: The number of pages requested ahead of the caller
+
+    Yields:
+        The items of all pages, in order.
+    """
+    variables = variables or {}
+
+    async def afetch(offset: int, limit: int) -> Sequence[Any]:
+        page_variables = {**variables, "pagination": {"limit": limit, "offset": offset}}
+        return getattr(await aexecute(operation, page_variables, rath=rath), field)
+
+    async for page in apages(afetch, page_size, concurrency):
+        for item in page:
+            yield item
+
+
+async def afetch_all(
+    list_function: Callable[..., Awaitable[Sequence[T]]],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    concurrency: int = 4,
+    **kwargs: Any,  # noqa: ANN401
+) -> List[T]:
+    """Fetch all items of a paginated list function with concurrent page requests.
+
+    Up to ``concurrency`` pages are requested at once, so that a full sync
+    takes about one round trip per ``concurrency`` pages.
+
+    Example:
+        ```python
+        flavours = await afetch_all(alist_flavours, page_size=200, concurrency=8)
+        ```
+
+    Args:
+        list_function: A generated list function with a ``pagination`` argument,
+            e.g. ``alist_flavours``, ``alist_resources`` or ``alist_backends``
+        page_size: The number of items requested per page
+        concurrency: The maximum number of page requests in flight
+        **kwargs: The other arguments of the list function (e.g. ``filters`` or ``rath``)
+
+    Returns:
+        The items of all pages, in order.
+    """
+
+    async def afetch(offset: int, limit: int) -> Sequence[T]:
+        return await list_function(
+            pagination=OffsetPaginationInput(offset=offset, limit=limit), **kwargs
+        )
+
+    items: List[T] = []
+    async for page in apages(afetch, page_size, concurrency):
+        items.extend(page)
+    return items
+
+
+def aiter_pods(
+    filters: Optional[PodFilter] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListPod]:
+    """Iterate over all pods visible to the current organization, page by page."""
+    return aiterate(ListPodQuery, "pods", {"filters": filters}, page_size, rath)
+
+
+def aiter_definitions(
+    filters: Optional[DefinitionFilter] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListDefinition]:
+    """Iterate over all definitions, page by page."""
+    return aiterate(ListDefinitionsQuery, "definitions", {"filters": filters}, page_size, rath)
+
+
+def aiter_releases(
+    filters: Optional[ReleaseFilter] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListRelease]:
+    """Iterate over all releases, page by page."""
+    return aiterate(ListReleasesQuery, "releases", {"filters": filters}, page_size, rath)
+
+
+def aiter_deployments(
+    filters: Optional[DeploymentFilter] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListDeployment]:
+    """Iterate over all deployments, page by page."""
+    return aiterate(ListDeploymentsQuery, "deployments", {"filters": filters}, page_size, rath)
+
+
+def aiter_flavours(
+    filters: Optional[FlavourFilter] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListFlavour]:
+    """Iterate over all flavours visible to the current organization, page by page."""
+    return aiterate(ListFlavoursQuery, "flavours", {"filters": filters}, page_size, rath)
+
+
+def aiter_backends(
+    filters: Optional[BackendFilter] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListBackend]:
+    """Iterate over all backends, page by page."""
+    return aiterate(ListBackendsQuery, "backends", {"filters": filters}, page_size, rath)
+
+
+def aiter_resources(
+    filters: Optional[ResourceFilter] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListResource]:
+    """Iterate over all resources, page by page."""
+    return aiterate(ListResourcesQuery, "resources", {"filters": filters}, page_size, rath)
+
+
+def iterate(
+    operation: Type[Any],
+    field: str,
+    variables: Optional[Dict[str, Any]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    rath: Optional[KabinetRath] = None,
+    concurrency: int = 1,
+) -> Iterator[Any]:
+    """Iterate over the items of a paginated list operation in a blocking way."""
+    return unkoil_gen(aiterate, operation, field, variables, page_size, rath, concurrency)
+
+
+def fetch_all(
+    list_function: Callable[..., Awaitable[Sequence[T]]],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    concurrency: int = 4,
+    **kwargs: Any,  # noqa: ANN401
+) -> List[T]:
+    """Fetch all items of a paginated list function in a blocking way."""
+    return unkoil(afetch_all, list_function, page_size, concurrency, **kwargs)
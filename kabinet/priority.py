@@ -0,0 +1,67 @@
+"""Priority classes for outgoing operations.
+
+When a concurrency cap or a rate limit of the
+:class:`kabinet.limits.RequestLimiter` is saturated, waiting operations get
+a slot (or a token) in the order of their priority, and in the order they
+arrived within a priority. This lets interactive
+lookups, like the typeahead searches of the rekuest widgets, jump ahead of
+bulk syncs of the catalogue.
+
+The priority of an operation is, in this order:
+
+- the ``priority`` passed per call (``aexecute(..., priority=...)``)
+- the priority of the enclosing :func:`request_priority` scope
+- the priority configured for the operation name on the limiter
+- :func:`default_priority` of the operation name
+
+Example:
+    ```python
+    with request_priority(Priority.BULK):
+        releases = await alist_releases()
+    ```
+"""
+
+import contextvars
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Iterator, Optional
+
+
+class Priority(IntEnum):
+    """The priority class of an operation (lower values are served first)."""
+
+    INTERACTIVE = 0
+    """Latency sensitive operations a user is waiting for"""
+    NORMAL = 1
+    """Everything else"""
+    BULK = 2
+    """Background work, e.g. syncing whole lists"""
+
+
+current_priority: contextvars.ContextVar[Optional[Priority]] = contextvars.ContextVar(
+    "current_priority", default=None
+)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Send every operation in this context with ``priority``."""
+    token = current_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+def default_priority(operation_name: Optional[str]) -> Priority:
+    """The priority of an operation that has none configured.
+
+    Searches and pod lookups are interactive, list operations are bulk work.
+    """
+    if operation_name is None:
+        return Priority.NORMAL
+    if operation_name.startswith("Search") or operation_name == "GetPod":
+        return Priority.INTERACTIVE
+    if operation_name.startswith("List"):
+        return Priority.BULK
+    return Priority.NORMAL
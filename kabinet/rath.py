@@ -1,17 +1,31 @@
 """The graphql rath client for  kabinet"""
 
 from types import TracebackType
-from typing import Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
 from pydantic import Field
 from rath import rath
 import contextvars
 
 from rath.links.auth import AuthTokenLink
+from rath.links.base import ContinuationLink, Link
 
 from rath.links.compose import TypedComposedLink
 from rath.links.dictinglink import DictingLink
 from rath.links.shrink import ShrinkingLink
 from rath.links.split import SplitLink
+from rath.operation import GraphQLResult, Operation, opify
+
+from kabinet.cache import ResponseCache
+from kabinet.hedging import HedgedReads
+from kabinet.hub import PodHub
+from kabinet.limits import RequestLimiter
+from kabinet.links.faults import FaultInjectionLink
+from kabinet.links.persisted import PersistedQueryLink
+from kabinet.links.retry import KabinetRetryLink
+from kabinet.loader import KabinetLoader
+from kabinet.metrics import MetricsSink
+from kabinet.slowlog import SlowOperationLog
+from kabinet.tracing import Tracer, TracingLink
 
 current_kabinet_rath: contextvars.ContextVar[Optional["KabinetRath"]] = contextvars.ContextVar(
     "current_kabinet_rath", default=None
@@ -19,12 +33,43 @@ current_kabinet_rath: contextvars.ContextVar[Optional["KabinetRath"]] = contextv
 
 
 class KabinetLinkComposition(TypedComposedLink):
-    """Kabinet Link Composition"""
+    """Kabinet Link Composition
+
+    With a ``tracer`` (set by the rath, see ``kabinet.tracing``), every link
+    of the composition runs within a span named after its field.
+
+    The ``recording`` slot takes a recording link such as
+    ``kabinet.links.cassette.RecordingLink``, which is not imported here.
+    """
 
     shrinking: ShrinkingLink = Field(default_factory=ShrinkingLink)
     dicting: DictingLink = Field(default_factory=DictingLink)
+    recording: Optional[ContinuationLink] = None
+    retry: Optional[KabinetRetryLink] = None
     auth: AuthTokenLink
+    persisted: Optional[PersistedQueryLink] = None
+    faults: Optional[FaultInjectionLink] = None
     split: SplitLink
+    tracer: Optional[Tracer] = Field(default=None, exclude=True)
+
+    async def __aenter__(self) -> "KabinetLinkComposition":
+        """Compose the links, putting a tracing link in front of each if traced."""
+        if self.tracer is None:
+            return await super().__aenter__()
+
+        chain: List[Link] = []
+        for name, link in self:
+            if isinstance(link, Link):
+                chain += [TracingLink(name=name, tracer=self.tracer), link]
+
+        for link, next_link in zip(chain, chain[1:]):
+            assert isinstance(link, ContinuationLink), f"{link} needs to be a ContinuationLink"
+            link.set_next(next_link)
+        for link in chain:
+            await link.__aenter__()
+
+        self._firstlink = chain[0]
+        return self
 
 
 class KabinetRath(rath.Rath):
@@ -34,8 +79,59 @@ class KabinetRath(rath.Rath):
         rath (_type_): _description_
     """
 
+    loader: Optional[KabinetLoader] = None
+    """An optional loader that coalesces concurrent by-ID lookups into list queries"""
+    cache: Optional[ResponseCache] = None
+    """An optional cache for the responses of read queries"""
+    hub: Optional[PodHub] = None
+    """An optional hub that shares one ``pods`` subscription between all pod watchers"""
+    hedging: Optional[HedgedReads] = None
+    """An optional policy that sends a second copy of slow idempotent queries"""
+    limiter: Optional[RequestLimiter] = None
+    """Optional concurrency and rate limits per operation type"""
+    metrics: Optional[MetricsSink] = None
+    """An optional sink for the metrics of every operation (see ``kabinet.metrics``)"""
+    tracer: Optional[Tracer] = None
+    """An optional tracer for the phases of every operation (see ``kabinet.tracing``)"""
+    slow_log: Optional[SlowOperationLog] = None
+    """An optional log of the operations that exceed a latency threshold"""
+
+    async def aquery_operation(self, operation: Operation) -> GraphQLResult:
+        """Execute a query or mutation, within the limits of the limiter."""
+        if self.limiter is None:
+            return await super().aquery_operation(operation)
+        limit = self.limiter.limit_for(operation)
+        async with limit.aslot(self.limiter.priority_for(operation)):
+            return await super().aquery_operation(operation)
+
+    async def asubscribe(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncGenerator[GraphQLResult, None]:
+        """Subscribe to an operation, holding a slot of the limiter while it is open."""
+        if self.limiter is None:
+            async for result in super().asubscribe(
+                query, variables, headers, operation_name, **kwargs
+            ):
+                yield result
+            return
+
+        operation = opify(query, variables, headers, operation_name, **kwargs)
+        limit = self.limiter.limit_for(operation)
+        async with limit.aslot(self.limiter.priority_for(operation)):
+            async for result in self.link.aexecute(operation):
+                yield result
+
     async def __aenter__(self) -> "KabinetRath":
         """Set the current Rekuest Next Rath client in the context variable."""
+        if self.slow_log is not None and self.slow_log.trace and self.tracer is None:
+            self.tracer = Tracer()
+        if self.tracer is not None and isinstance(self.link, KabinetLinkComposition):
+            self.link.tracer = self.link.tracer or self.tracer
         await super().__aenter__()
         current_kabinet_rath.set(self)
         return self
@@ -0,0 +1,111 @@
+"""Replaying recorded traffic through a rath.
+
+:func:`areplay` sends the queries and mutations of a cassette (see
+:mod:`kabinet.links.cassette`) again, as the typed operations of
+``kabinet.api.schema``, so that they pass through every feature of the
+client (the loader, the response cache, the limiter, ...). With ``pace``,
+every operation is sent at the time it was recorded relative to the first
+one (sped up by ``speed``), concurrently with the operations that are
+still running; otherwise the operations are sent one after another.
+
+Against a :class:`kabinet.links.cassette.ReplayLink` serving the same
+cassette, this reproduces recorded traffic offline.
+
+Example:
+    ```python
+    cassette = Cassette.load("traffic.jsonl.gz")
+    rath = KabinetRath(
+        link=ReplayLink(cassette=cassette, timing=True),
+        cache=ResponseCache(),
+        metrics=InMemoryMetricsSink(),
+    )
+    async with rath:
+        results = await areplay(cassette, rath, speed=60, operations={"ListReleases"})
+    ```
+"""
+
+import asyncio
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from pydantic import BaseModel
+
+from kabinet.documents import get_operation_name
+from kabinet.funcs import aexecute
+from kabinet.links.cassette import Cassette, Exchange
+from kabinet.rath import KabinetRath
+
+
+@lru_cache(maxsize=None)
+def operations_by_name() -> Dict[str, Type[BaseModel]]:
+    """The operations of ``kabinet.api.schema``, by operation name."""
+    from kabinet.api import schema
+
+    return {
+        get_operation_name(value.Meta.document): value
+        for value in vars(schema).values()
+        if isinstance(value, type)
+        and issubclass(value, BaseModel)
+        and hasattr(value, "Arguments")
+        and hasattr(value, "Meta")
+    }
+
+
+async def areplay(
+    cassette: Cassette,
+    rath: Optional[KabinetRath] = None,
+    speed: float = 1.0,
+    pace: bool = True,
+    operations: Optional[Iterable[str]] = None,
+) -> List[Any]:
+    """Send the recorded queries and mutations again.
+
+    Args:
+        cassette: The recorded traffic
+        rath: The rath to send the operations through (the current one by default)
+        speed: How much faster than recorded the operations are sent, if paced
+        pace: Whether the operations are sent at their recorded times
+        operations: The names of the operations to replay (None for all)
+
+    Returns:
+        The results of the operations in the order they were recorded, with
+        the exception instead for the operations that failed.
+    """
+    known = operations_by_name()
+    selected = None if operations is None else set(operations)
+    exchanges = sorted(
+        (
+            exchange
+            for exchange in cassette.exchanges
+            if exchange.kind != "subscription"
+            and (selected is None or exchange.operation in selected)
+        ),
+        key=lambda exchange: exchange.at,
+    )
+    unknown = {exchange.operation for exchange in exchanges} - set(known)
+    if unknown:
+        raise ValueError(f"The cassette holds operations that kabinet does not know: {unknown}")
+    if not exchanges:
+        return []
+
+    origin = exchanges[0].at
+    start = time.perf_counter()
+
+    async def send(exchange: Exchange) -> Any:  # noqa: ANN401
+        if pace:
+            delay = (exchange.at - origin) / speed - (time.perf_counter() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        return await aexecute(known[exchange.operation], exchange.variables, rath=rath)
+
+    if pace:
+        return await asyncio.gather(*map(send, exchanges), return_exceptions=True)
+
+    results: List[Any] = []
+    for exchange in exchanges:
+        try:
+            results.append(await send(exchange))
+        except Exception as e:
+            results.append(e)
+    return results
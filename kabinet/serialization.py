@@ -0,0 +1,94 @@
+"""Pluggable JSON codecs for the kabinet transports.
+
+Encoding variables and decoding responses with the standard library shows up
+in the profiles of large operations. The transports therefore encode and
+decode through a :class:`JSONCodec`, which defaults to :class:`OrjsonCodec`
+if ``orjson`` is installed (``pip install kabinet[orjson]``), and to the
+standard library otherwise.
+
+Example:
+    ```python
+    link = KabinetAIOHttpLink(endpoint_url=..., json_codec=StdlibJSONCodec())
+    ```
+"""
+
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional, Type, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class DateTimeEncoder(json.JSONEncoder):
+    """A JSON encoder that encodes datetimes as ISO 8601 strings, like ``orjson`` does."""
+
+    def default(self, o: Any) -> Any:  # noqa: ANN401
+        """Encode datetimes, deferring to the standard encoder for everything else."""
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class JSONCodec(BaseModel):
+    """Encodes and decodes JSON documents."""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = "abstract"
+    """The name of the codec, e.g. ``orjson``"""
+
+    def dumps(self, value: Any) -> bytes:  # noqa: ANN401
+        """Encode a value as UTF-8 JSON."""
+        raise NotImplementedError("A JSON codec needs to implement dumps")
+
+    def loads(self, data: Union[str, bytes]) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        raise NotImplementedError("A JSON codec needs to implement loads")
+
+
+class StdlibJSONCodec(JSONCodec):
+    """The ``json`` module of the standard library."""
+
+    name: str = "json"
+    encoder: Type[json.JSONEncoder] = Field(default=DateTimeEncoder, exclude=True)
+    """The encoder for values that are not natively supported, e.g. datetimes"""
+
+    def dumps(self, value: Any) -> bytes:  # noqa: ANN401
+        """Encode a value as UTF-8 JSON."""
+        return json.dumps(value, cls=self.encoder).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """The ``orjson`` package, which encodes datetimes natively."""
+
+    name: str = "orjson"
+
+    def dumps(self, value: Any) -> bytes:  # noqa: ANN401
+        """Encode a value as UTF-8 JSON."""
+        return orjson.dumps(value)
+
+    def loads(self, data: Union[str, bytes]) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        return orjson.loads(data)
+
+
+@lru_cache(maxsize=None)
+def default_json_codec(encoder: Optional[Type[json.JSONEncoder]] = None) -> JSONCodec:
+    """The fastest available codec, or the standard library with a custom ``encoder``.
+
+    ``orjson`` cannot use a ``json.JSONEncoder``, so types that only a custom
+    encoder knows how to encode are always encoded with the standard library.
+    """
+    if encoder is None and orjson is not None:
+        return OrjsonCodec()
+    return StdlibJSONCodec(encoder=encoder or DateTimeEncoder)
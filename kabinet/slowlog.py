@@ -0,0 +1,132 @@
+"""A log of slow operations.
+
+With a :class:`SlowOperationLog` on the rath, every query or mutation that
+takes longer than its threshold is logged (to the ``kabinet.slow`` logger)
+with its name, its truncated variables, the size of its response, the
+number of retries it needed and the time spent in every phase of the link
+chain (see :mod:`kabinet.tracing`). The most recent entries are also kept
+on the log itself, so that a slow call can be identified after the fact.
+
+Subscriptions are open for as long as they are consumed, so they are never
+logged.
+
+Example:
+    ```python
+    rath = KabinetRath(
+        link=...,
+        slow_log=SlowOperationLog(threshold=1, thresholds={"ListPods": 5}),
+    )
+
+    ...
+    for entry in rath.slow_log.entries:
+        print(entry.describe())
+    ```
+"""
+
+import json
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from pydantic import BaseModel, PrivateAttr
+
+from kabinet.metrics import OperationSample
+
+logger = logging.getLogger("kabinet.slow")
+
+
+def truncate(variables: Optional[Dict[str, Any]], limit: int) -> str:
+    """The JSON of the variables, truncated to ``limit`` characters."""
+    text = json.dumps(variables or {}, default=str, separators=(",", ":"))
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... ({len(text)} characters)"
+
+
+class SlowOperation(BaseModel):
+    """An operation that exceeded its threshold."""
+
+    operation: str
+    """The name of the operation, e.g. ``MatchFlavour``"""
+    at: datetime
+    """When the operation completed"""
+    latency: float
+    """The wall time of the operation in seconds"""
+    variables: str
+    """The (truncated) JSON of the variables"""
+    response_bytes: int
+    """The size of the response payload in bytes (0 if the transport does not report it)"""
+    retries: int
+    """The number of retries the operation needed"""
+    phases: Dict[str, float]
+    """The time spent in every phase in seconds, if the operation was traced"""
+    error: Optional[str] = None
+    """The type of the exception the operation failed with, if any"""
+
+    def describe(self) -> str:
+        """A one line description of the operation."""
+        phases = ", ".join(
+            f"{name}={seconds * 1000:.1f}ms"
+            for name, seconds in sorted(self.phases.items(), key=lambda item: -item[1])
+        )
+        return (
+            f"{self.operation} took {self.latency:.3f}s"
+            f"{f' and failed with {self.error}' if self.error else ''}"
+            f" (response {self.response_bytes} bytes, {self.retries} retries"
+            f"{f', phases: {phases}' if phases else ''}) variables={self.variables}"
+        )
+
+
+class SlowOperationLog(BaseModel):
+    """Logs the operations that exceed a latency threshold."""
+
+    threshold: float = 1.0
+    """The latency in seconds above which operations are logged"""
+    thresholds: Dict[str, float] = {}
+    """The threshold per operation name, overriding ``threshold``"""
+    max_variables_length: int = 500
+    """The number of characters of the variables JSON that are logged"""
+    level: int = logging.WARNING
+    """The level slow operations are logged with"""
+    trace: bool = True
+    """Whether the rath traces its operations (with a plain tracer if it has none)"""
+    keep: int = 100
+    """The number of recent slow operations that are kept"""
+
+    logged: int = 0
+    """The number of slow operations that were logged"""
+
+    _entries: Deque[SlowOperation] = PrivateAttr(default_factory=deque)
+
+    @property
+    def entries(self) -> List[SlowOperation]:
+        """The most recent slow operations, oldest first."""
+        return list(self._entries)
+
+    def threshold_for(self, operation: str) -> float:
+        """The threshold of an operation."""
+        return self.thresholds.get(operation, self.threshold)
+
+    def record(self, sample: OperationSample) -> None:
+        """Log the operation if it was slow."""
+        if sample.kind == "subscription" or sample.latency < self.threshold_for(
+            sample.operation
+        ):
+            return
+
+        entry = SlowOperation(
+            operation=sample.operation,
+            at=datetime.now(),
+            latency=sample.latency,
+            variables=truncate(sample.variables, self.max_variables_length),
+            response_bytes=sample.response_bytes,
+            retries=sample.retries,
+            phases=sample.span.breakdown() if sample.span is not None else {},
+            error=sample.error,
+        )
+        self.logged += 1
+        self._entries.append(entry)
+        while len(self._entries) > self.keep:
+            self._entries.popleft()
+        logger.log(self.level, "Slow operation: %s", entry.describe())
@@ -0,0 +1,118 @@
+"""Streaming variants of the list operations.
+
+The ``astream_*`` functions take the same arguments as their ``alist_*``
+counterparts, but yield the items one by one while the response is still
+being received (see :func:`kabinet.funcs.astream`).
+
+Example:
+    ```python
+    async for release in astream_releases():
+        print(release.version)
+    ```
+"""
+
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from kabinet.api.schema import (
+    BackendFilter,
+    DefinitionFilter,
+    DeploymentFilter,
+    FlavourFilter,
+    FlavourOrder,
+    ListBackend,
+    ListBackendsQuery,
+    ListDefinition,
+    ListDefinitionsQuery,
+    ListDeployment,
+    ListDeploymentsQuery,
+    ListFlavour,
+    ListFlavoursQuery,
+    ListPod,
+    ListPodQuery,
+    ListRelease,
+    ListReleasesQuery,
+    ListResource,
+    ListResourcesQuery,
+    OffsetPaginationInput,
+    PodFilter,
+    ReleaseFilter,
+    ResourceFilter,
+)
+from kabinet.funcs import astream
+from kabinet.rath import KabinetRath
+
+
+def build_variables(**variables: Any) -> Dict[str, Any]:  # noqa: ANN401
+    """The variables that were set, leaving the others to the server defaults."""
+    return {key: value for key, value in variables.items() if value is not None}
+
+
+def astream_releases(
+    filters: Optional[ReleaseFilter] = None,
+    pagination: Optional[OffsetPaginationInput] = None,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListRelease]:
+    """Stream all releases."""
+    variables = build_variables(filters=filters, pagination=pagination)
+    return astream(ListReleasesQuery, variables, rath=rath)
+
+
+def astream_flavours(
+    filters: Optional[FlavourFilter] = None,
+    pagination: Optional[OffsetPaginationInput] = None,
+    ordering: Optional[List[FlavourOrder]] = None,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListFlavour]:
+    """Stream all flavours visible to the current organization."""
+    variables = build_variables(filters=filters, pagination=pagination, ordering=ordering)
+    return astream(ListFlavoursQuery, variables, rath=rath)
+
+
+def astream_pods(
+    filters: Optional[PodFilter] = None,
+    pagination: Optional[OffsetPaginationInput] = None,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListPod]:
+    """Stream all pods visible to the current organization."""
+    variables = build_variables(filters=filters, pagination=pagination)
+    return astream(ListPodQuery, variables, rath=rath)
+
+
+def astream_definitions(
+    filters: Optional[DefinitionFilter] = None,
+    pagination: Optional[OffsetPaginationInput] = None,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListDefinition]:
+    """Stream all definitions."""
+    variables = build_variables(filters=filters, pagination=pagination)
+    return astream(ListDefinitionsQuery, variables, rath=rath)
+
+
+def astream_deployments(
+    filters: Optional[DeploymentFilter] = None,
+    pagination: Optional[OffsetPaginationInput] = None,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListDeployment]:
+    """Stream all deployments."""
+    variables = build_variables(filters=filters, pagination=pagination)
+    return astream(ListDeploymentsQuery, variables, rath=rath)
+
+
+def astream_backends(
+    filters: Optional[BackendFilter] = None,
+    pagination: Optional[OffsetPaginationInput] = None,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListBackend]:
+    """Stream all backends."""
+    variables = build_variables(filters=filters, pagination=pagination)
+    return astream(ListBackendsQuery, variables, rath=rath)
+
+
+def astream_resources(
+    filters: Optional[ResourceFilter] = None,
+    pagination: Optional[OffsetPaginationInput] = None,
+    rath: Optional[KabinetRath] = None,
+) -> AsyncIterator[ListResource]:
+    """Stream all resources."""
+    variables = build_variables(filters=filters, pagination=pagination)
+    return astream(ListResourcesQuery, variables, rath=rath)
@@ -0,0 +1,9 @@
+"""Testing utilities for the kabinet client.
+
+This module provides an in-process stand-in for the kabinet server that
+can be used to exercise the client without a running deployment.
+"""
+
+from .standin import StandInLink, StandInStore
+
+__all__ = ["StandInLink", "StandInStore"]
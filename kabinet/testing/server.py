@@ -0,0 +1,245 @@
+"""A local HTTP server in front of the stand-in store.
+
+Unlike the :class:`kabinet.testing.StandInLink`, the server exercises the
+real transport of the client. It speaks GraphQL over HTTP, supports
+automatic persisted queries and compressed request bodies, optionally
+compresses its responses, and records what it received, so that tests and
+benchmarks can inspect the traffic. Subscriptions are served with the
+graphql-ws protocol on the same path.
+
+Used as a regular (not async) context manager, the server runs on a
+thread with its own event loop, so that it does not compete with the
+client for its loop, e.g. in benchmarks or for blocking clients.
+
+This module requires ``aiohttp``.
+
+Example:
+    ```python
+    async with StandInServer() as server:
+        rath = KabinetRath(link=KabinetAIOHttpLink(endpoint_url=server.url))
+        ws = KabinetGraphQLWSLink(ws_endpoint_url=server.ws_url)
+    ```
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp import WSMsgType, web
+from graphql import subscribe
+
+from kabinet.compression import get_codec, negotiate
+
+from .standin import StandInStore, StandInSubscriptions, get_schema, parse_document
+
+PERSISTED_QUERY_NOT_FOUND = {
+    "message": "PersistedQueryNotFound",
+    "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+}
+
+
+class StandInServer:
+    """Serves a stand-in store over HTTP on a random local port."""
+
+    def __init__(
+        self,
+        store: Optional[StandInStore] = None,
+        host: str = "127.0.0.1",
+        compression_threshold: Optional[int] = None,
+    ) -> None:
+        """Create a server for the store (a fresh store by default).
+
+        Responses of at least ``compression_threshold`` bytes are compressed
+        if the client accepts it (None never compresses responses).
+        """
+        self.store = store or StandInStore()
+        self.host = host
+        self.compression_threshold = compression_threshold
+        self.port = 0
+        self.persisted: Dict[str, str] = {}
+        self.requests: List[Dict[str, Any]] = []
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[Tuple[asyncio.AbstractEventLoop, threading.Thread]] = None
+
+    @property
+    def url(self) -> str:
+        """The GraphQL endpoint of the running server."""
+        return f"http://{self.host}:{self.port}/graphql"
+
+    @property
+    def ws_url(self) -> str:
+        """The graphql-ws endpoint of the running server."""
+        return f"ws://{self.host}:{self.port}/graphql"
+
+    def build_app(self) -> web.Application:
+        """Build the aiohttp application serving the store."""
+        app = web.Application()
+        app.router.add_post("/graphql", self.handle)
+        app.router.add_get("/graphql", self.handle_ws)
+        return app
+
+    def respond(self, payload: Dict[str, Any], accept: Optional[str] = None) -> web.Response:
+        """Serialize a GraphQL response, compressing it if the client accepts it."""
+        body = json.dumps(payload).encode("utf-8")
+        headers = {}
+        codec = negotiate(accept)
+        if (
+            codec is not None
+            and self.compression_threshold is not None
+            and len(body) >= self.compression_threshold
+        ):
+            body = codec.compress(body)
+            headers["Content-Encoding"] = codec.name
+        self.bytes_sent += len(body)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    def resolve_document(self, payload: Dict[str, Any]) -> Optional[str]:
+        """The document of a request, resolving and registering persisted queries."""
+        query = payload.get("query")
+        persisted = (payload.get("extensions") or {}).get("persistedQuery")
+        if not persisted:
+            return query
+
+        sha256 = persisted["sha256Hash"]
+        if query is None:
+            return self.persisted.get(sha256)
+
+        if hashlib.sha256(query.encode("utf-8")).hexdigest() != sha256:
+            raise ValueError("provided sha does not match query")
+        self.persisted[sha256] = query
+        return query
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Execute a GraphQL over HTTP request."""
+        body = await request.read()
+        # aiohttp already decompressed gzip and deflate bodies, but counts on the wire
+        self.bytes_received += request.content_length or len(body)
+        encoding = request.headers.get("Content-Encoding", "identity")
+        if encoding not in ("identity", "gzip", "deflate"):
+            body = get_codec(encoding).decompress(body)
+        payload = json.loads(body)
+        self.requests.append(payload)
+        accept = request.headers.get("Accept-Encoding")
+
+        try:
+            document = self.resolve_document(payload)
+        except ValueError as e:
+            return self.respond({"errors": [{"message": str(e)}]}, accept)
+        if document is None:
+            return self.respond({"errors": [PERSISTED_QUERY_NOT_FOUND]}, accept)
+
+        result = await self.store.aexecute(
+            document, payload.get("variables"), payload.get("operationName")
+        )
+        return self.respond(result.formatted, accept)
+
+    async def send(self, ws: web.WebSocketResponse, message: Dict[str, Any]) -> None:
+        """Send a graphql-ws message."""
+        text = json.dumps(message)
+        self.bytes_sent += len(text)
+        await ws.send_str(text)
+
+    async def stream(self, ws: web.WebSocketResponse, id: str, payload: Dict[str, Any]) -> None:
+        """Stream the events of a subscription until it ends or is stopped."""
+        node, errors = parse_document(payload["query"])
+        if node is None:
+            formatted = [error.formatted for error in errors]
+            await self.send(ws, {"id": id, "type": "error", "payload": formatted})
+            return
+        try:
+            iterator = await subscribe(
+                get_schema(),
+                node,
+                root_value=StandInSubscriptions(self.store),
+                variable_values=payload.get("variables"),
+                operation_name=payload.get("operationName"),
+            )
+        except Exception as e:
+            await self.send(ws, {"id": id, "type": "error", "payload": {"message": str(e)}})
+            return
+        if not hasattr(iterator, "__aiter__"):
+            errors = [error.formatted for error in iterator.errors or []]  # type: ignore
+            await self.send(ws, {"id": id, "type": "error", "payload": errors})
+            return
+
+        try:
+            async for event in iterator:  # type: ignore
+                await self.send(ws, {"id": id, "type": "data", "payload": event.formatted})
+            await self.send(ws, {"id": id, "type": "complete"})
+        finally:
+            await iterator.aclose()  # type: ignore
+
+    async def handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        """Serve subscriptions over a graphql-ws connection."""
+        ws = web.WebSocketResponse(protocols=("graphql-ws",))
+        await ws.prepare(request)
+        subscriptions: Dict[str, asyncio.Task] = {}
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                self.bytes_received += len(message.data)
+                payload = json.loads(message.data)
+                self.requests.append(payload)
+                kind, id = payload.get("type"), payload.get("id")
+                if kind == "connection_init":
+                    await self.send(ws, {"type": "connection_ack"})
+                elif kind == "start":
+                    subscriptions[id] = asyncio.create_task(
+                        self.stream(ws, id, payload["payload"])
+                    )
+                elif kind == "stop" and id in subscriptions:
+                    subscriptions.pop(id).cancel()
+                elif kind == "connection_terminate":
+                    break
+        finally:
+            for task in subscriptions.values():
+                task.cancel()
+        return ws
+
+    async def astart(self) -> None:
+        """Start serving on a random free port."""
+        self._runner = web.AppRunner(self.build_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]  # type: ignore
+
+    async def astop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "StandInServer":
+        """Start the server."""
+        await self.astart()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:  # noqa: ANN401
+        """Stop the server."""
+        await self.astop()
+
+    def __enter__(self) -> "StandInServer":
+        """Start the server on a thread with its own event loop."""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        asyncio.run_coroutine_threadsafe(self.astart(), loop).result()
+        self._thread = (loop, thread)
+        return self
+
+    def __exit__(self, *args: Any) -> None:  # noqa: ANN401
+        """Stop the server and its thread."""
+        if self._thread is None:
+            return
+        loop, thread = self._thread
+        asyncio.run_coroutine_threadsafe(self.astop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        self._thread = None
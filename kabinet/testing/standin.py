@@ -0,0 +1,542 @@
+"""An in-process stand-in for the kabinet server.
+
+The stand-in executes operations against the bundled ``schema.graphql`` with
+graphql-core and resolves them from an in-memory store of synthetic entities.
+It only implements the parts of the API that the client exercises, but it
+honours aliases, fragments, filters and pagination like the real server does.
+"""
+
+import asyncio
+import os
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from graphql import (
+    DocumentNode,
+    ExecutionResult,
+    GraphQLError,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    OperationType,
+    build_schema,
+    execute,
+    parse,
+    subscribe,
+    validate,
+)
+from pydantic import Field
+from rath.links.base import AsyncTerminatingLink
+from rath.operation import GraphQLException, GraphQLResult, Operation
+
+Entity = Dict[str, Any]
+
+
+def build_relative_path(*path: str) -> str:
+    """Build a path relative to the kabinet package."""
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), *path)
+
+
+@lru_cache(maxsize=1)
+def get_schema() -> GraphQLSchema:
+    """Build (once) the executable kabinet schema from the bundled SDL."""
+    with open(build_relative_path("api", "schema.graphql")) as f:
+        return build_schema(f.read(), assume_valid_sdl=True)
+
+
+@lru_cache(maxsize=256)
+def parse_document(document: str) -> Tuple[Optional[DocumentNode], Tuple[GraphQLError, ...]]:
+    """Parse and validate (once) a document, returning its AST or its errors.
+
+    Clients send the same few documents over and over, so that parsing and
+    validating them each time would dominate the time of the stand-in.
+    """
+    try:
+        node = parse(document)
+    except GraphQLError as error:
+        return None, (error,)
+    errors = validate(get_schema(), node)
+    return (None, tuple(errors)) if errors else (node, ())
+
+
+def filter_entities(entities: List[Entity], filters: Optional[Dict[str, Any]]) -> List[Entity]:
+    """Apply the common ``ids`` and ``search`` filters to a list of entities."""
+    if not filters:
+        return entities
+    if filters.get("ids") is not None:
+        ids = set(filters["ids"])
+        entities = [e for e in entities if e["id"] in ids]
+    if filters.get("search"):
+        search = filters["search"].lower()
+        entities = [e for e in entities if search in e.get("name", "").lower()]
+    return entities
+
+
+def paginate_entities(entities: List[Entity], pagination: Optional[Dict[str, Any]]) -> List[Entity]:
+    """Apply an ``OffsetPaginationInput`` to a list of entities."""
+    if not pagination:
+        return entities
+    offset = pagination.get("offset") or 0
+    limit = pagination.get("limit")
+    return entities[offset : offset + limit if limit is not None else None]
+
+
+class StandInSubscriptions:
+    """The root value for subscriptions executed against the stand-in."""
+
+    def __init__(self, store: "StandInStore") -> None:
+        """Bind the subscription root to a store."""
+        self.store = store
+
+    async def pods(self, info: GraphQLResolveInfo) -> AsyncIterator[Entity]:
+        """Stream every pod update."""
+        async for message in self.store.alisten():
+            yield {"pods": message}
+
+    async def pod(self, info: GraphQLResolveInfo, podId: str) -> AsyncIterator[Entity]:
+        """Stream the updates of a single pod."""
+        async for message in self.store.alisten():
+            if message["id"] == podId:
+                yield {"pod": message}
+
+
+class StandInStore:
+    """An in-memory store of kabinet entities.
+
+    Every public method named like a root field of the schema (``pods``,
+    ``createPod``, ...) acts as the resolver for that field, so an instance
+    of this class can be used directly as the root value of an execution.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty store."""
+        self.entities: Dict[str, Dict[str, Entity]] = {
+            "Backend": {},
+            "Resource": {},
+            "Release": {},
+            "Flavour": {},
+            "Definition": {},
+            "Deployment": {},
+            "Pod": {},
+        }
+        self.listeners: List[asyncio.Queue[Entity]] = []
+        self._counter = 0
+
+    def next_id(self) -> str:
+        """Return a new, store-wide unique ID."""
+        self._counter += 1
+        return str(self._counter)
+
+    def all(self, typename: str) -> List[Entity]:
+        """Return all entities of a type in insertion order."""
+        return list(self.entities[typename].values())
+
+    def get(self, typename: str, id: str) -> Entity:
+        """Return a single entity or raise like the server would."""
+        try:
+            return self.entities[typename][str(id)]
+        except KeyError:
+            raise ValueError(f"{typename} matching query does not exist.") from None
+
+    def insert(self, typename: str, entity: Entity) -> Entity:
+        """Insert an entity, assigning an ID if it has none."""
+        entity.setdefault("id", self.next_id())
+        entity["__typename"] = typename
+        self.entities[typename][entity["id"]] = entity
+        return entity
+
+    # Synthetic data
+
+    def add_definition(self, name: str) -> Entity:
+        """Add an action definition."""
+        return self.insert(
+            "Definition",
+            {
+                "name": name,
+                "hash": f"hash-{name}",
+                "description": f"The {name} action",
+                "kind": "FUNCTION",
+            },
+        )
+
+    def add_release(
+        self,
+        identifier: str,
+        version: str = "0.1.0",
+        flavours: int = 1,
+        requirements: int = 2,
+    ) -> Entity:
+        """Add a release with the given number of flavours.
+
+        Flavours cycle through the CPU, CUDA and ROCm selector variants so
+        that all members of the selector union are represented.
+        """
+        release = self.insert(
+            "Release",
+            {
+                "name": identifier,
+                "version": version,
+                "app": {"__typename": "App", "id": identifier, "identifier": identifier},
+                "scopes": ["read", "write"],
+                "colour": "#ff0000",
+                "description": f"Release {version} of {identifier}",
+                "installed": False,
+                "entrypoint": "app",
+                "flavours": [],
+            },
+        )
+        for i in range(flavours):
+            self.add_flavour(release, f"flavour-{i}", requirements=requirements, variant=i)
+        return release
+
+    def add_flavour(
+        self, release: Entity, name: str, requirements: int = 2, variant: int = 0
+    ) -> Entity:
+        """Add a flavour to a release."""
+        selectors: List[Entity] = [
+            {"__typename": "CPUSelector", "kind": "cpu", "required": True, "frequency": 2.0},
+            {
+                "__typename": "CudaSelector",
+                "kind": "cuda",
+                "required": True,
+                "cudaVersion": "12.1",
+                "cudaCores": 1024,
+            },
+            {
+                "__typename": "RocmSelector",
+                "kind": "rocm",
+                "required": True,
+                "apiVersion": "6.0",
+                "apiThing": "gfx90a",
+            },
+        ]
+        flavour = self.insert(
+            "Flavour",
+            {
+                "name": name,
+                "description": f"The {name} flavour",
+                "image": {
+                    "__typename": "DockerImage",
+                    "imageString": f"arkitekt/{release['app']['identifier']}:{name}",
+                    "buildAt": "2024-01-01T00:00:00+00:00",
+                },
+                "manifest": {
+                    "identifier": release["app"]["identifier"],
+                    "version": release["version"],
+                },
+                "requirements": [
+                    {
+                        "__typename": "Requirement",
+                        "key": f"service-{i}",
+                        "service": f"live.arkitekt.service-{i}",
+                        "description": None,
+                        "optional": bool(i % 2),
+                    }
+                    for i in range(requirements)
+                ],
+                "repo": {"__typename": "GithubRepo", "url": "https://github.com/arkitektio/apps"},
+                "selectors": [selectors[variant % len(selectors)]],
+                "release": release,
+            },
+        )
+        release["flavours"].append(flavour)
+        return flavour
+
+    # Queries
+
+    def query_list(
+        self,
+        typename: str,
+        filters: Optional[Dict[str, Any]] = None,
+        pagination: Optional[Dict[str, Any]] = None,
+        ordering: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Entity]:
+        """Resolve a list field with its filters and pagination."""
+        return paginate_entities(filter_entities(self.all(typename), filters), pagination)
+
+    def backend(self, info: GraphQLResolveInfo, id: str) -> Entity:
+        """Resolve ``Query.backend``."""
+        return self.get("Backend", id)
+
+    def backends(self, info: GraphQLResolveInfo, **kwargs: Any) -> List[Entity]:  # noqa: ANN401
+        """Resolve ``Query.backends``."""
+        return self.query_list("Backend", **kwargs)
+
+    def resource(self, info: GraphQLResolveInfo, id: str) -> Entity:
+        """Resolve ``Query.resource``."""
+        return self.get("Resource", id)
+
+    def resources(self, info: GraphQLResolveInfo, **kwargs: Any) -> List[Entity]:  # noqa: ANN401
+        """Resolve ``Query.resources``."""
+        return self.query_list("Resource", **kwargs)
+
+    def release(self, info: GraphQLResolveInfo, id: str) -> Entity:
+        """Resolve ``Query.release``."""
+        return self.get("Release", id)
+
+    def releases(self, info: GraphQLResolveInfo, **kwargs: Any) -> List[Entity]:  # noqa: ANN401
+        """Resolve ``Query.releases``."""
+        return self.query_list("Release", **kwargs)
+
+    def flavour(self, info: GraphQLResolveInfo, id: str) -> Entity:
+        """Resolve ``Query.flavour``."""
+        return self.get("Flavour", id)
+
+    def flavours(self, info: GraphQLResolveInfo, **kwargs: Any) -> List[Entity]:  # noqa: ANN401
+        """Resolve ``Query.flavours``."""
+        return self.query_list("Flavour", **kwargs)
+
+    def matchFlavour(self, info: GraphQLResolveInfo, input: Dict[str, Any]) -> Entity:  # noqa: ANN401
+        """Resolve ``Query.matchFlavour`` by returning the first flavour."""
+        flavours = self.all("Flavour")
+        if not flavours:
+            raise ValueError("No flavour matches the given environment.")
+        return flavours[0]
+
+    def definition(
+        self, info: GraphQLResolveInfo, id: Optional[str] = None, hash: Optional[str] = None
+    ) -> Entity:
+        """Resolve ``Query.definition`` by ID or hash."""
+        if hash is not None:
+            for definition in self.all("Definition"):
+                if definition["hash"] == hash:
+                    return definition
+            raise ValueError("Definition matching query does not exist.")
+        return self.get("Definition", str(id))
+
+    def definitions(self, info: GraphQLResolveInfo, **kwargs: Any) -> List[Entity]:  # noqa: ANN401
+        """Resolve ``Query.definitions``."""
+        return self.query_list("Definition", **kwargs)
+
+    def deployment(self, info: GraphQLResolveInfo, id: str) -> Entity:
+        """Resolve ``Query.deployment``."""
+        return self.get("Deployment", id)
+
+    def deployments(self, info: GraphQLResolveInfo, **kwargs: Any) -> List[Entity]:  # noqa: ANN401
+        """Resolve ``Query.deployments``."""
+        return self.query_list("Deployment", **kwargs)
+
+    def pod(self, info: GraphQLResolveInfo, id: str) -> Entity:
+        """Resolve ``Query.pod``."""
+        return self.get("Pod", id)
+
+    def pods(self, info: GraphQLResolveInfo, **kwargs: Any) -> List[Entity]:  # noqa: ANN401
+        """Resolve ``Query.pods``."""
+        return self.query_list("Pod", **kwargs)
+
+    def myPodAt(self, info: GraphQLResolveInfo, localId: str) -> Entity:
+        """Resolve ``Query.myPodAt``."""
+        for pod in self.all("Pod"):
+            if pod["podId"] == localId:
+                return pod
+        raise ValueError("Pod matching query does not exist.")
+
+    # Mutations
+
+    def declareBackend(self, info: GraphQLResolveInfo, input: Dict[str, Any]) -> Entity:  # noqa: ANN401
+        """Resolve ``Mutation.declareBackend``, idempotent on the name."""
+        for backend in self.all("Backend"):
+            if backend["name"] == input["name"]:
+                return backend
+        return self.insert(
+            "Backend",
+            {
+                "name": input["name"],
+                "kind": input["kind"],
+                "clientId": "stand-in",
+                "pods": [],
+                "resources": [],
+            },
+        )
+
+    def declareResource(self, info: GraphQLResolveInfo, input: Dict[str, Any]) -> Entity:  # noqa: ANN401
+        """Resolve ``Mutation.declareResource``, idempotent on backend and local ID."""
+        backend = self.get("Backend", input["backend"])
+        for resource in backend["resources"]:
+            if resource["resourceId"] == input["localId"]:
+                return resource
+        resource = self.insert(
+            "Resource",
+            {
+                "name": input.get("name") or input["localId"],
+                "resourceId": input["localId"],
+                "qualifiers": input.get("qualifiers"),
+                "backend": backend,
+                "pods": [],
+            },
+        )
+        backend["resources"].append(resource)
+        return resource
+
+    def createAppImage(self, info: GraphQLResolveInfo, input: Dict[str, Any]) -> Entity:  # noqa: ANN401
+        """Resolve ``Mutation.createAppImage``, adding a flavour to its (new) release."""
+        manifest = input["manifest"]
+        for release in self.all("Release"):
+            if (release["app"]["identifier"], release["version"]) == (
+                manifest["identifier"],
+                manifest["version"],
+            ):
+                break
+        else:
+            release = self.add_release(manifest["identifier"], manifest["version"], flavours=0)
+        name = input.get("flavourName") or f"flavour-{len(release['flavours'])}"
+        self.add_flavour(release, name, requirements=len(input["inspection"]["requirements"]))
+        return release
+
+    def createDeployment(self, info: GraphQLResolveInfo, input: Dict[str, Any]) -> Entity:  # noqa: ANN401
+        """Resolve ``Mutation.createDeployment``."""
+        flavour = self.get("Flavour", input["flavour"])
+        return self.insert(
+            "Deployment",
+            {
+                "name": f"{flavour['name']}-{input['localId']}",
+                "localId": input["localId"],
+                "flavour": flavour,
+                "apiToken": "stand-in",
+            },
+        )
+
+    def createPod(self, info: GraphQLResolveInfo, input: Dict[str, Any]) -> Entity:  # noqa: ANN401
+        """Resolve ``Mutation.createPod``."""
+        deployment = self.get("Deployment", input["deployment"])
+        resource = self.get("Resource", input["resource"]) if input.get("resource") else None
+        pod = self.insert(
+            "Pod",
+            {
+                "name": f"pod-{input['localId']}",
+                "podId": input["localId"],
+                "clientId": input.get("clientId"),
+                "deployment": deployment,
+                "resource": resource,
+                "status": "PENDING",
+                "logs": [],
+            },
+        )
+        if resource is not None:
+            resource["pods"].append(pod)
+        self.publish({"id": pod["id"], "status": pod["status"], "created": True, "progress": None})
+        return pod
+
+    def updatePod(self, info: GraphQLResolveInfo, input: Dict[str, Any]) -> Entity:  # noqa: ANN401
+        """Resolve ``Mutation.updatePod`` by ID or local ID."""
+        if input.get("pod") is not None:
+            pod = self.get("Pod", input["pod"])
+        else:
+            pod = self.myPodAt(info, input["localId"])
+        pod["status"] = input["status"]
+        self.publish({"id": pod["id"], "status": pod["status"], "created": False, "progress": None})
+        return pod
+
+    def deletePod(self, info: GraphQLResolveInfo, input: Dict[str, Any]) -> str:  # noqa: ANN401
+        """Resolve ``Mutation.deletePod``."""
+        pod = self.get("Pod", input["id"])
+        del self.entities["Pod"][pod["id"]]
+        return pod["id"]
+
+    def dumpLogs(self, info: GraphQLResolveInfo, input: Dict[str, Any]) -> Entity:  # noqa: ANN401
+        """Resolve ``Mutation.dumpLogs``."""
+        pod = self.get("Pod", input["pod"])
+        dump = {"__typename": "LogDump", "id": self.next_id(), "pod": pod, "logs": input["logs"]}
+        pod["logs"].append(dump)
+        return dump
+
+    # Execution
+
+    async def aexecute(
+        self,
+        document: str,
+        variables: Optional[Dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+    ) -> ExecutionResult:
+        """Execute a query or mutation against the store."""
+        node, errors = parse_document(document)
+        if node is None:
+            return ExecutionResult(data=None, errors=list(errors))
+        result = execute(
+            get_schema(),
+            node,
+            root_value=self,
+            variable_values=variables,
+            operation_name=operation_name,
+        )
+        if isinstance(result, ExecutionResult):
+            return result
+        return await result
+
+    # Subscriptions
+
+    def publish(self, message: Entity) -> None:
+        """Publish a ``PodUpdateMessage`` to all subscribers."""
+        message = {"__typename": "PodUpdateMessage", **message}
+        for queue in self.listeners:
+            queue.put_nowait(message)
+
+    async def alisten(self) -> AsyncIterator[Entity]:
+        """Listen to all published ``PodUpdateMessage``s."""
+        queue: asyncio.Queue[Entity] = asyncio.Queue()
+        self.listeners.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.listeners.remove(queue)
+
+
+class StandInLink(AsyncTerminatingLink):
+    """A terminating link that executes operations against a stand-in store.
+
+    Use it in place of the split http/websocket transport of a
+    ``KabinetLinkComposition`` to run the client fully in-process.
+    """
+
+    store: StandInStore = Field(default_factory=StandInStore, exclude=True)
+    """The store that resolves the operations."""
+
+    def raise_errors(self, operation: Operation, errors: Any) -> None:  # noqa: ANN401
+        """Raise the errors of an execution like a transport would."""
+        if errors:
+            raise GraphQLException(
+                "\n".join(e.message for e in errors),
+                operation=operation,
+                errors=[e.formatted for e in errors],
+            )
+
+    async def aexecute(self, operation: Operation) -> AsyncIterator[GraphQLResult]:
+        """Execute the operation in-process.
+
+        Parameters
+        ----------
+        operation : Operation
+            The operation to execute
+
+        Yields
+        ------
+        GraphQLResult
+            The result(s) of the operation
+        """
+        if operation.node.operation == OperationType.SUBSCRIPTION:
+            node, errors = parse_document(operation.document)
+            if node is None:
+                self.raise_errors(operation, errors)
+            iterator = await subscribe(
+                get_schema(),
+                node,  # type: ignore
+                root_value=StandInSubscriptions(self.store),
+                variable_values=operation.variables,
+                operation_name=operation.operation_name,
+            )
+            if not hasattr(iterator, "__aiter__"):
+                self.raise_errors(operation, iterator.errors)  # type: ignore
+                return
+            try:
+                async for event in iterator:  # type: ignore
+                    self.raise_errors(operation, event.errors)
+                    yield GraphQLResult(data=event.data)
+            finally:
+                await iterator.aclose()  # type: ignore
+            return
+
+        result = await self.store.aexecute(
+            operation.document, operation.variables, operation.operation_name
+        )
+        self.raise_errors(operation, result.errors)
+        yield GraphQLResult(data=result.data or {})
@@ -0,0 +1,254 @@
+"""Tracing spans for the phases of an operation.
+
+With a :class:`Tracer` on the rath, every query and mutation executed
+through :mod:`kabinet.funcs` opens a span named after the operation, with
+a child span per link of the :class:`kabinet.rath.KabinetLinkComposition`
+(``shrinking``, ``dicting``, ``auth``, ..., ``split`` for the transport)
+and a ``parse`` span for building the typed result. Every link span
+encloses the spans of the links after it, so the time spent in a link
+itself is its duration minus that of its child (see
+:meth:`Span.breakdown`).
+
+A link span ends when the link yields its first result, so for
+subscriptions it measures the time until the first event.
+
+The plain :class:`Tracer` only links the spans of a trace to each other,
+the :class:`InMemoryTracer` keeps them for inspection, the
+:class:`OpenTelemetryTracer` forwards them to OpenTelemetry if it is
+installed (``pip install kabinet[otel]``).
+
+Example:
+    ```python
+    tracer = InMemoryTracer()
+    rath = KabinetRath(link=KabinetLinkComposition(...), tracer=tracer)
+
+    await acreate_app_image(...)
+    print(tracer.breakdown(tracer.roots[-1]))
+    # {'CreateAppImage': 0.0002, 'shrinking': 0.001, 'dicting': 0.004, ..., 'parse': 0.0003}
+    ```
+"""
+
+import contextvars
+import itertools
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional
+
+from pydantic import BaseModel, Field, PrivateAttr
+from rath.links.base import ContinuationLink
+from rath.links.errors import ContinuationLinkError
+from rath.operation import GraphQLResult, Operation
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+span_ids = itertools.count(1)
+
+
+@dataclass
+class Span:
+    """A timed phase of an operation."""
+
+    name: str
+    """The name of the phase, e.g. ``dicting``"""
+    parent: Optional["Span"] = None
+    """The enclosing span (None for the root of a trace)"""
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    """Additional attributes, e.g. the operation name"""
+    id: int = field(default_factory=lambda: next(span_ids))
+    """The id of the span, unique within the process"""
+    started_at: float = field(default_factory=time.perf_counter)
+    """The ``perf_counter`` time at which the span started"""
+    ended_at: Optional[float] = None
+    """The ``perf_counter`` time at which the span ended"""
+    error: Optional[str] = None
+    """The type of the exception the phase failed with, if any"""
+    native: Any = None
+    """The span of the tracing backend, e.g. an OpenTelemetry span"""
+    children: List["Span"] = field(default_factory=list, repr=False)
+    """The ended spans directly enclosed by this span"""
+    token: Optional[contextvars.Token] = field(default=None, repr=False)
+    """The token to restore the enclosing span with"""
+
+    @property
+    def duration(self) -> float:
+        """The duration of the span in seconds (so far, if it has not ended)."""
+        return (self.ended_at or time.perf_counter()) - self.started_at
+
+    @property
+    def root(self) -> "Span":
+        """The root span of the trace."""
+        return self if self.parent is None else self.parent.root
+
+    def breakdown(self) -> Dict[str, float]:
+        """The time spent in this span and every enclosed phase itself, excluding children."""
+        phases: Dict[str, float] = {}
+        stack = [self]
+        while stack:
+            span = stack.pop()
+            own = span.duration - sum(child.duration for child in span.children)
+            phases[span.name] = phases.get(span.name, 0.0) + max(own, 0.0)
+            stack.extend(span.children)
+        return phases
+
+
+current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class Tracer(BaseModel):
+    """Opens and ends spans, nesting them through the current context."""
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Span:
+        """Start a span as a child of the current span, and make it the current span."""
+        span = Span(name=name, parent=current_span.get(), attributes=attributes or {})
+        span.token = current_span.set(span)
+        self.on_start(span)
+        return span
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """End a span, restoring the enclosing span as the current span.
+
+        Spans need to be ended in the same context they were started in.
+        """
+        span.ended_at = time.perf_counter()
+        if error is not None:
+            span.error = type(error).__name__
+        if span.token is not None:
+            current_span.reset(span.token)
+            span.token = None
+        if span.parent is not None:
+            span.parent.children.append(span)
+        self.on_end(span, error)
+
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+        """Run the body within a span."""
+        span = self.start_span(name, attributes)
+        error = None
+        try:
+            yield span
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.end_span(span, error)
+
+    def on_start(self, span: Span) -> None:
+        """Hook for subclasses that is called when a span started."""
+
+    def on_end(self, span: Span, error: Optional[BaseException]) -> None:
+        """Hook for subclasses that is called when a span ended."""
+
+
+class InMemoryTracer(Tracer):
+    """Keeps the ended spans in memory, e.g. for tests or a debug view."""
+
+    keep: int = 10000
+    """The number of recent spans to keep"""
+
+    _spans: Deque[Span] = PrivateAttr(default_factory=deque)
+
+    @property
+    def spans(self) -> List[Span]:
+        """The ended spans, in the order they ended."""
+        return list(self._spans)
+
+    @property
+    def roots(self) -> List[Span]:
+        """The ended root spans, i.e. one per traced operation."""
+        return [span for span in self._spans if span.parent is None]
+
+    def breakdown(self, root: Span) -> Dict[str, float]:
+        """The time spent in every phase of a trace itself, excluding its children."""
+        return root.breakdown()
+
+    def on_end(self, span: Span, error: Optional[BaseException]) -> None:
+        """Keep the span."""
+        self._spans.append(span)
+        while len(self._spans) > self.keep:
+            self._spans.popleft()
+
+    def reset(self) -> None:
+        """Forget all spans."""
+        self._spans.clear()
+
+
+class OpenTelemetryTracer(Tracer):
+    """Forwards the spans to OpenTelemetry.
+
+    Operations executed within an OpenTelemetry span become its children.
+    """
+
+    instrumentation: str = "kabinet"
+    """The name of the instrumentation the spans are reported by"""
+
+    _tracer: Any = PrivateAttr(default=None)
+
+    def model_post_init(self, context: Any) -> None:  # noqa: ANN401
+        """Fail early if OpenTelemetry is not installed."""
+        if otel_trace is None:
+            raise RuntimeError("The OpenTelemetryTracer needs opentelemetry-api to be installed")
+        self._tracer = otel_trace.get_tracer(self.instrumentation)
+
+    def on_start(self, span: Span) -> None:
+        """Start the matching OpenTelemetry span."""
+        context = None
+        if span.parent is not None and span.parent.native is not None:
+            context = otel_trace.set_span_in_context(span.parent.native)
+        span.native = self._tracer.start_span(
+            span.name, context=context, attributes=span.attributes
+        )
+
+    def on_end(self, span: Span, error: Optional[BaseException]) -> None:
+        """End the matching OpenTelemetry span, recording the error if any."""
+        if span.native is None:
+            return
+        if error is not None:
+            span.native.record_exception(error)
+            span.native.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, str(error)))
+        span.native.end()
+
+
+class TracingLink(ContinuationLink):
+    """Wraps the next link in a span that ends when it yields its first result.
+
+    The :class:`kabinet.rath.KabinetLinkComposition` puts one in front of
+    every link if it has a tracer.
+    """
+
+    name: str
+    """The name of the span, i.e. the name of the traced link in the composition"""
+    tracer: Tracer = Field(exclude=True)
+    """The tracer the span is reported to"""
+
+    async def aexecute(self, operation: Operation) -> AsyncIterator[GraphQLResult]:
+        """Execute the next link within a span."""
+        if not self.next:
+            raise ContinuationLinkError("No next link set")
+
+        span = self.tracer.start_span(
+            self.name, {"link": type(self.next).__name__, "operation": operation.display_name}
+        )
+        results = self.next.aexecute(operation)
+        try:
+            first = await anext(results)
+        except StopAsyncIteration:
+            self.tracer.end_span(span)
+            return
+        except Exception as e:
+            self.tracer.end_span(span, e)
+            raise
+        except BaseException:
+            self.tracer.end_span(span)
+            raise
+        self.tracer.end_span(span)
+
+        yield first
+        async for result in results:
+            yield result
@@ -0,0 +1,141 @@
+"""Memoized serialization of operation variables.
+
+Before an operation is sent, its variables are validated against the
+``Arguments`` of the operation and dumped to a JSON compatible payload. All
+generated inputs are frozen, so the payload of the same inputs never
+changes: repeated calls like ``match_flavour`` with the same
+``EnvironmentInput``, or polling ``list_flavours`` with the same
+``FlavourFilter``, reuse the payload of the first call instead of validating
+and dumping again.
+
+Inputs are keyed by identity, which is both cheaper than hashing them by
+value and exact: two equal inputs may still dump differently, depending on
+which of their fields were explicitly set. Variables holding anything but
+frozen inputs, scalars, enums and sequences of them (e.g. raw dicts) are
+serialized every time.
+
+Example:
+    ```python
+    environment = EnvironmentInput(containerType=ContainerType.DOCKER)
+    for _ in range(10):
+        await amatch_flavour(environment=environment)
+
+    print(variable_cache.hits)  # 9
+    ```
+"""
+
+from collections import OrderedDict
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Tuple, Type
+
+from pydantic import BaseModel
+
+SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+class Ref:
+    """A key that compares an input instance by identity, keeping it alive."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:  # noqa: ANN401
+        """Wrap an input instance."""
+        self.value = value
+
+    def __hash__(self) -> int:
+        """The hash of the identity of the instance."""
+        return id(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        """Whether both keys wrap the same instance."""
+        return isinstance(other, Ref) and other.value is self.value
+
+
+def freeze(value: Any) -> Hashable:  # noqa: ANN401
+    """A hashable key of a variable value.
+
+    Frozen inputs are keyed by identity, scalars and enums by their type and
+    value (so that ``1`` and ``True`` are not confused) and sequences by
+    their items.
+
+    Raises:
+        TypeError: If the value holds anything else, e.g. a dict
+    """
+    kind = type(value)
+    if kind in SCALARS or isinstance(value, Enum):
+        return (kind, value)
+    if is_frozen_model(kind):
+        return Ref(value)
+    if kind is tuple or kind is list:
+        return tuple([freeze(item) for item in value])
+    raise TypeError(f"Variables of type {kind.__name__} are not cached")
+
+
+@lru_cache(maxsize=None)
+def is_frozen_model(kind: type) -> bool:
+    """Whether a type is a frozen model, like all generated inputs."""
+    return issubclass(kind, BaseModel) and bool(kind.model_config.get("frozen"))
+
+
+def freeze_variables(variables: Dict[str, Any]) -> Hashable:
+    """A hashable key of the variables of an operation (see :func:`freeze`)."""
+    return tuple(
+        [
+            (name, value) if type(value) is str else (name, freeze(value))
+            for name, value in variables.items()
+        ]
+    )
+
+
+class VariableCache:
+    """A bounded LRU cache of serialized variables per operation.
+
+    The cached payloads are shared between calls and must not be mutated.
+    This sits on the path of every call, so unlike the configurable
+    components of the rath it is a plain class.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Create a cache holding up to ``maxsize`` payloads."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[Type[Any], Hashable], Dict[str, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """The number of cached payloads."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all cached payloads."""
+        self._entries.clear()
+
+    def serialize(self, operation: Type[Any], variables: Dict[str, Any]) -> Dict[str, Any]:
+        """The payload of the variables of an operation, from the cache if possible."""
+        try:
+            key = (operation, freeze_variables(variables))
+        except TypeError:
+            return dump_variables(operation, variables)
+
+        serialized = self._entries.get(key)
+        if serialized is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return serialized
+
+        self.misses += 1
+        serialized = dump_variables(operation, variables)
+        self._entries[key] = serialized
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return serialized
+
+
+def dump_variables(operation: Type[Any], variables: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the variables of an operation and dump them to a JSON compatible payload."""
+    return operation.Arguments(**variables).model_dump(by_alias=True, exclude_unset=True)
+
+
+variable_cache = VariableCache()
+"""The cache used by ``kabinet.funcs``"""
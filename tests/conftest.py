@@ -1,5 +1,6 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 import pytest
+import pytest_asyncio
 from dokker import testing, Deployment
 from dokker.log_watcher import LogWatcher
 import os
@@ -12,6 +13,7 @@ from kabinet.rath import (
     SplitLink,
     KabinetLinkComposition,
 )
+from kabinet.testing import StandInLink, StandInStore
 from graphql import OperationType
 from dataclasses import dataclass
 
@@ -24,6 +26,19 @@ async def token_loader():
     return "test"
 
 
+@pytest.fixture
+def standin() -> StandInStore:
+    store = StandInStore()
+    store.add_release("live.arkitekt.test", flavours=3)
+    return store
+
+
+@pytest_asyncio.fixture
+async def standin_rath(standin: StandInStore) -> AsyncGenerator[KabinetRath, None]:
+    async with KabinetRath(link=StandInLink(store=standin)) as rath:
+        yield rath
+
+
 @dataclass
 class DeployedKabinet:
     deployment: Deployment
@@ -0,0 +1,69 @@
+import pytest
+
+from kabinet.api.schema import (
+    DeclareBackendMutation,
+    GetFlavourQuery,
+    GetReleaseQuery,
+    ListFlavoursQuery,
+)
+from kabinet.errors import BatchingError
+from kabinet.funcs import aexecute_many
+
+
+@pytest.mark.asyncio
+async def test_execute_many_splits_typed_results(standin, standin_rath) -> None:
+    """Batched operations come back typed and in order."""
+    release = standin.all("Release")[0]
+    first, second = release["flavours"][:2]
+
+    got_first, got_release, got_second, listed = await aexecute_many(
+        [
+            (GetFlavourQuery, {"id": first["id"]}),
+            (GetReleaseQuery, {"id": release["id"]}),
+            (GetFlavourQuery, {"id": second["id"]}),
+            (ListFlavoursQuery, {"pagination": {"limit": 1}}),
+        ],
+        rath=standin_rath,
+    )
+
+    assert isinstance(got_first, GetFlavourQuery)
+    assert got_first.flavour.id == first["id"]
+    assert got_second.flavour.id == second["id"]
+    assert got_release.release.id == release["id"]
+    assert len(listed.flavours) == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_many_is_one_round_trip(standin, standin_rath) -> None:
+    """All operations of a batch are sent as a single request."""
+    sent = []
+    link = standin_rath.link
+    original = link.aexecute
+
+    async def counting(operation):
+        sent.append(operation)
+        async for result in original(operation):
+            yield result
+
+    object.__setattr__(link, "aexecute", counting)
+
+    flavours = standin.all("Flavour")
+    results = await aexecute_many(
+        [(GetFlavourQuery, {"id": f["id"]}) for f in flavours], rath=standin_rath
+    )
+
+    assert len(sent) == 1
+    assert [r.flavour.id for r in results] == [f["id"] for f in flavours]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_rejects_mixed_operations(standin_rath) -> None:
+    """Queries and mutations cannot share a batch."""
+    with pytest.raises(BatchingError):
+        await aexecute_many(
+            [
+                (GetFlavourQuery, {"id": "1"}),
+                (DeclareBackendMutation, {"input": {"name": "a", "kind": "b"}}),
+            ],
+            rath=standin_rath,
+        )
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from kabinet.api.schema import WatchPodsSubscription
+from kabinet.buffering import OverflowPolicy, SubscriptionBuffer
+from kabinet.funcs import asubscribe
+
+
+def update(pod: str, progress: int) -> dict:
+    return {"id": pod, "status": "RUNNING", "created": False, "progress": progress}
+
+
+async def wait_for_listener(standin) -> None:
+    while not standin.listeners:
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_the_newest_events() -> None:
+    """A full drop-oldest buffer discards the oldest events and counts them."""
+    buffer = SubscriptionBuffer(maxsize=3, policy="drop_oldest")
+    for i in range(5):
+        await buffer.aput(i)
+    await buffer.aclose()
+
+    assert [await buffer.aget() for _ in range(3)] == [2, 3, 4]
+    assert (buffer.received, buffer.dropped, buffer.delivered) == (5, 2, 3)
+    with pytest.raises(StopAsyncIteration):
+        await buffer.aget()
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_the_consumer() -> None:
+    """A full blocking buffer holds the producer back until an event is taken."""
+    buffer = SubscriptionBuffer(maxsize=1, policy=OverflowPolicy.BLOCK)
+    await buffer.aput(1)
+    producer = asyncio.create_task(buffer.aput(2))
+    await asyncio.sleep(0.01)
+    assert not producer.done()
+
+    assert await buffer.aget() == 1
+    await producer
+    assert await buffer.aget() == 2
+    assert buffer.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_latest_wins_coalesces_pod_updates(standin_rath, standin) -> None:
+    """Only the latest update per pod is delivered to a slow consumer."""
+    buffer = SubscriptionBuffer(maxsize=10, policy="latest")
+    events = asubscribe(WatchPodsSubscription, {}, rath=standin_rath, buffer=buffer)
+    first = asyncio.ensure_future(events.__anext__())
+    await wait_for_listener(standin)
+
+    standin.publish(update("a", 0))
+    assert (await first).pods.progress == 0
+
+    for progress in range(1, 6):
+        standin.publish(update("a", progress))
+        standin.publish(update("b", progress))
+    await asyncio.sleep(0.05)
+
+    received = [await events.__anext__(), await events.__anext__()]
+    await events.aclose()
+
+    assert [(e.pods.id, e.pods.progress) for e in received] == [("a", 5), ("b", 5)]
+    assert buffer.received == 11
+    assert buffer.coalesced == 8
+
+    await asyncio.sleep(0.05)
+    assert not standin.listeners
+
+
+@pytest.mark.asyncio
+async def test_buffer_can_be_reused_after_draining() -> None:
+    """A drained buffer delivers the events of the next subscription, but not concurrently."""
+
+    async def events(*values: int):
+        for value in values:
+            yield value
+
+    buffer = SubscriptionBuffer(maxsize=10)
+    assert [event async for event in buffer.adrain(events(1, 2))] == [1, 2]
+    assert [event async for event in buffer.adrain(events(3))] == [3]
+    assert (buffer.received, buffer.delivered) == (3, 3)
+
+    draining = buffer.adrain(events(4, 5))
+    assert await draining.__anext__() == 4
+    with pytest.raises(RuntimeError):
+        await buffer.adrain(events(6)).__anext__()
+    await draining.aclose()
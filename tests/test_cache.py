@@ -0,0 +1,83 @@
+import pytest
+
+from kabinet.api.schema import (
+    aget_release,
+    alist_flavours,
+    aupdate_pod,
+    acreate_deployment,
+    acreate_pod,
+    aget_pod,
+)
+from kabinet.api.schema import UpdatePodInput, UpdatePodMutation
+from kabinet.cache import ResponseCache
+from kabinet.funcs import aexecute_many
+from kabinet.rath import KabinetRath
+from kabinet.testing import StandInLink
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_repeated_queries(standin) -> None:
+    """Queries with a TTL are served from the cache and counted."""
+    release = standin.all("Release")[0]
+    cache = ResponseCache(ttls={"GetRelease": 60})
+
+    async with KabinetRath(link=StandInLink(store=standin), cache=cache) as rath:
+        first = await aget_release(release["id"], rath=rath)
+        release["version"] = "changed"
+        second = await aget_release(release["id"], rath=rath)
+        await alist_flavours(rath=rath)
+
+    assert first == second
+    assert second.version != "changed"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_cache_is_invalidated_by_mutations(standin) -> None:
+    """A mutation returning a Pod invalidates cached responses containing pods."""
+    flavour = standin.all("Flavour")[0]
+    cache = ResponseCache(default_ttl=60)
+
+    async with KabinetRath(link=StandInLink(store=standin), cache=cache) as rath:
+        deployment = await acreate_deployment(local_id="d", flavour=flavour["id"], rath=rath)
+        pod = await acreate_pod(deployment=deployment.id, local_id="p", rath=rath)
+        await aget_pod(pod.id, rath=rath)
+        await aget_pod(pod.id, rath=rath)
+        await aupdate_pod(status="RUNNING", pod=pod.id, rath=rath)
+        await aget_pod(pod.id, rath=rath)
+
+    assert cache.hits == 1
+    assert cache.invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_batched_mutations_invalidate_the_cache(standin) -> None:
+    """A mutation sent through aexecute_many invalidates cached reads, like a single one."""
+    flavour = standin.all("Flavour")[0]
+    cache = ResponseCache(default_ttl=60)
+
+    async with KabinetRath(link=StandInLink(store=standin), cache=cache) as rath:
+        deployment = await acreate_deployment(local_id="d", flavour=flavour["id"], rath=rath)
+        pod = await acreate_pod(deployment=deployment.id, local_id="p", rath=rath)
+        await aget_pod(pod.id, rath=rath)
+        update = UpdatePodInput(pod=pod.id, status="RUNNING")
+        await aexecute_many([(UpdatePodMutation, {"input": update})], rath=rath)
+        await aget_pod(pod.id, rath=rath)
+
+    assert (cache.hits, cache.invalidations) == (0, 1)
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Entries are evicted in LRU order once the size bound is exceeded."""
+    document = "query GetRelease($id: ID!) { release(id: $id) { id } }"
+    cache = ResponseCache(default_ttl=60, max_bytes=170)
+
+    for i in range(3):
+        cache.put(document, {"id": str(i)}, {"release": {"id": str(i), "pad": "x" * 20}})
+    cache.get(document, {"id": "0"})
+    cache.put(document, {"id": "3"}, {"release": {"id": "3", "pad": "x" * 20}})
+
+    assert cache.get(document, {"id": "0"}) is not None
+    assert cache.get(document, {"id": "1"}) is None
+    assert cache.evictions == 1
+    assert cache.size <= 170
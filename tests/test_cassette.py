@@ -0,0 +1,95 @@
+import time
+
+import pytest
+from graphql import OperationType
+from rath.links.auth import ComposedAuthLink
+from rath.links.split import SplitLink
+from rath.operation import GraphQLException
+
+from kabinet.api.schema import ReleaseFilter, aget_release, alist_releases
+from kabinet.links import ExchangeNotRecordedError
+from kabinet.links.cassette import Cassette, Exchange, RecordingLink, ReplayLink
+from kabinet.rath import KabinetLinkComposition, KabinetRath
+from kabinet.replay import areplay
+from kabinet.testing import StandInLink
+
+
+async def token_loader() -> str:
+    return "test"
+
+
+def build_rath(standin, recorder: RecordingLink) -> KabinetRath:
+    return KabinetRath(
+        link=KabinetLinkComposition(
+            recording=recorder,
+            auth=ComposedAuthLink(token_loader=token_loader, token_refresher=token_loader),
+            split=SplitLink(
+                left=StandInLink(store=standin),
+                right=StandInLink(store=standin),
+                split=lambda o: o.node.operation != OperationType.SUBSCRIPTION,
+            ),
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_records_and_replays_exchanges(standin, tmp_path) -> None:
+    """Recorded exchanges are written to a cassette and replayed through the typed operations."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    recorder = RecordingLink(path=path)
+    async with build_rath(standin, recorder) as rath:
+        releases = await alist_releases(filters=ReleaseFilter(search="test"), rath=rath)
+        release = await aget_release(releases[0].id, rath=rath)
+        with pytest.raises(GraphQLException):
+            await aget_release("missing", rath=rath)
+
+    cassette = Cassette.load(path)
+    assert recorder.recorded == 3
+    assert set(cassette.documents) == {"ListReleases", "GetRelease"}
+    assert [exchange.operation for exchange in cassette.exchanges] == ["ListReleases", "GetRelease", "GetRelease"]
+    assert cassette.exchanges[2].error == "GraphQLException" and not cassette.exchanges[2].results
+
+    replay = ReplayLink(cassette=cassette)
+    async with KabinetRath(link=replay) as rath:
+        replayed = await areplay(cassette, rath, pace=False)
+
+    assert (replayed[0].releases, replayed[1].release) == (releases, release)
+    assert isinstance(replayed[2], GraphQLException)
+    assert (replay.served, replay.missed) == (3, 0)
+
+
+@pytest.mark.asyncio
+async def test_replays_with_the_recorded_timing(standin) -> None:
+    """With timing, results are delayed like they were recorded, scaled by the speed."""
+    recorder = RecordingLink()
+    async with build_rath(standin, recorder) as rath:
+        release = await aget_release(standin.all("Release")[0]["id"], rath=rath)
+
+    (exchange,) = recorder.cassette.exchanges
+    cassette = Cassette(exchanges=[exchange.model_copy(update={"offsets": [0.4], "duration": 0.4})])
+    async with KabinetRath(link=ReplayLink(cassette=cassette, timing=True, speed=4)) as rath:
+        start = time.perf_counter()
+        assert await aget_release(release.id, rath=rath) == release
+        assert 0.1 <= time.perf_counter() - start < 0.3
+
+        with pytest.raises(ExchangeNotRecordedError):
+            await aget_release("other", rath=rath)
+
+
+@pytest.mark.asyncio
+async def test_repeated_operations_are_served_in_recorded_order() -> None:
+    """Repeated operations get their exchanges in order, then the last one again."""
+    variables = {"id": "1"}
+    cassette = Cassette(
+        exchanges=[
+            Exchange(operation="GetRelease", kind="query", at=0, variables=variables, error="TransientLinkError", message="502"),
+            Exchange(operation="GetRelease", kind="query", at=1, variables=variables, results=[{"release": None}], offsets=[0]),
+        ]
+    )
+    replay = ReplayLink(cassette=cassette)
+    async with KabinetRath(link=replay) as rath:
+        with pytest.raises(Exception, match="502"):
+            await rath.aquery("query GetRelease($id: ID!) { release(id: $id) { id } }", variables)
+        for _ in range(2):
+            result = await rath.aquery("query GetRelease($id: ID!) { release(id: $id) { id } }", variables)
+            assert result.data == {"release": None}
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from kabinet.api.schema import ListReleasesQuery, alist_releases
+from kabinet.compression import CODECS, accept_encoding, negotiate
+from kabinet.funcs import astream
+from kabinet.links.aiohttp import KabinetAIOHttpLink
+from kabinet.rath import KabinetRath
+from kabinet.testing.server import StandInServer
+
+
+def test_negotiates_the_preferred_available_codec() -> None:
+    """The most preferred codec offered by the client is used."""
+    assert negotiate("gzip, deflate").name == "gzip"
+    assert negotiate("br") is None
+    assert accept_encoding().split(", ")[-2:] == ["gzip", "deflate"]
+    assert ("zstd" in CODECS) == ("zstd" in accept_encoding())
+
+
+@pytest.mark.asyncio
+async def test_compresses_large_requests_and_responses(standin) -> None:
+    """Large bodies are compressed both ways, small requests are sent as they are."""
+    for i in range(30):
+        standin.add_release(f"live.arkitekt.app-{i}", flavours=3)
+
+    async with StandInServer(store=standin) as server:
+        plain = KabinetAIOHttpLink(endpoint_url=server.url)
+        async with KabinetRath(link=plain) as rath:
+            expected = await alist_releases(rath=rath)
+        uncompressed = server.bytes_sent
+
+        server.compression_threshold = 512
+
+        link = KabinetAIOHttpLink(
+            endpoint_url=server.url,
+            compression="gzip",
+            compression_threshold=1024,
+            accept_compression=True,
+        )
+        async with KabinetRath(link=link) as rath:
+            received, sent = server.bytes_received, server.bytes_sent
+            small = await alist_releases(rath=rath)
+            small_request = server.bytes_received - received
+            compressed = server.bytes_sent - sent
+
+            streamed = [release async for release in astream(ListReleasesQuery, {}, rath=rath)]
+            ids = [release.id for release in expected] * 50
+            received = server.bytes_received
+            large = await alist_releases(filters={"ids": ids}, rath=rath)
+            large_request = server.bytes_received - received
+
+    assert small == large == expected
+    assert tuple(streamed) == expected
+    assert small_request == len(link.codec.dumps(server.requests[-3]))
+    assert large_request * 5 < len(json.dumps(server.requests[-1]).encode())
+    assert compressed * 3 < uncompressed
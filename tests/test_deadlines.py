@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from kabinet.api.schema import GetFlavourQuery, aget_flavour, alist_releases
+from kabinet.deadlines import deadline
+from kabinet.errors import DeadlineExceeded
+from kabinet.funcs import aexecute
+from kabinet.hedging import HedgedReads
+from kabinet.rath import KabinetRath
+from kabinet.testing import StandInLink
+
+
+@pytest.fixture
+def delays(standin, monkeypatch):
+    """Delays in seconds for the next requests to the stand-in, in order."""
+    pending = []
+    cancelled = []
+    aexecute = standin.aexecute
+
+    async def delayed(document, variables=None, operation_name=None):
+        try:
+            await asyncio.sleep(pending.pop(0) if pending else 0)
+        except asyncio.CancelledError:
+            cancelled.append(variables)
+            raise
+        return await aexecute(document, variables, operation_name)
+
+    monkeypatch.setattr(standin, "aexecute", delayed)
+    return pending, cancelled
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_the_request(standin, standin_rath, delays) -> None:
+    """A request that outlives its timeout is cancelled."""
+    pending, cancelled = delays
+    pending.append(10)
+    flavour = standin.all("Flavour")[0]
+
+    with pytest.raises(DeadlineExceeded):
+        await aexecute(GetFlavourQuery, {"id": flavour["id"]}, rath=standin_rath, timeout=0.05)
+
+    assert cancelled == [{"id": flavour["id"]}]
+    assert (await aget_flavour(flavour["id"], rath=standin_rath)).id == flavour["id"]
+
+
+@pytest.mark.asyncio
+async def test_deadline_scope_is_shared(standin_rath, delays) -> None:
+    """Every request in a deadline scope shares the same deadline."""
+    pending, _ = delays
+    pending.extend([0.2, 0.2])
+
+    with deadline(0.3):
+        await alist_releases(rath=standin_rath)
+        with pytest.raises(DeadlineExceeded):
+            await alist_releases(rath=standin_rath)
+
+
+@pytest.mark.asyncio
+async def test_hedging_takes_the_faster_copy(standin, delays) -> None:
+    """A slow hedged query is answered by its second copy."""
+    pending, cancelled = delays
+    pending.extend([10, 0])
+    hedging = HedgedReads(default_delay=0.02)
+    flavour = standin.all("Flavour")[0]
+
+    async with KabinetRath(link=StandInLink(store=standin), hedging=hedging) as rath:
+        found = await asyncio.wait_for(aget_flavour(flavour["id"], rath=rath), 1)
+
+    assert found.id == flavour["id"]
+    assert (hedging.hedged, hedging.hedge_wins) == (1, 1)
+    assert len(cancelled) == 1
+
+
+@pytest.mark.asyncio
+async def test_hedging_counts_the_cancelled_copy() -> None:
+    """The slow copy that loses still raises the percentile the delay is computed from."""
+    hedging = HedgedReads(default_delay=0.02, min_samples=2)
+    delays = [10, 0]
+
+    async def afetch() -> str:
+        await asyncio.sleep(delays.pop(0))
+        return "answer"
+
+    assert await hedging.aexecute(GetFlavourQuery, afetch) == "answer"
+
+    assert hedging.delay_for("GetFlavour") >= 0.02
+
+
+@pytest.mark.asyncio
+async def test_hedging_stays_within_its_budget() -> None:
+    """Once the budget is spent, slow requests wait for their first copy instead of hedging."""
+    hedging = HedgedReads(default_delay=0.005, budget=0.1, min_samples=20)
+
+    async def afetch() -> str:
+        await asyncio.sleep(0.02)
+        return "answer"
+
+    for _ in range(5):
+        await hedging.aexecute(GetFlavourQuery, afetch)
+
+    assert (hedging.hedged, hedging.over_budget) == (2, 3)
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import pytest
+from graphql import OperationType
+from rath.links.auth import ComposedAuthLink
+from rath.links.split import SplitLink
+
+from kabinet.api.schema import (
+    PodStatus,
+    aget_release,
+    alist_flavours,
+    alist_releases,
+    aupdate_pod,
+    awatch_pods,
+)
+from kabinet.links import Fault, FaultInjectionLink, KabinetRetryLink, Latency, TransientLinkError
+from kabinet.rath import KabinetLinkComposition, KabinetRath
+from kabinet.testing import StandInLink
+
+
+async def token_loader() -> str:
+    return "test"
+
+
+def build_rath(standin, faults: FaultInjectionLink, retry=None) -> KabinetRath:
+    return KabinetRath(
+        link=KabinetLinkComposition(
+            retry=retry,
+            auth=ComposedAuthLink(token_loader=token_loader, token_refresher=token_loader),
+            faults=faults,
+            split=SplitLink(
+                left=StandInLink(store=standin),
+                right=StandInLink(store=standin),
+                split=lambda o: o.node.operation != OperationType.SUBSCRIPTION,
+            ),
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_injects_errors_and_latency_per_operation(standin) -> None:
+    """Only the configured operations fail or are delayed."""
+    faults = FaultInjectionLink(
+        faults={
+            "GetRelease": Fault(error_rate=1.0),
+            "ListFlavours": Fault(latency=Latency(mean=0.2)),
+        }
+    )
+    async with build_rath(standin, faults) as rath:
+        releases = await alist_releases(rath=rath)
+        with pytest.raises(TransientLinkError):
+            await aget_release(releases[0].id, rath=rath)
+
+        start = time.perf_counter()
+        await alist_flavours(rath=rath)
+        assert time.perf_counter() - start >= 0.2
+
+    assert faults.injected == {"error": 1, "latency": 1}
+
+
+@pytest.mark.asyncio
+async def test_retries_recover_from_injected_errors(standin) -> None:
+    """The retry link sees the injected errors and retries them."""
+    faults = FaultInjectionLink(default=Fault(error_rate=0.5), seed=1)
+    retry = KabinetRetryLink(max_retries=10, base_delay=0.001)
+    async with build_rath(standin, faults, retry=retry) as rath:
+        for _ in range(10):
+            await alist_releases(rath=rath)
+
+    assert retry.retries == faults.injected["error"] > 0
+
+
+@pytest.mark.asyncio
+async def test_cuts_lists_of_partial_results(standin) -> None:
+    """Partial results keep only a fraction of their lists."""
+    faults = FaultInjectionLink(faults={"ListFlavours": Fault(partial_rate=1.0, partial_keep=0.34)})
+    async with build_rath(standin, faults) as rath:
+        flavours = await alist_flavours(rath=rath)
+
+    assert len(flavours) == 1 and len(standin.all("Flavour")) == 3
+
+
+@pytest.mark.asyncio
+async def test_disconnects_subscriptions(standin) -> None:
+    """Subscriptions disconnect after the configured number of events and are resubscribed."""
+    release = standin.all("Release")[0]
+    flavour = release["flavours"][0]["id"]
+    deployment = standin.createDeployment(None, {"flavour": flavour, "localId": "d"})
+    pod = standin.createPod(None, {"deployment": deployment["id"], "localId": "p"})
+
+    faults = FaultInjectionLink(faults={"WatchPods": Fault(disconnect_after=1)})
+    retry = KabinetRetryLink(base_delay=0.001)
+    async with build_rath(standin, faults, retry=retry) as rath:
+        events = awatch_pods(rath=rath)
+        received = []
+        for status in (PodStatus.RUNNING, PodStatus.STOPPED):
+            event = asyncio.ensure_future(anext(events))
+            # After the first event, wait for the resubscription following the disconnect
+            while retry.retries < len(received) or not standin.listeners:
+                await asyncio.sleep(0.01)
+            await aupdate_pod(status=status, pod=pod["id"], rath=rath)
+            received.append((await asyncio.wait_for(event, 5)).status)
+        await events.aclose()
+
+    assert received == ["RUNNING", "STOPPED"]
+    assert faults.injected == {"disconnect": 1} and retry.retries == 1
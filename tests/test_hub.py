@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from kabinet.api.schema import WatchPodSubscriptionPod, awatch_pod
+from kabinet.hub import PodHub
+from kabinet.rath import KabinetRath
+from kabinet.testing import StandInLink
+
+
+def update(pod: str, progress: int) -> dict:
+    return {"id": pod, "status": "RUNNING", "created": False, "progress": progress}
+
+
+async def until_disconnected(hub: PodHub) -> None:
+    while hub.connected:
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_hub_shares_one_upstream_subscription(standin) -> None:
+    """Pod watchers share one subscription, which is closed after the last watcher."""
+    hub = PodHub()
+
+    async with KabinetRath(link=StandInLink(store=standin), hub=hub) as rath:
+        watchers = [awatch_pod(pod, rath=rath) for pod in ("a", "a", "b")]
+        nexts = [asyncio.ensure_future(watcher.__anext__()) for watcher in watchers]
+        while not standin.listeners:
+            await asyncio.sleep(0)
+
+        standin.publish(update("c", 1))
+        standin.publish(update("b", 2))
+        standin.publish(update("a", 3))
+        received = await asyncio.gather(*nexts)
+
+        assert len(standin.listeners) == 1
+        assert hub.watchers == 3
+        assert all(isinstance(update, WatchPodSubscriptionPod) for update in received)
+        assert [(u.id, u.progress) for u in received] == [("a", 3), ("a", 3), ("b", 2)]
+
+        for watcher in watchers[:2]:
+            await watcher.aclose()
+        assert hub.connected
+
+        await watchers[2].aclose()
+        await asyncio.wait_for(until_disconnected(hub), 1)
+        assert hub.watchers == 0
+
+
+def test_hub_refuses_to_block_on_a_full_watcher() -> None:
+    """A blocking watcher would stall the shared subscription, so the hub does not allow it."""
+    with pytest.raises(ValueError):
+        PodHub(policy="block")
+
+    assert PodHub(policy="latest").policy == "latest"
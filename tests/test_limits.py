@@ -0,0 +1,127 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from kabinet.api.schema import aget_release
+from kabinet.limits import Limit, RequestLimiter
+from kabinet.priority import Priority
+from kabinet.rath import KabinetRath
+from kabinet.testing import StandInLink
+
+
+@pytest.fixture
+def concurrency(standin, monkeypatch):
+    """Tracks the highest number of concurrent requests to the stand-in."""
+    state = {"current": 0, "highest": 0}
+    aexecute = standin.aexecute
+
+    async def tracked(document, variables=None, operation_name=None):
+        state["current"] += 1
+        state["highest"] = max(state["highest"], state["current"])
+        try:
+            await asyncio.sleep(0.01)
+            return await aexecute(document, variables, operation_name)
+        finally:
+            state["current"] -= 1
+
+    monkeypatch.setattr(standin, "aexecute", tracked)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_is_per_operation_type(standin, concurrency) -> None:
+    """Queries wait for a slot, and the waits are recorded."""
+    limiter = RequestLimiter(query=Limit(max_concurrency=3))
+    release = standin.all("Release")[0]
+
+    async with KabinetRath(link=StandInLink(store=standin), limiter=limiter) as rath:
+        await asyncio.gather(*(aget_release(release["id"], rath=rath) for _ in range(12)))
+
+    assert concurrency["highest"] == 3
+    assert limiter.query.acquired == 12
+    assert limiter.query.throttled == 9
+    assert limiter.query.max_wait >= 0.02
+    assert limiter.query.in_flight == 0
+    assert limiter.mutation.acquired == 0
+
+
+class FakeClock:
+    """A monotonic clock that only advances when the limiter sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    """Drives the token bucket of the limiter with a fake clock."""
+    fake = FakeClock()
+    monkeypatch.setattr("kabinet.limits.time", SimpleNamespace(monotonic=fake.monotonic))
+    monkeypatch.setattr(
+        "kabinet.limits.asyncio",
+        SimpleNamespace(sleep=fake.sleep, get_running_loop=asyncio.get_running_loop),
+    )
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_the_rate(clock) -> None:
+    """After the burst, tokens are handed out at the configured rate."""
+    limit = Limit(rate=20, burst=2)
+
+    sent = []
+    for _ in range(5):
+        async with limit.aslot():
+            sent.append(clock.now)
+
+    assert sent == pytest.approx([0.0, 0.0, 0.05, 0.1, 0.15])
+    assert clock.sleeps == pytest.approx([0.05, 0.05, 0.05])
+    assert (limit.acquired, limit.throttled) == (5, 3)
+    assert limit.total_wait == pytest.approx(0.15)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_refills_up_to_the_burst(clock) -> None:
+    """After a pause, the bucket holds at most ``burst`` tokens."""
+    limit = Limit(rate=20, burst=2)
+    async with limit.aslot():
+        pass
+
+    clock.now += 10
+    sent = []
+    for _ in range(3):
+        async with limit.aslot():
+            sent.append(clock.now)
+
+    assert sent == pytest.approx([10.0, 10.0, 10.05])
+    assert (limit.acquired, limit.throttled) == (4, 1)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_serves_waiters_by_priority(clock) -> None:
+    """Without a concurrency cap, a late interactive call still gets a token before bulk calls."""
+    limit = Limit(rate=8, burst=1)
+    sent = []
+
+    async def send(name: str, priority: Priority) -> None:
+        async with limit.aslot(priority):
+            sent.append(name)
+
+    await send("first", Priority.NORMAL)
+    # The bulk calls queue for a token before the interactive call arrives
+    bulk = [asyncio.ensure_future(send(f"bulk-{i}", Priority.BULK)) for i in range(3)]
+    interactive = asyncio.ensure_future(send("interactive", Priority.INTERACTIVE))
+    await asyncio.gather(interactive, *bulk)
+
+    assert sent == ["first", "interactive", "bulk-0", "bulk-1", "bulk-2"]
+    assert clock.now == pytest.approx(0.5)
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+from rath.operation import GraphQLException
+
+from kabinet.api.schema import Flavour, aget_flavour, aget_release
+from kabinet.loader import KabinetLoader
+from kabinet.rath import KabinetRath
+from kabinet.testing import StandInLink
+
+
+@pytest.mark.asyncio
+async def test_loader_coalesces_lookups(standin) -> None:
+    """Concurrent by-ID lookups are resolved with one deduplicated list query."""
+    sent = []
+    link = StandInLink(store=standin)
+    original = link.aexecute
+
+    async def recording(operation):
+        sent.append(operation)
+        async for result in original(operation):
+            yield result
+
+    object.__setattr__(link, "aexecute", recording)
+
+    flavours = standin.all("Flavour")
+    ids = [f["id"] for f in flavours] * 2
+
+    async with KabinetRath(link=link, loader=KabinetLoader()) as rath:
+        loaded = await asyncio.gather(*(aget_flavour(id, rath=rath) for id in ids))
+
+    assert all(isinstance(f, Flavour) for f in loaded)
+    assert [f.id for f in loaded] == ids
+    assert len(sent) == 1
+    assert sent[0].variables["ids"] == [f["id"] for f in flavours]
+
+
+@pytest.mark.asyncio
+async def test_loader_raises_for_missing_ids(standin) -> None:
+    """A lookup of an unknown ID fails without affecting the others."""
+    release = standin.all("Release")[0]
+
+    async with KabinetRath(link=StandInLink(store=standin), loader=KabinetLoader()) as rath:
+        found, missing = await asyncio.gather(
+            aget_release(release["id"], rath=rath),
+            aget_release("does-not-exist", rath=rath),
+            return_exceptions=True,
+        )
+
+    assert found.id == release["id"]
+    assert isinstance(missing, GraphQLException)
@@ -0,0 +1,60 @@
+import pytest
+
+from kabinet.api.schema import ListReleasesQuery, aget_release, alist_releases
+from kabinet.funcs import astream
+from kabinet.links.aiohttp import KabinetAIOHttpLink
+from kabinet.metrics import Histogram, InMemoryMetricsSink
+from kabinet.rath import KabinetRath
+from kabinet.testing import StandInLink
+from kabinet.testing.server import StandInServer
+
+
+@pytest.mark.asyncio
+async def test_records_latency_payload_sizes_and_validation(standin) -> None:
+    """Every operation records its latency, the sizes reported by the transport and its validation time."""
+    for i in range(5):
+        standin.add_release(f"live.arkitekt.app-{i}", flavours=2)
+    sink = InMemoryMetricsSink()
+
+    async with StandInServer(store=standin) as server:
+        link = KabinetAIOHttpLink(endpoint_url=server.url)
+        async with KabinetRath(link=link, metrics=sink) as rath:
+            for _ in range(3):
+                releases = await alist_releases(rath=rath)
+            streamed = [release async for release in astream(ListReleasesQuery, {}, rath=rath)]
+
+    assert tuple(streamed) == releases
+    metrics = sink.operations["ListReleases"]
+    assert metrics.calls == metrics.latency.count == 4
+    assert metrics.validation.count == 4 and metrics.validation.sum > 0
+    assert metrics.request_bytes == server.bytes_received
+    assert metrics.response_bytes == server.bytes_sent
+    assert [sample.kind for sample in sink.samples] == ["query"] * 4
+    assert all(sample.latency > sample.validation_time for sample in sink.samples)
+
+
+@pytest.mark.asyncio
+async def test_counts_errors_per_exception_type(standin) -> None:
+    """Failed operations are recorded with the type of their error."""
+    sink = InMemoryMetricsSink()
+
+    async with KabinetRath(link=StandInLink(store=standin), metrics=sink) as rath:
+        await aget_release(standin.all("Release")[0]["id"], rath=rath)
+        with pytest.raises(Exception) as error:
+            await aget_release("missing", rath=rath)
+
+    metrics = sink.operations["GetRelease"]
+    assert metrics.calls == 2
+    assert metrics.errors == {type(error.value).__name__: 1}
+
+
+def test_histogram_quantiles_are_bucket_bounds() -> None:
+    """Quantiles are the upper bound of the bucket holding the quantile."""
+    histogram = Histogram(buckets=(0.01, 0.1, 1))
+    for value in [0.005] * 90 + [0.05] * 9 + [5]:
+        histogram.observe(value)
+
+    assert histogram.quantile(0.5) == 0.01
+    assert histogram.quantile(0.95) == 0.1
+    assert histogram.quantile(1) == float("inf")
+    assert histogram.mean == pytest.approx((0.45 + 0.45 + 5) / 100)
@@ -0,0 +1,113 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from kabinet.api.schema import OffsetPaginationInput, alist_flavours, alist_releases
+from kabinet.pagination import afetch_all, aiter_flavours, aiter_releases, apages
+
+
+@pytest.fixture
+def counted(standin, monkeypatch):
+    requests = []
+    aexecute = standin.aexecute
+
+    async def counting(document, variables=None, operation_name=None):
+        requests.append(variables)
+        return await aexecute(document, variables, operation_name)
+
+    monkeypatch.setattr(standin, "aexecute", counting)
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_iterates_all_pages_and_stops_on_short_page(standin, standin_rath, counted) -> None:
+    """All items are yielded in order, and a short page ends the iteration."""
+    for i in range(24):
+        standin.add_release(f"live.arkitekt.app-{i}", flavours=0)
+    expected = [release["id"] for release in standin.all("Release")]
+
+    ids = [release.id async for release in aiter_releases(page_size=10, rath=standin_rath)]
+
+    assert ids == expected
+    assert [v["pagination"]["offset"] for v in counted] == [0, 10, 20]
+
+
+@pytest.mark.asyncio
+async def test_prefetches_the_next_page(standin, standin_rath, counted) -> None:
+    """The next page is requested before the caller has consumed the current one."""
+    iterator = aiter_flavours(page_size=2, rath=standin_rath)
+
+    await iterator.__anext__()
+    await asyncio.sleep(0)
+    assert len(counted) == 2
+
+    rest = [flavour async for flavour in iterator]
+    assert len(rest) == 2
+    assert len(counted) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_reassembles_concurrent_pages_in_order(standin, standin_rath) -> None:
+    """Pages fetched through a generated list function come back in order."""
+    for i in range(7):
+        standin.add_release(f"live.arkitekt.app-{i}", flavours=3)
+    expected = [flavour["id"] for flavour in standin.all("Flavour")]
+
+    flavours = await afetch_all(alist_flavours, page_size=4, concurrency=3, rath=standin_rath)
+
+    assert [flavour.id for flavour in flavours] == expected
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_bounds_parallelism() -> None:
+    """At most ``concurrency`` pages are in flight, and fetching stops after a short page."""
+    items = list(range(95))
+    in_flight = 0
+    peak = 0
+    offsets = []
+
+    async def alist(pagination: OffsetPaginationInput) -> List[int]:
+        nonlocal in_flight, peak
+        offsets.append(pagination.offset)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return items[pagination.offset : pagination.offset + pagination.limit]
+
+    result = await afetch_all(alist, page_size=10, concurrency=4)
+
+    assert result == items
+    assert peak == 4
+    assert max(offsets) < 130
+
+
+@pytest.mark.asyncio
+async def test_closing_the_pages_waits_for_cancelled_prefetches() -> None:
+    """Prefetches still in flight when the caller stops are cancelled and awaited."""
+    cancelled = []
+
+    async def afetch(offset: int, limit: int) -> List[int]:
+        try:
+            await asyncio.sleep(0 if offset == 0 else 10)
+        except asyncio.CancelledError:
+            cancelled.append(offset)
+            raise
+        return list(range(offset, offset + limit))
+
+    pages = apages(afetch, page_size=10, concurrency=3)
+    assert await pages.__anext__() == list(range(10))
+    await pages.aclose()
+
+    assert sorted(cancelled) == [10, 20]
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_list_operations_still_take_rath_positionally(standin, standin_rath) -> None:
+    """The filters and pagination of the list operations are keyword-only, after ``rath``."""
+    releases = await alist_releases(standin_rath)
+    paged = await alist_releases(standin_rath, pagination=OffsetPaginationInput(offset=0, limit=1))
+
+    assert [r.id for r in releases] == [r.id for r in paged] == [standin.all("Release")[0]["id"]]
@@ -0,0 +1,61 @@
+import pytest
+from graphql import OperationType
+from rath.links.auth import ComposedAuthLink
+from rath.links.split import SplitLink
+
+from kabinet.api.schema import aget_release, alist_releases
+from kabinet.links import PersistedQueryLink
+from kabinet.links.aiohttp import KabinetAIOHttpLink
+from kabinet.rath import KabinetLinkComposition, KabinetRath
+from kabinet.testing import StandInLink
+from kabinet.testing.server import StandInServer
+
+
+async def token_loader() -> str:
+    return "test"
+
+
+def build_rath(server: StandInServer) -> KabinetRath:
+    return KabinetRath(
+        link=KabinetLinkComposition(
+            auth=ComposedAuthLink(token_loader=token_loader, token_refresher=token_loader),
+            persisted=PersistedQueryLink(),
+            split=SplitLink(
+                left=KabinetAIOHttpLink(endpoint_url=server.url),
+                right=StandInLink(store=server.store),
+                split=lambda o: o.node.operation != OperationType.SUBSCRIPTION,
+            ),
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_registers_on_miss(standin) -> None:
+    """An unknown hash is answered with a miss and the full document is resent."""
+    release = standin.all("Release")[0]
+
+    async with StandInServer(store=standin) as server:
+        async with build_rath(server) as rath:
+            result = await aget_release(release["id"], rath=rath)
+
+    assert result.id == release["id"]
+    miss, register = server.requests
+    assert "query" not in miss
+    assert "query" in register
+    assert register["extensions"] == miss["extensions"]
+    assert len(server.persisted) == 1
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_sends_only_the_hash(standin) -> None:
+    """Known hashes are executed without the document being sent again."""
+    async with StandInServer(store=standin) as server:
+        async with build_rath(server) as rath:
+            await alist_releases(rath=rath)
+            registered = server.bytes_received
+            releases = await alist_releases(rath=rath)
+
+    assert len(releases) == 1
+    assert len(server.requests) == 3
+    assert "query" not in server.requests[-1]
+    assert server.bytes_received - registered < len(server.requests[1]["query"])
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from kabinet.api.schema import ListFlavoursQuery, alist_releases, asearch_releases
+from kabinet.documents import get_operation_name
+from kabinet.funcs import aexecute
+from kabinet.limits import Limit, RequestLimiter
+from kabinet.priority import Priority, request_priority
+from kabinet.rath import KabinetRath
+from kabinet.testing import StandInLink
+
+
+@pytest.fixture
+def order(standin, monkeypatch):
+    """The operation names sent to the stand-in, in the order they were sent."""
+    sent = []
+    aexecute = standin.aexecute
+
+    async def recording(document, variables=None, operation_name=None):
+        sent.append(get_operation_name(document))
+        await asyncio.sleep(0.01)
+        return await aexecute(document, variables, operation_name)
+
+    monkeypatch.setattr(standin, "aexecute", recording)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_interactive_operations_jump_the_queue(standin, order) -> None:
+    """Waiting searches are served before waiting bulk lists."""
+    limiter = RequestLimiter(query=Limit(max_concurrency=1))
+
+    async with KabinetRath(link=StandInLink(store=standin), limiter=limiter) as rath:
+        bulk = [asyncio.ensure_future(alist_releases(rath=rath)) for _ in range(3)]
+        await asyncio.sleep(0)
+        search = asyncio.ensure_future(asearch_releases(rath=rath))
+        await asyncio.gather(search, *bulk)
+
+    assert order == ["ListReleases", "SearchReleases", "ListReleases", "ListReleases"]
+    assert set(limiter.query.wait_by_priority) == {"INTERACTIVE", "BULK"}
+
+
+@pytest.mark.asyncio
+async def test_priority_per_call_and_scope(standin, order) -> None:
+    """A per call priority overrides the scope, which overrides the default."""
+    limiter = RequestLimiter(query=Limit(max_concurrency=1))
+
+    async with KabinetRath(link=StandInLink(store=standin), limiter=limiter) as rath:
+        with request_priority(Priority.INTERACTIVE):
+            first = asyncio.ensure_future(alist_releases(rath=rath))
+            await asyncio.sleep(0)
+            bulk = asyncio.ensure_future(
+                aexecute(ListFlavoursQuery, {}, rath=rath, priority=Priority.BULK)
+            )
+            scoped = asyncio.ensure_future(alist_releases(rath=rath))
+        await asyncio.gather(first, bulk, scoped)
+
+    assert order == ["ListReleases", "ListReleases", "ListFlavours"]
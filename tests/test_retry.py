@@ -0,0 +1,105 @@
+import pytest
+from rath.links.compose import compose
+
+from kabinet.api.schema import (
+    DeclareBackendMutation,
+    aget_release,
+)
+from kabinet.funcs import aexecute
+from kabinet.links import CircuitBreaker, CircuitOpenError, KabinetRetryLink, TransientLinkError
+from kabinet.rath import KabinetRath
+from kabinet.testing import StandInLink
+
+
+@pytest.fixture
+def failures(standin, monkeypatch):
+    """The number of upcoming requests to the stand-in that fail transiently."""
+    state = {"failing": 0, "sent": 0}
+    aexecute = standin.aexecute
+
+    async def flaky(document, variables=None, operation_name=None):
+        state["sent"] += 1
+        if state["failing"]:
+            state["failing"] -= 1
+            raise TransientLinkError("502 Bad Gateway")
+        return await aexecute(document, variables, operation_name)
+
+    monkeypatch.setattr(standin, "aexecute", flaky)
+    return state
+
+
+def build_rath(standin, retry: KabinetRetryLink) -> KabinetRath:
+    return KabinetRath(link=compose(retry, StandInLink(store=standin)))
+
+
+DECLARE_BACKEND = {"input": {"kind": "docker", "name": "docker"}}
+
+
+@pytest.mark.asyncio
+async def test_queries_are_retried(standin, failures) -> None:
+    """A query that fails transiently is retried until it succeeds."""
+    failures["failing"] = 2
+    retry = KabinetRetryLink(base_delay=0.001)
+    release = standin.all("Release")[0]
+
+    async with build_rath(standin, retry) as rath:
+        assert (await aget_release(release["id"], rath=rath)).id == release["id"]
+
+    assert failures["sent"] == 3
+    assert retry.retries == 2
+
+
+@pytest.mark.asyncio
+async def test_mutations_are_only_retried_when_idempotent(standin, failures) -> None:
+    """Mutations are retried only if they are marked as idempotent."""
+    retry = KabinetRetryLink(base_delay=0.001)
+
+    async with build_rath(standin, retry) as rath:
+        failures["failing"] = 1
+        with pytest.raises(TransientLinkError):
+            await aexecute(DeclareBackendMutation, DECLARE_BACKEND, rath=rath)
+
+        retry.idempotent_operations.add("DeclareBackend")
+        failures["failing"] = 1
+        await aexecute(DeclareBackendMutation, DECLARE_BACKEND, rath=rath)
+
+    assert failures["sent"] == 3
+
+
+@pytest.mark.asyncio
+async def test_mutations_can_be_marked_idempotent_per_call(standin, failures) -> None:
+    """A mutation executed with ``idempotent=True`` is retried without being listed."""
+    retry = KabinetRetryLink(base_delay=0.001)
+
+    async with build_rath(standin, retry) as rath:
+        failures["failing"] = 1
+        await aexecute(DeclareBackendMutation, DECLARE_BACKEND, rath=rath, idempotent=True)
+
+    assert failures["sent"] == 2
+    assert retry.retries == 1
+
+
+@pytest.mark.asyncio
+async def test_breaker_fails_fast_and_recovers(standin, failures) -> None:
+    """An open breaker rejects operations until a trial operation succeeds."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0)
+    retry = KabinetRetryLink(max_retries=0, breaker=breaker)
+    release = standin.all("Release")[0]
+
+    async with build_rath(standin, retry) as rath:
+        failures["failing"] = 2
+        for _ in range(2):
+            with pytest.raises(TransientLinkError):
+                await aget_release(release["id"], rath=rath)
+        assert breaker.state == "open"
+
+        breaker.reset_timeout = 60
+        with pytest.raises(CircuitOpenError):
+            await aget_release(release["id"], rath=rath)
+        assert failures["sent"] == 2
+
+        breaker.reset_timeout = 0
+        await aget_release(release["id"], rath=rath)
+        assert breaker.state == "closed"
+
+    assert (breaker.opened, breaker.rejected) == (1, 1)
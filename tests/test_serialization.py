@@ -0,0 +1,97 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+import websockets
+
+from kabinet.api.schema import WatchPodsSubscription, alist_releases
+from kabinet.links import KabinetGraphQLWSLink
+from kabinet.links.aiohttp import KabinetAIOHttpLink
+from kabinet.rath import KabinetRath
+from kabinet.serialization import OrjsonCodec, StdlibJSONCodec, default_json_codec, orjson
+from kabinet.testing.server import StandInServer
+
+requires_orjson = pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+
+CODECS = [StdlibJSONCodec(), pytest.param(OrjsonCodec(), marks=requires_orjson)]
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=["json", "orjson"])
+def test_codecs_encode_datetimes_alike(codec) -> None:
+    """Every codec encodes datetimes as ISO 8601 and decodes what the others encode."""
+    value = {"buildAt": datetime(2024, 5, 1, 12, 30, 1, 500), "tags": ["a", None, 1.5]}
+    encoded = codec.dumps(value)
+
+    assert json.loads(encoded) == {"buildAt": "2024-05-01T12:30:01.000500", "tags": ["a", None, 1.5]}
+    assert codec.loads(encoded) == codec.loads(encoded.decode()) == json.loads(encoded)
+
+
+@requires_orjson
+def test_prefers_orjson_when_installed() -> None:
+    """orjson is used by default if it is installed."""
+    assert default_json_codec().name == "orjson"
+
+
+class DecimalEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, Decimal):
+            return str(o)
+        return super().default(o)
+
+
+def test_aiohttp_link_honours_a_custom_encoder() -> None:
+    """A custom json_encoder of the aiohttp link is used even if orjson is installed."""
+    link = KabinetAIOHttpLink(endpoint_url="http://localhost/graphql", json_encoder=DecimalEncoder)
+
+    assert json.loads(link.codec.dumps({"price": Decimal("1.50")})) == {"price": "1.50"}
+    assert KabinetAIOHttpLink(endpoint_url="http://localhost/graphql").codec == default_json_codec()
+
+
+@requires_orjson
+@pytest.mark.asyncio
+async def test_links_give_the_same_results_with_every_codec(standin) -> None:
+    """The codec does not change the results of the aiohttp link."""
+    for i in range(10):
+        standin.add_release(f"live.arkitekt.app-{i}", flavours=2)
+
+    results = []
+    async with StandInServer(store=standin) as server:
+        for codec in (StdlibJSONCodec(), OrjsonCodec()):
+            link = KabinetAIOHttpLink(endpoint_url=server.url, json_codec=codec)
+            async with KabinetRath(link=link) as rath:
+                results.append(await alist_releases(rath=rath))
+
+    assert results[0] == results[1]
+
+
+@pytest.mark.asyncio
+async def test_graphql_ws_messages_use_the_codec() -> None:
+    """Subscriptions send their variables (including datetimes) and decode events with the codec."""
+    started = []
+
+    async def handler(websocket) -> None:
+        assert json.loads(await websocket.recv())["type"] == "connection_init"
+        await websocket.send(json.dumps({"type": "connection_ack"}))
+        start = json.loads(await websocket.recv())
+        started.append(start["payload"]["variables"])
+        for i in range(3):
+            event = {"data": {"pods": {"id": str(i)}}}
+            await websocket.send(json.dumps({"id": start["id"], "type": "data", "payload": event}))
+        await websocket.send(json.dumps({"id": start["id"], "type": "complete"}))
+        await websocket.wait_closed()
+
+    async with websockets.serve(handler, "127.0.0.1", 0, subprotocols=["graphql-ws"]) as server:
+        port = server.sockets[0].getsockname()[1]
+        link = KabinetGraphQLWSLink(ws_endpoint_url=f"ws://127.0.0.1:{port}")
+        async with KabinetRath(link=link) as rath:
+            since = datetime(2024, 5, 1)
+            events = [
+                result.data["pods"]["id"]
+                async for result in rath.asubscribe(
+                    WatchPodsSubscription.Meta.document, {"since": since}
+                )
+            ]
+
+    assert events == ["0", "1", "2"]
+    assert started == [{"since": "2024-05-01T00:00:00"}]
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+from graphql import OperationType
+from rath.links.auth import ComposedAuthLink
+from rath.links.split import SplitLink
+
+from kabinet.api.schema import PodStatus, alist_releases, aupdate_pod, awatch_pods
+from kabinet.links.aiohttp import KabinetAIOHttpLink
+from kabinet.links.graphql_ws import KabinetGraphQLWSLink
+from kabinet.rath import KabinetLinkComposition, KabinetRath
+from kabinet.testing.server import StandInServer
+
+
+async def token_loader() -> str:
+    return "test"
+
+
+@pytest.mark.asyncio
+async def test_serves_subscriptions_over_graphql_ws(standin) -> None:
+    """Subscriptions are served over graphql-ws next to the queries over HTTP."""
+    release = standin.all("Release")[0]
+    deployment = standin.createDeployment(None, {"flavour": release["flavours"][0]["id"], "localId": "d"})
+    pod = standin.createPod(None, {"deployment": deployment["id"], "localId": "p"})
+
+    async with StandInServer(store=standin) as server:
+        link = KabinetLinkComposition(
+            auth=ComposedAuthLink(token_loader=token_loader, token_refresher=token_loader),
+            split=SplitLink(
+                left=KabinetAIOHttpLink(endpoint_url=server.url),
+                right=KabinetGraphQLWSLink(ws_endpoint_url=server.ws_url),
+                split=lambda o: o.node.operation != OperationType.SUBSCRIPTION,
+            ),
+        )
+        async with KabinetRath(link=link) as rath:
+            events = awatch_pods(rath=rath)
+            first = asyncio.ensure_future(anext(events))
+            while not standin.listeners:
+                await asyncio.sleep(0.01)
+            await aupdate_pod(status=PodStatus.RUNNING, pod=pod["id"], rath=rath)
+            event = await asyncio.wait_for(first, 5)
+            await events.aclose()
+
+    assert (event.id, event.status, event.created) == (pod["id"], "RUNNING", False)
+    assert [request.get("type") for request in server.requests if "type" in request] == [
+        "connection_init",
+        "start",
+    ]
+
+
+def test_serves_from_a_thread(standin) -> None:
+    """As a regular context manager, the server runs on its own thread and loop."""
+
+    async def list_releases(url: str):
+        async with KabinetRath(link=KabinetAIOHttpLink(endpoint_url=url)) as rath:
+            return await alist_releases(rath=rath)
+
+    with StandInServer(store=standin) as server:
+        releases = asyncio.run(list_releases(server.url))
+
+    assert [release.id for release in releases] == [standin.all("Release")[0]["id"]]
+    assert server.bytes_sent > 0
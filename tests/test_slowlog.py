@@ -0,0 +1,84 @@
+import asyncio
+import logging
+
+import pytest
+from graphql import OperationType
+from rath.links.auth import ComposedAuthLink
+from rath.links.split import SplitLink
+
+from kabinet.api.schema import FlavourFilter, aget_release, alist_flavours
+from kabinet.documents import get_operation_name
+from kabinet.links import KabinetRetryLink, TransientLinkError
+from kabinet.rath import KabinetLinkComposition, KabinetRath
+from kabinet.slowlog import SlowOperationLog
+from kabinet.testing import StandInLink
+
+
+async def token_loader() -> str:
+    return "test"
+
+
+@pytest.fixture
+def slow_flavours(standin, monkeypatch):
+    """ListFlavours takes 150ms and fails transiently on its first attempt."""
+    state = {"failed": False}
+    aexecute = standin.aexecute
+
+    async def slow(document, variables=None, operation_name=None):
+        if get_operation_name(document) == "ListFlavours":
+            await asyncio.sleep(0.15)
+            if not state["failed"]:
+                state["failed"] = True
+                raise TransientLinkError("502 Bad Gateway")
+        return await aexecute(document, variables, operation_name)
+
+    monkeypatch.setattr(standin, "aexecute", slow)
+
+
+def build_rath(standin, slow_log: SlowOperationLog) -> KabinetRath:
+    return KabinetRath(
+        link=KabinetLinkComposition(
+            retry=KabinetRetryLink(base_delay=0.001),
+            auth=ComposedAuthLink(token_loader=token_loader, token_refresher=token_loader),
+            split=SplitLink(
+                left=StandInLink(store=standin),
+                right=StandInLink(store=standin),
+                split=lambda o: o.node.operation != OperationType.SUBSCRIPTION,
+            ),
+        ),
+        slow_log=slow_log,
+    )
+
+
+@pytest.mark.asyncio
+async def test_logs_slow_operations_with_their_context(standin, slow_flavours, caplog) -> None:
+    """Slow operations are logged with variables, retries and phases, fast ones are not."""
+    slow_log = SlowOperationLog(threshold=0.25, max_variables_length=30)
+    caplog.set_level(logging.WARNING, logger="kabinet.slow")
+
+    async with build_rath(standin, slow_log) as rath:
+        await aget_release(standin.all("Release")[0]["id"], rath=rath)
+        await alist_flavours(filters=FlavourFilter(search="a" * 100), rath=rath)
+
+    (entry,) = slow_log.entries
+    assert entry.operation == "ListFlavours"
+    assert entry.latency >= 0.3
+    assert entry.retries == 1
+    assert entry.variables.startswith('{"filters":{"search":"aaa')
+    assert entry.variables.endswith("(125 characters)")
+    assert entry.response_bytes == 0
+    assert set(entry.phases) == {"ListFlavours", "shrinking", "dicting", "retry", "auth", "split", "parse"}
+    assert max(entry.phases, key=entry.phases.__getitem__) == "split"
+    assert caplog.messages == [f"Slow operation: {entry.describe()}"]
+
+
+@pytest.mark.asyncio
+async def test_thresholds_per_operation(standin, slow_flavours) -> None:
+    """An operation specific threshold overrides the default one."""
+    slow_log = SlowOperationLog(threshold=0, thresholds={"ListFlavours": 1, "GetRelease": 1})
+
+    async with build_rath(standin, slow_log) as rath:
+        await aget_release(standin.all("Release")[0]["id"], rath=rath)
+        await alist_flavours(rath=rath)
+
+    assert slow_log.logged == 0
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from kabinet.api.schema import ListReleasesQuery, alist_releases
+from kabinet.jsonstream import ArrayItemDecoder, StreamDecodeError
+from kabinet.links.aiohttp import KabinetAIOHttpLink
+from kabinet.rath import KabinetRath
+from kabinet.streaming import astream_releases
+from kabinet.testing.server import StandInServer
+
+
+def test_decoder_handles_any_chunk_boundary() -> None:
+    """Items are decoded no matter where the chunks are split, and errors are kept."""
+    response = {
+        "errors": [{"message": 'a "quoted" ] message'}],
+        "data": {
+            "other": [{"releases": [1]}],
+            "releases": [{"id": "1", "tricky": "}]\\\"{"}, {"id": "2", "nested": [[1], {"a": []}]}],
+        },
+    }
+    raw = json.dumps(response, indent=1).encode()
+
+    for size in range(1, 12):
+        decoder = ArrayItemDecoder(("data", "releases"))
+        items = [item for i in range(0, len(raw), size) for item in decoder.feed(raw[i : i + size])]
+        decoder.close()
+
+        assert items == response["data"]["releases"]
+        assert decoder.errors == response["errors"]
+
+
+def test_decoder_rejects_truncated_responses() -> None:
+    """A response that ends in the middle of the document is an error."""
+    decoder = ArrayItemDecoder(("data", "releases"))
+    decoder.feed(b'{"data": {"releases": [{"id": "1"}')
+
+    with pytest.raises(StreamDecodeError):
+        decoder.close()
+
+
+@pytest.mark.asyncio
+async def test_streams_items_while_receiving(standin) -> None:
+    """The http link yields the items of a large response in several batches."""
+    for i in range(40):
+        standin.add_release(f"live.arkitekt.app-{i}", flavours=2)
+
+    async with StandInServer(store=standin) as server:
+        link = KabinetAIOHttpLink(endpoint_url=server.url, stream_chunk_size=1024)
+        async with KabinetRath(link=link) as rath:
+            streamed = [release async for release in astream_releases(rath=rath)]
+            listed = await alist_releases(rath=rath)
+            batches = [
+                result
+                async for result in rath.asubscribe(
+                    ListReleasesQuery.Meta.document, {}, stream_field="releases"
+                )
+            ]
+
+    assert tuple(streamed) == listed
+    assert len(batches) > 10
+
+
+@pytest.mark.asyncio
+async def test_streaming_falls_back_to_whole_responses(standin, standin_rath) -> None:
+    """Links that cannot stream still yield the items one by one."""
+    streamed = [release async for release in astream_releases(rath=standin_rath)]
+
+    assert tuple(streamed) == await alist_releases(rath=standin_rath)
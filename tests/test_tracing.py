@@ -0,0 +1,77 @@
+from datetime import datetime
+
+import pytest
+from graphql import OperationType
+from rath.links.auth import ComposedAuthLink
+from rath.links.split import SplitLink
+
+from kabinet.api.schema import (
+    DockerImageInput,
+    InspectionInput,
+    ManifestInput,
+    SelectorInput,
+    acreate_app_image,
+    aget_release,
+)
+from kabinet.rath import KabinetLinkComposition, KabinetRath
+from kabinet.testing import StandInLink
+from kabinet.tracing import InMemoryTracer, current_span
+
+
+async def token_loader() -> str:
+    return "test"
+
+
+def build_rath(standin, tracer: InMemoryTracer) -> KabinetRath:
+    return KabinetRath(
+        link=KabinetLinkComposition(
+            auth=ComposedAuthLink(token_loader=token_loader, token_refresher=token_loader),
+            split=SplitLink(
+                left=StandInLink(store=standin),
+                right=StandInLink(store=standin),
+                split=lambda o: o.node.operation != OperationType.SUBSCRIPTION,
+            ),
+        ),
+        tracer=tracer,
+    )
+
+
+@pytest.mark.asyncio
+async def test_breaks_an_operation_down_into_link_phases(standin) -> None:
+    """Every link of the composition and the parsing of the result get their own span."""
+    tracer = InMemoryTracer()
+
+    async with build_rath(standin, tracer) as rath:
+        release = await acreate_app_image(
+            manifest=ManifestInput(identifier="live.arkitekt.traced", version="0.1.0"),
+            selectors=[SelectorInput(kind="cpu", frequency=2000)],
+            app_image_id="traced",
+            inspection=InspectionInput(implementations=(), requirements=(), states=(), locks=()),
+            image=DockerImageInput(image_string="arkitekt/traced:latest", build_at=datetime.now()),
+            rath=rath,
+        )
+
+    assert release.version == "0.1.0"
+    (root,) = tracer.roots
+    breakdown = tracer.breakdown(root)
+    assert list(breakdown) == ["CreateAppImage", "parse", "shrinking", "dicting", "auth", "split"]
+    assert sum(breakdown.values()) == pytest.approx(root.duration)
+
+    shrinking = next(span for span in tracer.spans if span.name == "shrinking")
+    assert shrinking.parent is root
+    assert shrinking.attributes == {"link": "ShrinkingLink", "operation": "CreateAppImage"}
+    assert current_span.get() is None
+
+
+@pytest.mark.asyncio
+async def test_spans_record_errors(standin) -> None:
+    """A failing operation marks its spans with the error."""
+    tracer = InMemoryTracer()
+
+    async with build_rath(standin, tracer) as rath:
+        with pytest.raises(Exception) as error:
+            await aget_release("missing", rath=rath)
+
+    (root,) = tracer.roots
+    assert root.error == type(error.value).__name__
+    assert {span.name for span in tracer.spans if span.error} >= {"GetRelease", "split"}
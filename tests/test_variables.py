@@ -0,0 +1,58 @@
+import pytest
+
+from kabinet.api.schema import (
+    ContainerType,
+    EnvironmentInput,
+    FlavourFilter,
+    ListFlavoursQuery,
+    alist_flavours,
+    amatch_flavour,
+)
+from kabinet.variables import VariableCache, variable_cache
+
+
+@pytest.mark.asyncio
+async def test_repeated_calls_reuse_the_serialized_variables(standin, standin_rath) -> None:
+    """Calls with the same frozen inputs skip validating and dumping them again."""
+    environment = EnvironmentInput(containerType=ContainerType.DOCKER)
+    filters = FlavourFilter(search="flavour")
+    variable_cache.clear()
+    hits = variable_cache.hits
+
+    first = await amatch_flavour(environment=environment, rath=standin_rath)
+    for _ in range(3):
+        assert await amatch_flavour(environment=environment, rath=standin_rath) == first
+        await alist_flavours(filters=filters, rath=standin_rath)
+
+    assert variable_cache.hits - hits == 5
+    assert len(variable_cache) == 2
+
+
+def test_inputs_are_keyed_by_identity_and_explicitly_set_fields() -> None:
+    """Equal inputs that dump differently never share a payload."""
+    cache = VariableCache()
+    unset = FlavourFilter(search="x")
+    explicit = FlavourFilter(search="x", ids=None)
+    assert unset == explicit
+
+    assert cache.serialize(ListFlavoursQuery, {"filters": unset}) == {"filters": {"search": "x"}}
+    assert cache.serialize(ListFlavoursQuery, {"filters": explicit}) == {
+        "filters": {"search": "x", "ids": None}
+    }
+    assert cache.serialize(ListFlavoursQuery, {"filters": unset}) == {"filters": {"search": "x"}}
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_raw_dicts_and_evicted_entries_are_serialized_again() -> None:
+    """Unhashable variables bypass the cache, which is bounded."""
+    cache = VariableCache(maxsize=1)
+    assert cache.serialize(ListFlavoursQuery, {"filters": {"search": "x"}}) == {
+        "filters": {"search": "x"}
+    }
+    assert len(cache) == 0
+
+    first, second = FlavourFilter(search="a"), FlavourFilter(search="b")
+    cache.serialize(ListFlavoursQuery, {"filters": first})
+    cache.serialize(ListFlavoursQuery, {"filters": second})
+    cache.serialize(ListFlavoursQuery, {"filters": first})
+    assert (cache.hits, cache.misses, len(cache)) == (0, 3, 1)